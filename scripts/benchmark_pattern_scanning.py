@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Pattern Scanning Benchmark
+
+Compares EnhancedCodeValidator's literal-prefix PatternScanner with the
+previous approach of one re.finditer/re.search pass per pattern, on the
+Markdown documents of the repository, and checks that both find exactly
+the same code references, business rules, technical specifications and
+integration points.
+
+Usage:
+    python scripts/benchmark_pattern_scanning.py [paths...] [--repeat N]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Dict, List
+
+from enhanced_code_validation import EnhancedCodeValidator
+
+DEFAULT_PATHS = ['docs/', 'new-project-assets/']
+
+def collect_documents(paths: List[str]) -> List[str]:
+    """Read every Markdown document the --directory mode would validate"""
+    documents = []
+    for path in paths:
+        for root, dirs, files in os.walk(path):
+            for file in files:
+                file_path = os.path.join(root, file)
+                if not file.endswith('.md') or 'validation-reports' in file_path:
+                    continue
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        documents.append(f.read())
+                except (OSError, UnicodeDecodeError):
+                    continue
+    return documents
+
+def legacy_findings(content: str) -> Dict[str, List[str]]:
+    """Findings of the per-pattern loops EnhancedCodeValidator used before"""
+    findings = {
+        'code_indicators': [],
+        'business_rules': [],
+        'technical_specs': [],
+        'integration_points': []
+    }
+
+    for pattern in EnhancedCodeValidator.CODE_INDICATOR_PATTERNS:
+        for match in re.finditer(pattern, content, re.IGNORECASE):
+            findings['code_indicators'].append(f"Found: '{match.group()}' at position {match.start()}")
+
+    for rule_type, patterns in EnhancedCodeValidator.BUSINESS_RULE_PATTERNS.items():
+        for pattern in patterns:
+            if re.search(pattern, content, re.IGNORECASE):
+                findings['business_rules'].append(f"{rule_type}: {pattern}")
+
+    for spec_type, patterns in EnhancedCodeValidator.TECHNICAL_SPEC_PATTERNS.items():
+        for pattern in patterns:
+            if re.search(pattern, content, re.IGNORECASE):
+                findings['technical_specs'].append(f"{spec_type}: {pattern}")
+
+    for pattern in EnhancedCodeValidator.INTEGRATION_PATTERNS:
+        for match in re.finditer(pattern, content, re.IGNORECASE):
+            findings['integration_points'].append(match.group())
+
+    return findings
+
+def scanner_findings(validator: EnhancedCodeValidator, content: str) -> Dict[str, List[str]]:
+    """The same findings, produced from a single PatternScanner scan"""
+    hits = validator.scan_patterns(content)
+    return {
+        'code_indicators': validator.scan_for_code_references(content, hits)[1],
+        'business_rules': [f"{rule.category}: {rule.pattern}" for rule, matches in hits['business_rules'] if matches],
+        'technical_specs': [f"{rule.category}: {rule.pattern}" for rule, matches in hits['technical_specs'] if matches],
+        'integration_points': [match.group() for rule, matches in hits['integration_points'] for match in matches]
+    }
+
+def best_time(function, documents: List[str], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in documents:
+            function(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark EnhancedCodeValidator pattern scanning')
+    parser.add_argument('paths', nargs='*', default=DEFAULT_PATHS,
+                        help=f"Paths to scan for Markdown files (default: {' '.join(DEFAULT_PATHS)})")
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions, best is reported (default: 3)')
+    args = parser.parse_args()
+
+    documents = collect_documents([path for path in args.paths if os.path.exists(path)])
+    if not documents:
+        print("No Markdown documents found", file=sys.stderr)
+        return 1
+
+    validator = EnhancedCodeValidator()
+    total_chars = sum(len(content) for content in documents)
+    print(f"Documents: {len(documents)} ({total_chars / 1024 / 1024:.1f} MiB)")
+
+    legacy_time = best_time(legacy_findings, documents, args.repeat)
+    print(f"Per-pattern passes: {legacy_time * 1000:8.1f} ms")
+
+    scanner_time = best_time(lambda content: scanner_findings(validator, content), documents, args.repeat)
+    print(f"PatternScanner:     {scanner_time * 1000:8.1f} ms")
+    print(f"Speedup: {legacy_time / scanner_time:.1f}x")
+
+    mismatches = sum(1 for content in documents if legacy_findings(content) != scanner_findings(validator, content))
+    print(f"Documents with different findings: {mismatches}")
+    return 0 if mismatches == 0 else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+YAML Loader Benchmark
+
+Compares PyYAML's pure-Python SafeLoader with the libyaml-backed CSafeLoader
+on the real front-matter blocks of the repository, and checks that both
+loaders produce identical data.
+
+Usage:
+    python scripts/benchmark_yaml_loaders.py [paths...] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+import yaml
+
+from frontmatter_extractor import read_frontmatter_lines
+
+DEFAULT_PATHS = ['docs/', 'new-project-assets/', 'standards/']
+
+def collect_frontmatter_blocks(paths: List[str]) -> List[str]:
+    """Collect the raw front-matter text of every Markdown file under paths."""
+    blocks = []
+    for path in paths:
+        for root, dirs, files in os.walk(path):
+            for file in files:
+                if not file.endswith('.md'):
+                    continue
+                try:
+                    yaml_lines, problem = read_frontmatter_lines(os.path.join(root, file))
+                except (OSError, UnicodeDecodeError):
+                    continue
+                if yaml_lines is not None:
+                    blocks.append('\n'.join(yaml_lines))
+    return blocks
+
+def time_loader(loader: type, blocks: List[str], repeat: int) -> float:
+    """Return the best wall time of parsing every block once."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for block in blocks:
+            try:
+                yaml.load(block, Loader=loader)
+            except yaml.YAMLError:
+                pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def load_or_error(block: str, loader: type):
+    try:
+        return yaml.load(block, Loader=loader)
+    except yaml.YAMLError:
+        return yaml.YAMLError
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark YAML loaders on real front-matter blocks')
+    parser.add_argument('paths', nargs='*', default=DEFAULT_PATHS,
+                        help=f"Paths to scan for Markdown files (default: {' '.join(DEFAULT_PATHS)})")
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions, best is reported (default: 5)')
+    args = parser.parse_args()
+
+    blocks = collect_frontmatter_blocks([path for path in args.paths if os.path.exists(path)])
+    if not blocks:
+        print("No front-matter blocks found", file=sys.stderr)
+        return 1
+
+    total_bytes = sum(len(block.encode('utf-8')) for block in blocks)
+    print(f"Front-matter blocks: {len(blocks)} ({total_bytes / 1024:.1f} KiB)")
+
+    python_time = time_loader(yaml.SafeLoader, blocks, args.repeat)
+    print(f"pure-python SafeLoader: {python_time * 1000:8.1f} ms")
+
+    c_loader = getattr(yaml, 'CSafeLoader', None)
+    if c_loader is None:
+        print("libyaml CSafeLoader:    not available (PyYAML built without libyaml)")
+        return 0
+
+    c_time = time_loader(c_loader, blocks, args.repeat)
+    print(f"libyaml CSafeLoader:    {c_time * 1000:8.1f} ms")
+    print(f"Speedup: {python_time / c_time:.1f}x")
+
+    mismatches = sum(1 for block in blocks
+                     if load_or_error(block, yaml.SafeLoader) != load_or_error(block, c_loader))
+    print(f"Blocks parsed differently: {mismatches}")
+    return 0 if mismatches == 0 else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,12 @@
 import os
-import yaml
 import sys
 
+import yaml_loader
+from frontmatter_extractor import read_frontmatter_lines
+
 def load_required_fields(yaml_path):
     with open(yaml_path, 'r') as f:
-        data = yaml.safe_load(f)
+        data = yaml_loader.safe_load(f)
     # Support both list or dict format in YAML
     if isinstance(data, dict):
         return list(data.keys())
@@ -14,21 +16,16 @@ def load_required_fields(yaml_path):
         raise ValueError("YAML format must be a list or dictionary.")
 
 def extract_frontmatter(md_file_path):
-    with open(md_file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    frontmatter_lines, problem = read_frontmatter_lines(md_file_path)
+    return parse_frontmatter(md_file_path, frontmatter_lines)
 
-    if lines[0].strip() != '---':
+def parse_frontmatter(md_file_path, frontmatter_lines):
+    if frontmatter_lines is None:
         return None  # No YAML frontmatter
 
-    frontmatter_lines = []
-    for line in lines[1:]:
-        if line.strip() == '---':
-            break
-        frontmatter_lines.append(line)
-
     try:
-        return yaml.safe_load(''.join(frontmatter_lines)) or {}
-    except yaml.YAMLError as e:
+        return yaml_loader.safe_load('\n'.join(frontmatter_lines)) or {}
+    except yaml_loader.YAMLError as e:
         print(f"YAML parse error in file: {md_file_path}")
         return {}
 
@@ -43,16 +40,17 @@ def check_metadata(yaml_path, folder_path):
     missing_report = {}
 
     for md_file in find_md_files(folder_path):
-        metadata = extract_frontmatter(md_file)
-        if metadata is None:
-            missing_report[md_file] = required_fields
-        else:
-            missing = [field for field in required_fields if field not in metadata]
-            if missing:
-                missing_report[md_file] = missing
+        missing = find_missing_fields(extract_frontmatter(md_file), required_fields)
+        if missing:
+            missing_report[md_file] = missing
 
     return missing_report
 
+def find_missing_fields(metadata, required_fields):
+    if metadata is None:
+        return required_fields
+    return [field for field in required_fields if field not in metadata]
+
 if __name__ == "__main__":
     if len(sys.argv) != 3:
         print("Usage: python check_metadata_fields.py <required_fields.yml> <folder_path>")
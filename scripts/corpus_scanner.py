@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Unified Corpus Scanner
+
+Walks a documentation tree once, reads every Markdown file exactly once and
+builds a shared document model (front matter, body, links, headings, code
+fences). Pluggable checks consume that model, so a full quality gate no
+longer reads the corpus once per validation script.
+
+Available checks:
+    frontmatter         Full YAML front-matter validation (validate_yaml_frontmatter.py)
+    frontmatter-simple  Dependency-free front-matter validation (validate_yaml_simple.py)
+    required-fields     Required metadata fields from a YAML list (check_yaml.py)
+    links               Internal Markdown link validation (validate_links.py)
+    code-references     Code reference detection (enhanced_code_validation.py)
+
+Usage:
+    python scripts/corpus_scanner.py --path docs/ --checks frontmatter,links
+    python scripts/corpus_scanner.py --path docs/ --checks all --report-dir reports/
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from frontmatter_extractor import split_frontmatter
+from validate_links import LinkRecord, LinkResults, LinkValidator, scan_headings
+
+# Extracts links for the document model; holds no per-run state
+_link_extractor = LinkValidator()
+
+class CorpusDocument:
+    """A Markdown file read once, with lazily derived views shared by all checks."""
+
+    def __init__(self, path: str, text: Optional[str] = None, read_error: Optional[str] = None):
+        self.path = path
+        self.text = text
+        self.read_error = read_error
+        self._lines = None
+        self._frontmatter_block = None
+        self._headings = None
+        self._explicit_ids = None
+        self._code_fences = None
+        self._links = None
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.text.split('\n')
+        return self._lines
+
+    @property
+    def frontmatter_block(self) -> Tuple[Optional[List[str]], Optional[str]]:
+        """Front-matter lines and extraction problem, as from split_frontmatter."""
+        if self._frontmatter_block is None:
+            self._frontmatter_block = split_frontmatter(self.lines)
+        return self._frontmatter_block
+
+    @property
+    def body(self) -> str:
+        """Document text after the front-matter block."""
+        yaml_lines, problem = self.frontmatter_block
+        if yaml_lines is None:
+            return self.text
+        return '\n'.join(self.lines[len(yaml_lines) + 2:])
+
+    def _scan_headings(self):
+        self._headings, self._explicit_ids, self._code_fences = scan_headings(self.text)
+
+    @property
+    def headings(self) -> List[Tuple[int, str, int]]:
+        """ATX and setext headings outside code fences as (level, text, line number)."""
+        if self._headings is None:
+            self._scan_headings()
+        return self._headings
+
+    @property
+    def explicit_ids(self) -> Set[str]:
+        """Ids set by attr lists and raw HTML id/name attributes."""
+        if self._explicit_ids is None:
+            self._scan_headings()
+        return self._explicit_ids
+
+    @property
+    def code_fences(self) -> List[Tuple[int, int, str]]:
+        """Fenced code blocks as (opening line, closing line, info string)."""
+        if self._code_fences is None:
+            self._scan_headings()
+        return self._code_fences
+
+    @property
+    def links(self) -> List[LinkRecord]:
+        """Markdown links in the format produced by LinkValidator.extract_links."""
+        if self._links is None:
+            self._links = _link_extractor.extract_links_from_content(Path(self.path), self.text)
+        return self._links
+
+class CorpusCheck:
+    """Base class for checks fed by CorpusScanner."""
+
+    name = ''
+    report_extension = 'md'
+
+    def __init__(self, options: argparse.Namespace):
+        self.options = options
+
+    def check_document(self, document: CorpusDocument):
+        raise NotImplementedError
+
+    def report(self) -> str:
+        raise NotImplementedError
+
+    def failed(self) -> bool:
+        return False
+
+class FrontmatterCheck(CorpusCheck):
+    name = 'frontmatter'
+
+    def __init__(self, options: argparse.Namespace):
+        super().__init__(options)
+        from validate_yaml_frontmatter import DocumentType, ValidationLevel, ValidationResult, YAMLFrontmatterValidator
+        self._document_type = DocumentType
+        self._level = ValidationLevel
+        self._result_class = ValidationResult
+        self.validator = YAMLFrontmatterValidator()
+        self.report_extension = {'json': 'json', 'csv': 'csv'}.get(options.output, 'txt')
+
+    def check_document(self, document: CorpusDocument):
+        if document.read_error is not None:
+            result = self._result_class(document.path, False, self._document_type.GENERAL)
+            result.add_issue(self._level.ERROR, 'file', f"Error reading file: {document.read_error}")
+        else:
+            result = self.validator.validate_header(document.path, *document.frontmatter_block)
+        self.validator.results.append(result)
+
+    def report(self) -> str:
+        return self.validator.generate_report(self.options.output)
+
+    def failed(self) -> bool:
+        return any(issue.level == self._level.ERROR
+                   for result in self.validator.results for issue in result.issues)
+
+class SimpleFrontmatterCheck(CorpusCheck):
+    name = 'frontmatter-simple'
+    report_extension = 'txt'
+
+    def __init__(self, options: argparse.Namespace):
+        super().__init__(options)
+        import validate_yaml_simple
+        self._simple = validate_yaml_simple
+        self.results = []
+
+    def check_document(self, document: CorpusDocument):
+        if document.read_error is not None:
+            self.results.append({
+                'file': document.path,
+                'status': 'error',
+                'issues': [f"Error reading file: {document.read_error}"]
+            })
+        else:
+            self.results.append(self._simple.validate_header_simple(document.path, *document.frontmatter_block))
+
+    def report(self) -> str:
+        return self._simple.generate_report(self.results)
+
+    def failed(self) -> bool:
+        # Same files the report lists as non-compliant, including read errors
+        return any(result['status'] != 'compliant' for result in self.results)
+
+class RequiredFieldsCheck(CorpusCheck):
+    name = 'required-fields'
+    report_extension = 'txt'
+
+    def __init__(self, options: argparse.Namespace):
+        super().__init__(options)
+        import check_yaml
+        self._check_yaml = check_yaml
+        self.required_fields = check_yaml.load_required_fields(options.required_fields)
+        self.missing_report: Dict[str, List[str]] = {}
+
+    def check_document(self, document: CorpusDocument):
+        if document.read_error is not None:
+            metadata = None
+        else:
+            metadata = self._check_yaml.parse_frontmatter(document.path, document.frontmatter_block[0])
+        missing = self._check_yaml.find_missing_fields(metadata, self.required_fields)
+        if missing:
+            self.missing_report[document.path] = missing
+
+    def report(self) -> str:
+        if not self.missing_report:
+            return "✅ All Markdown files have the required metadata fields."
+        lines = ["❌ Missing metadata fields:"]
+        for path, fields in self.missing_report.items():
+            lines.append(f"- {path} is missing: {', '.join(fields)}")
+        return '\n'.join(lines)
+
+    def failed(self) -> bool:
+        return bool(self.missing_report)
+
+class LinksCheck(CorpusCheck):
+    name = 'links'
+
+    def __init__(self, options: argparse.Namespace):
+        super().__init__(options)
+        self.validator = LinkValidator(options.path, snapshot=True)
+        # The report lists every broken link but only counts valid and external ones
+        self.results = LinkResults(counted_only=('valid', 'external'))
+
+    def check_document(self, document: CorpusDocument):
+        if document.read_error is not None:
+            print(f"Error reading {document.path}: {document.read_error}")
+            return
+        self.validator.anchors.add_headings(document.path, document.headings, document.explicit_ids)
+        for link in document.links:
+            self.results.add(self.validator.validate_link(link), link)
+
+    def report(self) -> str:
+        return self.validator.generate_report(self.results)
+
+    def failed(self) -> bool:
+        return bool(self.results.counts['broken'])
+
+class CodeReferencesCheck(CorpusCheck):
+    name = 'code-references'
+
+    def __init__(self, options: argparse.Namespace):
+        super().__init__(options)
+        from enhanced_code_validation import EnhancedCodeValidator
+        self.validator = EnhancedCodeValidator()
+        self.results = []
+
+    def check_document(self, document: CorpusDocument):
+        # Validation reports are outputs of this check, not inputs
+        if 'validation-reports' in document.path or document.read_error is not None:
+            return
+        self.results.append(self.validator.validate_content(document.path, document.text))
+
+    def report(self) -> str:
+        if not self.results:
+            return "# Enhanced Code Validation Report\n\nNo documents analyzed."
+        return self.validator.generate_report(self.results)
+
+AVAILABLE_CHECKS = {
+    check.name: check
+    for check in (FrontmatterCheck, SimpleFrontmatterCheck, RequiredFieldsCheck, LinksCheck, CodeReferencesCheck)
+}
+
+class CorpusScanner:
+    """Walks a tree once and feeds every Markdown document to a set of checks."""
+
+    def __init__(self, root: str, checks: List[CorpusCheck]):
+        self.root = root
+        self.checks = checks
+
+    def iter_documents(self):
+        for dirpath, dirs, files in os.walk(self.root):
+            for file in files:
+                if not file.endswith('.md'):
+                    continue
+                file_path = os.path.join(dirpath, file)
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        yield CorpusDocument(file_path, f.read())
+                except Exception as e:
+                    yield CorpusDocument(file_path, read_error=str(e))
+
+    def scan(self) -> int:
+        """Run every check over every document; returns the number of documents."""
+        count = 0
+        for document in self.iter_documents():
+            count += 1
+            for check in self.checks:
+                check.check_document(document)
+        return count
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run several corpus checks in a single pass over the documentation',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Available checks: " + ', '.join(AVAILABLE_CHECKS)
+    )
+    parser.add_argument('--path', default='docs/', help='Path to scan for Markdown files (default: docs/)')
+    parser.add_argument('--checks', default='frontmatter,links',
+                        help="Comma-separated checks to run, or 'all' (default: frontmatter,links)")
+    parser.add_argument('--output', choices=['text', 'json', 'csv'], default='text',
+                        help='Front-matter report format (default: text)')
+    parser.add_argument('--required-fields', metavar='PATH',
+                        help='YAML list of fields for the required-fields check (enables that check)')
+    parser.add_argument('--report-dir', help='Write one report file per check into this directory instead of stdout')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"Error: Path '{args.path}' does not exist", file=sys.stderr)
+        return 1
+
+    if args.checks == 'all':
+        names = [name for name in AVAILABLE_CHECKS if name != 'required-fields' or args.required_fields]
+    else:
+        names = [name.strip() for name in args.checks.split(',') if name.strip()]
+    unknown = [name for name in names if name not in AVAILABLE_CHECKS]
+    if unknown or not names:
+        print(f"Error: Unknown checks: {', '.join(unknown) or '(none given)'}", file=sys.stderr)
+        return 1
+    if 'required-fields' in names and not args.required_fields:
+        print("Error: The required-fields check needs --required-fields PATH", file=sys.stderr)
+        return 1
+
+    try:
+        checks = [AVAILABLE_CHECKS[name](args) for name in names]
+    except Exception as e:
+        print(f"Error: Could not set up checks: {e}", file=sys.stderr)
+        return 1
+    scanner = CorpusScanner(args.path, checks)
+    count = scanner.scan()
+    print(f"Scanned {count} Markdown files with: {', '.join(names)}", file=sys.stderr)
+
+    for check in checks:
+        report = check.report()
+        if args.report_dir:
+            os.makedirs(args.report_dir, exist_ok=True)
+            report_path = os.path.join(args.report_dir, f"{check.name}-report.{check.report_extension}")
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write(report)
+            print(f"{check.name}: {'FAILED' if check.failed() else 'passed'} (report: {report_path})", file=sys.stderr)
+        else:
+            print(report)
+            print()
+
+    return 1 if any(check.failed() for check in checks) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
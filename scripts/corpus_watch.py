@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Continuous Front-matter and Link Validation
+
+Watches a documentation tree and revalidates only the Markdown files touched
+by each change, printing new and resolved issues as soon as a file is saved.
+Front-matter results, extracted links and a reverse link index (target ->
+linking documents) are kept in memory, so creating, deleting or renaming a
+document also rechecks the links pointing at it without rescanning the tree.
+
+Uses Linux inotify (through ctypes, no extra dependencies) and falls back to
+polling file modification times on other platforms.
+
+Usage:
+    python scripts/corpus_watch.py [--path PATH] [--checks frontmatter,links] [--poll]
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from validate_links import LinkRecord, LinkValidator
+
+# Events arriving within this window after the first one are handled as one batch
+DEBOUNCE_SECONDS = 0.02
+
+POLL_INTERVAL_SECONDS = 0.5
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+def find_markdown_files(root: str) -> List[str]:
+    """List Markdown files under root in os.walk order."""
+    file_paths = []
+    for dirpath, dirs, files in os.walk(root):
+        for file in files:
+            if file.endswith('.md'):
+                file_paths.append(os.path.join(dirpath, file))
+    return file_paths
+
+class InotifyWatcher:
+    """Recursive directory watcher backed by Linux inotify."""
+
+    def __init__(self, root: str):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError("inotify is not available on this platform")
+
+        self.fd = self._libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.root = root
+        self._directories: Dict[int, str] = {}
+        self._add_tree(root)
+
+    def _add_watch(self, directory: str):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._directories[wd] = directory
+
+    def _add_tree(self, directory: str) -> List[str]:
+        """Watch directory and its subdirectories, returning the Markdown files inside."""
+        markdown_files = []
+        for dirpath, dirs, files in os.walk(directory):
+            self._add_watch(dirpath)
+            markdown_files.extend(os.path.join(dirpath, f) for f in files if f.endswith('.md'))
+        return markdown_files
+
+    def wait_for_changes(self) -> Optional[Set[str]]:
+        """Block until Markdown files change and return their paths.
+
+        Returns None when the kernel event queue overflowed and a full
+        rescan is needed.
+        """
+        changed: Set[str] = set()
+        overflow = False
+        timeout = None
+
+        while True:
+            readable, _, _ = select.select([self.fd], [], [], timeout)
+            if not readable:
+                break
+            data = os.read(self.fd, 64 * 1024)
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, name_length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + name_length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+                offset += name_length
+
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                if mask & IN_IGNORED:
+                    self._directories.pop(wd, None)
+                    continue
+
+                directory = self._directories.get(wd)
+                if directory is None or not name:
+                    continue
+                path = os.path.join(directory, name)
+
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO) and os.path.isdir(path):
+                        # New directories may already contain files by the time we watch them
+                        changed.update(self._add_tree(path))
+                    elif mask & IN_MOVED_FROM:
+                        # Anything under a moved-away directory is gone; let the caller rescan
+                        overflow = True
+                elif name.endswith('.md'):
+                    changed.add(path)
+
+            # Keep collecting briefly so one save produces one batch
+            timeout = DEBOUNCE_SECONDS
+
+        return None if overflow else changed
+
+class PollingWatcher:
+    """Portable watcher comparing file modification times at an interval."""
+
+    def __init__(self, root: str, interval: float = POLL_INTERVAL_SECONDS):
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for file_path in find_markdown_files(self.root):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait_for_changes(self) -> Set[str]:
+        """Block until Markdown files change and return their paths."""
+        while True:
+            time.sleep(self.interval)
+            snapshot = self._take_snapshot()
+            changed = {
+                path for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+
+def create_watcher(root: str, force_polling: bool = False):
+    """Return an inotify watcher when possible, otherwise a polling watcher."""
+    if not force_polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root)
+
+class CorpusWatchDaemon:
+    """Keeps validation state for a tree in memory and updates it per change."""
+
+    def __init__(self, root: str, checks: Set[str]):
+        self.root = root
+        self.checks = checks
+        self.frontmatter_validator = None
+        if 'frontmatter' in checks:
+            # Imported lazily so link-only watching works without PyYAML
+            from validate_yaml_frontmatter import YAMLFrontmatterValidator
+            self.frontmatter_validator = YAMLFrontmatterValidator()
+        self.link_validator = LinkValidator(root)
+
+        # Per-document state
+        self.frontmatter_issues: Dict[str, Set[Tuple[str, str, str]]] = {}
+        self.links: Dict[str, List[LinkRecord]] = {}
+        self.broken_links: Dict[str, Set[Tuple[int, str]]] = {}
+        # Resolved link target -> documents linking to it
+        self.backlinks: Dict[Path, Set[str]] = {}
+
+    def _link_target(self, link: LinkRecord) -> Optional[Path]:
+        url = link.url.partition('#')[0]
+        if url.startswith(('http://', 'https://', 'mailto:')) or not url.endswith('.md'):
+            return None
+        try:
+            return (link.source_file.parent / url).resolve()
+        except (OSError, RuntimeError):
+            return None
+
+    def _validate_frontmatter(self, file_path: str) -> Set[Tuple[str, str, str]]:
+        result = self.frontmatter_validator.validate_file(file_path)
+        # INFO messages about optional sections are too noisy for a live view
+        return {
+            (issue.level.value, issue.field, issue.message)
+            for issue in result.issues if issue.level.value != 'INFO'
+        }
+
+    def _validate_links(self, file_path: str) -> Set[Tuple[int, str]]:
+        return {
+            (link.line_number, link.url)
+            for link in self.links.get(file_path, [])
+            if self.link_validator.validate_link(link) == 'broken'
+        }
+
+    def _load_links(self, file_path: str):
+        for link in self.links.pop(file_path, []):
+            target = self._link_target(link)
+            if target is not None:
+                self.backlinks.get(target, set()).discard(file_path)
+
+        if not os.path.exists(file_path):
+            return
+
+        links = self.link_validator.extract_links(Path(file_path))
+        self.links[file_path] = links
+        for link in links:
+            target = self._link_target(link)
+            if target is not None:
+                self.backlinks.setdefault(target, set()).add(file_path)
+
+    def full_scan(self) -> Tuple[int, int, int]:
+        """Validate the whole tree and return (files, front-matter issues, broken links)."""
+        self.frontmatter_issues.clear()
+        self.links.clear()
+        self.broken_links.clear()
+        self.backlinks.clear()
+
+        file_paths = find_markdown_files(self.root)
+        for file_path in file_paths:
+            if self.frontmatter_validator is not None:
+                self.frontmatter_issues[file_path] = self._validate_frontmatter(file_path)
+            if 'links' in self.checks:
+                self._load_links(file_path)
+        if 'links' in self.checks:
+            for file_path in file_paths:
+                self.broken_links[file_path] = self._validate_links(file_path)
+
+        return (len(file_paths),
+                sum(len(issues) for issues in self.frontmatter_issues.values()),
+                sum(len(broken) for broken in self.broken_links.values()))
+
+    def apply_changes(self, changed: Set[str]) -> List[Tuple[str, List[str]]]:
+        """Revalidate changed files and the documents linking to them.
+
+        Returns (file path, delta lines) for every file whose issues changed.
+        """
+        deltas = []
+        relink = set()
+
+        for file_path in sorted(changed):
+            exists = os.path.exists(file_path)
+            lines = []
+
+            if self.frontmatter_validator is not None:
+                old_issues = self.frontmatter_issues.pop(file_path, set())
+                new_issues = self._validate_frontmatter(file_path) if exists else set()
+                if exists:
+                    self.frontmatter_issues[file_path] = new_issues
+                lines.extend(f"+ {level} {field}: {message}" for level, field, message in sorted(new_issues - old_issues))
+                lines.extend(f"- {level} {field}: {message}" for level, field, message in sorted(old_issues - new_issues))
+
+            if 'links' in self.checks:
+                was_known = file_path in self.links
+                old_anchors = self.link_validator.anchors.get(file_path)
+                self._load_links(file_path)
+                anchors_changed = exists and self.link_validator.anchors.get(file_path) != old_anchors
+                if exists != was_known or anchors_changed:
+                    # Created, deleted or headings changed: links pointing at this document may have changed status
+                    try:
+                        relink.update(self.backlinks.get(Path(file_path).resolve(), set()))
+                    except (OSError, RuntimeError):
+                        pass
+                relink.add(file_path)
+
+            if not exists:
+                lines.insert(0, "deleted")
+            deltas.append((file_path, lines))
+
+        if 'links' in self.checks:
+            link_deltas = {}
+            for file_path in sorted(relink):
+                old_broken = self.broken_links.pop(file_path, set())
+                new_broken = self._validate_links(file_path) if os.path.exists(file_path) else set()
+                if file_path in self.links:
+                    self.broken_links[file_path] = new_broken
+                link_deltas[file_path] = (
+                    [f"+ broken link line {line}: {url}" for line, url in sorted(new_broken - old_broken)] +
+                    [f"- broken link line {line}: {url}" for line, url in sorted(old_broken - new_broken)]
+                )
+            for file_path, lines in deltas:
+                lines.extend(link_deltas.pop(file_path, []))
+            deltas.extend((file_path, lines) for file_path, lines in link_deltas.items() if lines)
+
+        return deltas
+
+    def run(self, watcher):
+        """Print deltas for every batch of changes until interrupted."""
+        start = time.perf_counter()
+        files, issue_count, broken_count = self.full_scan()
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Watching {files} Markdown files in {self.root} ({type(watcher).__name__}, initial scan {elapsed:.0f} ms)")
+        if self.frontmatter_validator is not None:
+            print(f"  Front-matter errors and warnings: {issue_count}")
+        if 'links' in self.checks:
+            print(f"  Broken links: {broken_count}")
+        sys.stdout.flush()
+
+        while True:
+            changed = watcher.wait_for_changes()
+            start = time.perf_counter()
+            if changed is None:
+                files, issue_count, broken_count = self.full_scan()
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Rescanned {files} files after a large change")
+                sys.stdout.flush()
+                continue
+
+            deltas = self.apply_changes(changed)
+            elapsed = (time.perf_counter() - start) * 1000
+            timestamp = datetime.now().strftime('%H:%M:%S')
+            for file_path, lines in deltas:
+                status = "" if lines else " no changes"
+                print(f"[{timestamp}] {file_path}{status} ({elapsed:.0f} ms)")
+                for line in lines:
+                    print(f"    {line}")
+            sys.stdout.flush()
+
+def run_watch(root: str, checks: Set[str], force_polling: bool = False) -> int:
+    """Run the watch daemon until Ctrl+C; returns the process exit code."""
+    daemon = CorpusWatchDaemon(root, checks)
+    watcher = create_watcher(root, force_polling)
+    try:
+        daemon.run(watcher)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Continuously validate front matter and links as files change')
+    parser.add_argument('--path', default='docs/knowledge-corpus/',
+                        help='Directory to watch (default: docs/knowledge-corpus/)')
+    parser.add_argument('--checks', default='frontmatter,links',
+                        help='Comma-separated checks to run: frontmatter, links (default: both)')
+    parser.add_argument('--poll', action='store_true',
+                        help='Poll modification times instead of using inotify')
+    args = parser.parse_args()
+
+    checks = {check.strip() for check in args.checks.split(',') if check.strip()}
+    unknown = checks - {'frontmatter', 'links'}
+    if unknown or not checks:
+        print(f"Error: Unknown checks: {', '.join(sorted(unknown)) or '(none given)'}", file=sys.stderr)
+        return 1
+    if not os.path.isdir(args.path):
+        print(f"Error: Path '{args.path}' does not exist", file=sys.stderr)
+        return 1
+
+    return run_watch(args.path, checks, args.poll)
+
+if __name__ == '__main__':
+    sys.exit(main())
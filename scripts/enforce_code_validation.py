@@ -11,19 +11,319 @@ This script enforces mandatory code validation by:
 Usage:
     python scripts/enforce_code_validation.py --validate-report <report_path>
     python scripts/enforce_code_validation.py --scan-all-reports
+    python scripts/enforce_code_validation.py --scan-all-reports --jobs 0 \\
+        --output enforcement-report.md --jsonl enforcement-results.jsonl --summary-json enforcement-summary.json
+
+The source code directories are indexed once per run. The index is kept in
+<project-root>/.source-tree-index.json and rebuilt only for trees whose
+directories changed since the previous run.
 """
 
 import os
+import posixpath
 import re
 import sys
 import argparse
 import json
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import hashlib
 
+from report_writers import ReportSpool
+from snippet_matcher import ShingleIndex, SnippetAutomaton, SnippetMatch
+
+DEFAULT_INDEX_CACHE = ".source-tree-index.json"
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Snippets whose longest matching prefix covers less than this are plain misses
+PARTIAL_MATCH_MIN_RATIO = 0.5
+# Snippets at least this similar to some source region are accepted with a warning
+FUZZY_MATCH_MIN_SIMILARITY = 0.8
+CODE_FILE_EXTENSIONS = ('.cs', '.js', '.ts', '.tsx', '.json', '.xml', '.bicep', '.yml', '.yaml')
+
+# One pass over a report finds fence markers and source file references, either
+# labelled (Location/Source Code Location/Path) or in backticks or quotes. Only
+# the marker of a fence line is consumed, so references after it are found too
+_CODE_FILE = r'\.(?:cs|js|ts|tsx|json|xml|bicep|yml|yaml)'
+REPORT_TOKEN_PATTERN = re.compile(
+    r'(?P<fence>^[ \t]*```+)'
+    r'|(?:Location|Path)[:\s]*["`](?P<labeled>[^"`]+' + _CODE_FILE + r')["`]'
+    r'|`(?P<backticked>[^`]+' + _CODE_FILE + r')`'
+    r'|"(?P<quoted>[^"]+' + _CODE_FILE + r')"',
+    re.IGNORECASE | re.MULTILINE
+)
+
+def tokenize_report(content: str):
+    """Walk a report once, yielding its file references and fenced code blocks
+    
+    Yields ("reference", path, line) for every source file reference and
+    ("code_block", text, line, reference) for every fenced block, where line
+    is 1-based and reference is the first reference on the block's opening
+    fence line, or else the closest reference outside code blocks since the
+    previous block (or None).
+    """
+    line = 1
+    scanned = 0
+    pending_reference = None
+    open_fence = None
+    
+    for match in REPORT_TOKEN_PATTERN.finditer(content):
+        line += content.count('\n', scanned, match.start())
+        scanned = match.start()
+        
+        if match.group('fence') is not None:
+            if open_fence is None:
+                line_end = content.find('\n', match.end())
+                start = len(content) if line_end < 0 else line_end + 1
+                open_fence = [start, line, pending_reference, False]
+            else:
+                start, start_line, reference, _ = open_fence
+                yield ("code_block", content[start:max(match.start() - 1, start)], start_line, reference)
+                open_fence = None
+                pending_reference = None
+            continue
+        
+        path = match.group('labeled') or match.group('backticked') or match.group('quoted')
+        yield ("reference", path, line)
+        if open_fence is None:
+            pending_reference = path
+        elif line == open_fence[1] and not open_fence[3]:
+            # A reference on the opening fence line labels the block
+            open_fence[2] = path
+            open_fence[3] = True
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse every whitespace run to a single space"""
+    return WHITESPACE_PATTERN.sub(' ', text)
+
+class NormalizedSource:
+    """Whitespace-collapsed file content that can map offsets back to original lines"""
+    
+    def __init__(self, content: str):
+        self.text = normalize_whitespace(content)
+        self._content = content
+        self._line_starts = None
+    
+    def _build_line_starts(self) -> List[int]:
+        # Normalized offset at which each original line starts; blank lines
+        # share the offset of the next non-blank line
+        line_starts = [0]
+        removed = 0
+        for match in WHITESPACE_PATTERN.finditer(self._content):
+            newlines = match.group().count('\n')
+            if newlines:
+                line_starts.extend([match.start() - removed + 1] * newlines)
+            removed += match.end() - match.start() - 1
+        return line_starts
+    
+    def line_range(self, offset: int, length: int) -> Tuple[int, int]:
+        """Original 1-based first and last line of a normalized text span"""
+        if self._line_starts is None:
+            self._line_starts = self._build_line_starts()
+            self._content = None
+        return (bisect_right(self._line_starts, offset),
+                bisect_right(self._line_starts, offset + max(length, 1) - 1))
+    
+    def find(self, normalized_snippet: str) -> Optional[Tuple[int, int]]:
+        """Line range of the first occurrence of an already-normalized snippet"""
+        offset = self.text.find(normalized_snippet)
+        if offset < 0:
+            return None
+        return self.line_range(offset, len(normalized_snippet))
+    
+    def match_all(self, normalized_snippets: List[str]) -> List[SnippetMatch]:
+        """Match several already-normalized snippets against the text
+        
+        Exact hits are found with str.find, which runs in C; the snippets
+        that miss are then matched together in a single automaton pass to
+        find their longest partial matches.
+        """
+        matches = []
+        missing = []
+        for index, snippet in enumerate(normalized_snippets):
+            offset = self.text.find(snippet)
+            if offset < 0:
+                missing.append(index)
+                matches.append(None)
+            else:
+                matches.append(SnippetMatch(snippet, len(snippet), offset))
+        
+        if missing:
+            partial_matches = SnippetAutomaton([normalized_snippets[index] for index in missing]).scan(self.text)
+            for index, match in zip(missing, partial_matches):
+                matches[index] = match
+        return matches
+
+class NormalizedSourceCache:
+    """LRU cache of NormalizedSource objects keyed by path and modification time
+    
+    Memory is bounded by the total length of the cached normalized texts; the
+    most recently used file is always kept.
+    """
+    
+    def __init__(self, max_chars: int = 64 * 1024 * 1024):
+        self.max_chars = max_chars
+        self.total_chars = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+    
+    def get(self, path: Path) -> NormalizedSource:
+        """Return the normalized content of path, reading it only when changed or evicted"""
+        key = str(path)
+        mtime_ns = os.stat(path).st_mtime_ns
+        
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == mtime_ns:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        
+        self.misses += 1
+        with open(path, 'r', encoding='utf-8') as f:
+            source = NormalizedSource(f.read())
+        
+        if entry is not None:
+            self.total_chars -= len(entry[1].text)
+        self._entries[key] = (mtime_ns, source)
+        self._entries.move_to_end(key)
+        self.total_chars += len(source.text)
+        
+        while self.total_chars > self.max_chars and len(self._entries) > 1:
+            evicted_key, (evicted_mtime, evicted) = self._entries.popitem(last=False)
+            self.total_chars -= len(evicted.text)
+        
+        return source
+
+class SourceTreeIndex:
+    """File and directory names of the source code trees, collected in one walk per tree"""
+    
+    VERSION = 1
+    
+    def __init__(self, project_root: Path, source_dirs: List[str]):
+        self.project_root = Path(project_root)
+        self.source_dirs = source_dirs
+        self.trees = {}
+        self.rebuilt_trees = []
+        self._files = {}
+        self._dirs = {}
+        self._by_name = {}
+    
+    def _walk_tree(self, source_dir: str) -> Dict:
+        """Walk one source tree, keeping files in os.walk order and directory mtimes"""
+        tree_root = self.project_root / source_dir
+        files = []
+        dirs = {}
+        
+        for root, subdirs, filenames in os.walk(tree_root):
+            relative_root = os.path.relpath(root, tree_root).replace(os.sep, '/')
+            try:
+                dirs[relative_root] = os.stat(root).st_mtime_ns
+            except OSError:
+                continue
+            for filename in filenames:
+                files.append(filename if relative_root == '.' else f"{relative_root}/{filename}")
+        
+        return {'files': files, 'dirs': dirs}
+    
+    def _is_current(self, source_dir: str, tree: Dict) -> bool:
+        """A cached tree is current while none of its directories changed"""
+        tree_root = self.project_root / source_dir
+        if not tree['dirs']:
+            return not tree_root.is_dir()
+        
+        for relative_dir, mtime_ns in tree['dirs'].items():
+            try:
+                if os.stat(tree_root / relative_dir).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+    
+    def _load_cache(self, cache_path: str) -> Dict:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return {}
+        return data.get('trees', {})
+    
+    def _save_cache(self, cache_path: str):
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'trees': self.trees}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: could not save source tree index to {cache_path}: {e}", file=sys.stderr)
+    
+    def build(self, cache_path: Optional[str] = None):
+        """Load the index from cache_path where still current and walk the remaining trees"""
+        cached = self._load_cache(cache_path) if cache_path else {}
+        self.trees = {}
+        self.rebuilt_trees = []
+        
+        for source_dir in self.source_dirs:
+            tree = cached.get(source_dir)
+            if tree is None or not self._is_current(source_dir, tree):
+                tree = self._walk_tree(source_dir)
+                self.rebuilt_trees.append(source_dir)
+            self.trees[source_dir] = tree
+            
+            self._files[source_dir] = set(tree['files'])
+            self._dirs[source_dir] = set(tree['dirs'])
+            by_name = {}
+            for relative_path in tree['files']:
+                by_name.setdefault(posixpath.basename(relative_path), []).append(relative_path)
+            self._by_name[source_dir] = by_name
+        
+        if cache_path and (self.rebuilt_trees or set(cached) != set(self.trees)):
+            self._save_cache(cache_path)
+    
+    def exists(self, source_dir: str, relative_path: str) -> bool:
+        """Whether relative_path names a file or directory inside source_dir"""
+        normalized = posixpath.normpath(relative_path)
+        if posixpath.isabs(normalized) or normalized == '..' or normalized.startswith('../'):
+            # Outside the indexed tree: ask the filesystem
+            return (self.project_root / source_dir / relative_path).exists()
+        return normalized in self._files[source_dir] or normalized in self._dirs[source_dir]
+    
+    def iter_files(self):
+        """Yield (source_dir, relative_path) for every indexed file in walk order"""
+        for source_dir in self.source_dirs:
+            for relative_path in self.trees[source_dir]['files']:
+                yield source_dir, relative_path
+    
+    def find_by_name(self, source_dir: str, reference: str) -> Optional[str]:
+        """Find a file named like reference anywhere in source_dir
+        
+        Among files with the same name, the one sharing the most trailing path
+        components with reference wins; ties go to the first in os.walk order.
+        """
+        candidates = self._by_name[source_dir].get(posixpath.basename(reference))
+        if not candidates:
+            return None
+        
+        reference_parts = reference.split('/')
+        best_path = candidates[0]
+        best_match = 0
+        for candidate in candidates:
+            match = 0
+            for reference_part, candidate_part in zip(reversed(reference_parts), reversed(candidate.split('/'))):
+                if reference_part != candidate_part:
+                    break
+                match += 1
+            if match > best_match:
+                best_path, best_match = candidate, match
+        return best_path
+
 class CodeValidationEnforcer:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, index_cache: Optional[str] = None, strict_snippets: bool = False):
         self.project_root = Path(project_root)
         self.source_code_dirs = [
             "Towne-Park-Billing-Source-Code",
@@ -32,6 +332,12 @@ class CodeValidationEnforcer:
             "Towne-Park-Billing-PA-Solution"
         ]
         self.validation_reports_dir = self.project_root / "docs" / "knowledge-corpus" / "validation-reports"
+        self.source_index = SourceTreeIndex(self.project_root, self.source_code_dirs)
+        self.source_index.build(index_cache)
+        self.source_cache = NormalizedSourceCache()
+        self.index_cache = index_cache
+        self.strict_snippets = strict_snippets
+        self._shingle_index = None
         
     def validate_report(self, report_path: str) -> Dict:
         """Validate a single code validation report"""
@@ -57,25 +363,53 @@ class CodeValidationEnforcer:
             "warnings": [],
             "code_references": [],
             "verified_references": 0,
-            "fabricated_references": 0
+            "fabricated_references": 0,
+            "snippet_locations": []
         }
         
-        # Extract code file references
-        file_references = self._extract_file_references(content)
+        # Extract code file references and the code snippets following them
+        tokens = list(tokenize_report(content))
+        file_references = self._collect_file_references(tokens)
         results["code_references"] = file_references
+        code_snippets = self._collect_code_snippets(tokens)
         
-        # Extract code snippets
-        code_snippets = self._extract_code_snippets(content)
+        # Verify all code snippets of existing files, one pass per source file
+        existing_references = [ref for ref in file_references if self._verify_file_exists(ref)]
+        snippet_matches = self.match_code_snippets(
+            {ref: code_snippets[ref] for ref in existing_references if ref in code_snippets}
+        )
         
         # Verify each file reference exists
         for ref in file_references:
-            if self._verify_file_exists(ref):
+            if ref in existing_references:
                 results["verified_references"] += 1
                 # Verify code snippets if present
-                if ref in code_snippets:
-                    snippet_valid = self._verify_code_snippet(ref, code_snippets[ref])
-                    if not snippet_valid:
-                        results["issues"].append(f"Code snippet for {ref} does not match actual file content")
+                if ref in snippet_matches:
+                    match = snippet_matches[ref]
+                    if match["status"] == "hit":
+                        results["snippet_locations"].append(match["location"])
+                    elif match["status"] == "similar":
+                        location = match["location"]
+                        results["snippet_locations"].append(location)
+                        results["warnings"].append(
+                            f"Code snippet for {ref} differs from the source: {match['ratio']:.0%} similar to "
+                            f"{location['file']} lines {location['start_line']}-{location['end_line']}"
+                        )
+                    elif match["status"] == "partial":
+                        location = match["location"]
+                        results["issues"].append(
+                            f"Code snippet for {ref} does not match actual file content "
+                            f"(closest partial match: {match['ratio']:.0%} of the snippet at "
+                            f"{location['file']} lines {location['start_line']}-{location['end_line']})"
+                        )
+                        results["valid"] = False
+                    else:
+                        message = f"Code snippet for {ref} does not match actual file content"
+                        suggestion = match.get("suggestion")
+                        if suggestion:
+                            message += (f" (similar code is in {suggestion['file']} lines "
+                                        f"{suggestion['start_line']}-{suggestion['end_line']}, not in the cited file)")
+                        results["issues"].append(message)
                         results["valid"] = False
             else:
                 results["fabricated_references"] += 1
@@ -97,123 +431,190 @@ class CodeValidationEnforcer:
     
     def _extract_file_references(self, content: str) -> List[str]:
         """Extract source code file references from report content"""
-        patterns = [
-            r'`([^`]+\.(cs|js|ts|tsx|json|xml|bicep|yml|yaml))`',
-            r'"([^"]+\.(cs|js|ts|tsx|json|xml|bicep|yml|yaml))"',
-            r'Location[:\s]*["`]([^"`]+\.(cs|js|ts|tsx|json|xml|bicep|yml|yaml))["`]',
-            r'Source Code Location[:\s]*["`]([^"`]+\.(cs|js|ts|tsx|json|xml|bicep|yml|yaml))["`]',
-            r'Path[:\s]*["`]([^"`]+\.(cs|js|ts|tsx|json|xml|bicep|yml|yaml))["`]'
-        ]
-        
-        references = []
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    references.append(match[0])
-                else:
-                    references.append(match)
-                    
-        return list(set(references))  # Remove duplicates
+        return self._collect_file_references(tokenize_report(content))
     
     def _extract_code_snippets(self, content: str) -> Dict[str, str]:
         """Extract code snippets associated with file references"""
+        return self._collect_code_snippets(tokenize_report(content))
+    
+    def _collect_file_references(self, tokens) -> List[str]:
+        # Distinct references in order of first appearance
+        references = {}
+        for token in tokens:
+            if token[0] == "reference":
+                references.setdefault(token[1], token[2])
+        return list(references)
+    
+    def _collect_code_snippets(self, tokens) -> Dict[str, str]:
+        # Each code block belongs to the reference preceding it; a later block
+        # for the same reference replaces an earlier one
         snippets = {}
-        
-        # Look for code blocks following file references
-        lines = content.split('\n')
-        current_file = None
-        in_code_block = False
-        current_snippet = []
-        
-        for line in lines:
-            # Check if line contains a file reference
-            file_refs = self._extract_file_references(line)
-            if file_refs:
-                current_file = file_refs[0]
-                
-            # Check for code block start
-            if line.strip().startswith('```') and current_file:
-                if in_code_block:
-                    # End of code block
-                    snippets[current_file] = '\n'.join(current_snippet)
-                    current_snippet = []
-                    in_code_block = False
-                    current_file = None
-                else:
-                    # Start of code block
-                    in_code_block = True
-                    current_snippet = []
-            elif in_code_block:
-                current_snippet.append(line)
-                
+        for token in tokens:
+            if token[0] == "code_block" and token[3] is not None:
+                snippets[token[3]] = token[1]
         return snippets
     
     def _verify_file_exists(self, file_path: str) -> bool:
         """Verify that a referenced source code file actually exists"""
-        # Try different possible locations
-        possible_paths = []
-        
-        for source_dir in self.source_code_dirs:
-            # Direct path
-            full_path = self.project_root / source_dir / file_path
-            possible_paths.append(full_path)
-            
-            # Path without leading directory
-            if '/' in file_path:
-                relative_path = '/'.join(file_path.split('/')[1:])
-                full_path = self.project_root / source_dir / relative_path
-                possible_paths.append(full_path)
-                
-            # Search for filename in subdirectories
-            filename = Path(file_path).name
-            for root, dirs, files in os.walk(self.project_root / source_dir):
-                if filename in files:
-                    possible_paths.append(Path(root) / filename)
-        
-        return any(path.exists() for path in possible_paths)
+        return self._find_actual_file(file_path) is not None
     
     def _verify_code_snippet(self, file_path: str, snippet: str) -> bool:
         """Verify that a code snippet actually exists in the referenced file"""
-        # Find the actual file
-        actual_file = self._find_actual_file(file_path)
-        if not actual_file:
-            return False
+        return self.locate_code_snippet(file_path, snippet) is not None
+    
+    def locate_code_snippet(self, file_path: str, snippet: str) -> Optional[Dict]:
+        """Find where a code snippet occurs in the referenced file
+        
+        Whitespace differences are ignored. Returns the reference, the actual
+        file and the matched line range, or None if the snippet is not found.
+        """
+        match = self.match_code_snippets({file_path: snippet})[file_path]
+        return match["location"] if match["status"] == "hit" else None
+    
+    def match_code_snippets(self, snippets: Dict[str, str]) -> Dict[str, Dict]:
+        """Match code snippets against their referenced files
+        
+        Snippets resolving to the same source file are matched together in a
+        single pass over it. Each result has a status of "hit", "similar"
+        (no exact match, but a region of the referenced file shares at least
+        FUZZY_MATCH_MIN_SIMILARITY of the snippet's token shingles; never
+        used with strict_snippets), "partial" (the longest matching prefix
+        covers at least PARTIAL_MATCH_MIN_RATIO of the snippet) or "miss",
+        a ratio (matched prefix or similarity) and, unless it is a miss, the
+        location of the match. A miss whose snippet is similar to code in a
+        different file carries that location as "suggestion"; it is not
+        accepted, since the report cites the wrong file.
+        """
+        results = {}
+        by_file = {}
+        for file_path, snippet in snippets.items():
+            actual_file = self._find_actual_file(file_path)
+            if not actual_file:
+                results[file_path] = {"status": "miss", "ratio": 0.0, "location": None}
+                continue
+            by_file.setdefault(actual_file, []).append(file_path)
+        
+        for actual_file, file_paths in by_file.items():
+            try:
+                source = self.source_cache.get(actual_file)
+            except Exception:
+                for file_path in file_paths:
+                    results[file_path] = {"status": "miss", "ratio": 0.0, "location": None}
+                continue
             
-        try:
-            with open(actual_file, 'r', encoding='utf-8') as f:
-                file_content = f.read()
-                
             # Normalize whitespace for comparison
-            normalized_snippet = re.sub(r'\s+', ' ', snippet.strip())
-            normalized_content = re.sub(r'\s+', ' ', file_content)
+            normalized = [normalize_whitespace(snippets[file_path].strip()) for file_path in file_paths]
+            relative_file = os.path.relpath(actual_file, self.project_root).replace(os.sep, '/')
             
-            # Check if snippet exists in file (allowing for some formatting differences)
-            return normalized_snippet in normalized_content
-            
-        except Exception:
-            return False
+            for file_path, match in zip(file_paths, source.match_all(normalized)):
+                if match.found:
+                    start_line, end_line = source.line_range(match.offset, match.matched_chars)
+                    results[file_path] = self._snippet_result("hit", 1.0, file_path, relative_file, start_line, end_line)
+                    continue
+                
+                similar = None if self.strict_snippets else self.find_similar_code(snippets[file_path], relative_file)
+                if similar and similar["similarity"] >= FUZZY_MATCH_MIN_SIMILARITY:
+                    results[file_path] = self._snippet_result("similar", similar["similarity"], file_path,
+                                                              similar["file"], similar["start_line"], similar["end_line"])
+                elif match.ratio >= PARTIAL_MATCH_MIN_RATIO:
+                    start_line, end_line = source.line_range(match.offset, match.matched_chars)
+                    results[file_path] = self._snippet_result("partial", match.ratio, file_path, relative_file, start_line, end_line)
+                else:
+                    results[file_path] = {"status": "miss", "ratio": match.ratio, "location": None}
+                    elsewhere = None if self.strict_snippets else self.find_similar_code(snippets[file_path])
+                    if elsewhere and elsewhere["similarity"] >= FUZZY_MATCH_MIN_SIMILARITY and elsewhere["file"] != relative_file:
+                        results[file_path]["suggestion"] = self._snippet_result(
+                            "similar", elsewhere["similarity"], file_path,
+                            elsewhere["file"], elsewhere["start_line"], elsewhere["end_line"])["location"]
+        
+        return results
+    
+    def _snippet_result(self, status: str, ratio: float, reference: str, file: str, start_line: int, end_line: int) -> Dict:
+        return {
+            "status": status,
+            "ratio": ratio,
+            "location": {
+                "reference": reference,
+                "file": file,
+                "start_line": start_line,
+                "end_line": end_line,
+                "similarity": round(ratio, 3)
+            }
+        }
+    
+    def find_similar_code(self, snippet: str, file: Optional[str] = None) -> Optional[Dict]:
+        """Find the source region most similar to a snippet, by token shingles
+        
+        With file (relative to the project root), only that file is
+        searched. Otherwise the shingle index over every code file in the
+        source directories is built on first use and searched. Returns the
+        file, line range and similarity, or None if no searched file shares
+        a shingle with the snippet.
+        """
+        if file is not None:
+            try:
+                with open(self.project_root / file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError):
+                return None
+            located = ShingleIndex().locate(snippet, content)
+            if located is None:
+                return None
+            similarity, start, end = located
+            return {
+                "file": file,
+                "start_line": content.count('\n', 0, start) + 1,
+                "end_line": content.count('\n', 0, end) + 1,
+                "similarity": similarity
+            }
+        
+        if self._shingle_index is None:
+            self._shingle_index = ShingleIndex()
+            for source_dir, relative_path in self.source_index.iter_files():
+                if not relative_path.lower().endswith(CODE_FILE_EXTENSIONS):
+                    continue
+                try:
+                    with open(self.project_root / source_dir / relative_path, 'r', encoding='utf-8') as f:
+                        self._shingle_index.add(f"{source_dir}/{relative_path}", f.read())
+                except (OSError, UnicodeDecodeError):
+                    continue
+        
+        contents = {}
+        
+        def read_text(key: str) -> str:
+            with open(self.project_root / key, 'r', encoding='utf-8') as f:
+                contents[key] = f.read()
+            return contents[key]
+        
+        match = self._shingle_index.best_match(snippet, read_text)
+        if match is None:
+            return None
+        
+        content = contents[match.key]
+        return {
+            "file": match.key,
+            "start_line": content.count('\n', 0, match.start) + 1,
+            "end_line": content.count('\n', 0, match.end) + 1,
+            "similarity": match.similarity
+        }
     
     def _find_actual_file(self, file_path: str) -> Optional[Path]:
         """Find the actual file path for a referenced file"""
         for source_dir in self.source_code_dirs:
             # Try direct path
-            full_path = self.project_root / source_dir / file_path
-            if full_path.exists():
-                return full_path
+            if self.source_index.exists(source_dir, file_path):
+                return self.project_root / source_dir / file_path
                 
             # Try without leading directory
             if '/' in file_path:
                 relative_path = '/'.join(file_path.split('/')[1:])
-                full_path = self.project_root / source_dir / relative_path
-                if full_path.exists():
-                    return full_path
+                if self.source_index.exists(source_dir, relative_path):
+                    return self.project_root / source_dir / relative_path
                     
             # Search for filename
-            filename = Path(file_path).name
-            for root, dirs, files in os.walk(self.project_root / source_dir):
-                if filename in files:
-                    return Path(root) / filename
+            match = self.source_index.find_by_name(source_dir, file_path)
+            if match is not None:
+                return self.project_root / source_dir / match
                     
         return None
     
@@ -258,7 +659,29 @@ class CodeValidationEnforcer:
                 
         return warnings
     
-    def scan_all_reports(self) -> Dict:
+    def find_validation_reports(self) -> List[Path]:
+        """Validation reports in the validation-reports directory"""
+        return [report_file for report_file in self.validation_reports_dir.glob("*.md")
+                if "validation" in report_file.name.lower()]
+    
+    def iter_scan_results(self, jobs: int = 1):
+        """Validate every validation report, yielding results in report order as they complete
+        
+        With jobs > 1 the reports are validated in that many worker processes.
+        """
+        report_files = [str(report_file) for report_file in self.find_validation_reports()]
+        workers = min(resolve_job_count(jobs), len(report_files))
+        
+        if workers <= 1:
+            for report_file in report_files:
+                yield self.validate_report(report_file)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(str(self.project_root), self.index_cache, self.strict_snippets)) as executor:
+            yield from executor.map(_validate_report_in_worker, report_files)
+    
+    def scan_all_reports(self, jobs: int = 1) -> Dict:
         """Scan all validation reports in the validation-reports directory"""
         results = {
             "total_reports": 0,
@@ -270,24 +693,59 @@ class CodeValidationEnforcer:
         if not self.validation_reports_dir.exists():
             return {"error": "Validation reports directory not found"}
             
-        for report_file in self.validation_reports_dir.glob("*.md"):
-            if "validation" in report_file.name.lower():
-                results["total_reports"] += 1
-                report_result = self.validate_report(str(report_file))
-                results["reports"].append(report_result)
-                
-                if report_result["valid"]:
-                    results["valid_reports"] += 1
-                else:
-                    results["invalid_reports"] += 1
+        for report_result in self.iter_scan_results(jobs):
+            results["total_reports"] += 1
+            results["reports"].append(report_result)
+            
+            if report_result["valid"]:
+                results["valid_reports"] += 1
+            else:
+                results["invalid_reports"] += 1
                     
         return results
     
-    def generate_enforcement_report(self, output_file: str = None) -> str:
-        """Generate a comprehensive enforcement report"""
-        scan_results = self.scan_all_reports()
+    def stream_scan(self, jobs: int = 1, output_file: Optional[str] = None,
+                    jsonl_stream=None, summary_file: Optional[str] = None) -> Dict:
+        """Scan all validation reports once, streaming every output as results arrive
+        
+        Each report result is written as one JSON line to jsonl_stream and its
+        Markdown section is spooled to a temporary file, so memory does not
+        grow with the number of reports. The Markdown enforcement report is
+        assembled once the summary is known. Returns the summary counts.
+        """
+        summary = {"total_reports": 0, "valid_reports": 0, "invalid_reports": 0}
+        if not self.validation_reports_dir.exists():
+            summary["error"] = "Validation reports directory not found"
+        
+        sections = ReportSpool() if output_file else None
+        try:
+            if "error" not in summary:
+                for report_result in self.iter_scan_results(jobs):
+                    summary["total_reports"] += 1
+                    summary["valid_reports" if report_result["valid"] else "invalid_reports"] += 1
+                    
+                    if jsonl_stream is not None:
+                        jsonl_stream.write(json.dumps(report_result) + "\n")
+                        jsonl_stream.flush()
+                    if sections is not None:
+                        sections.write(self._format_report_section(report_result))
+            
+            if sections is not None:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(self._format_report_header(summary))
+                    sections.copy_to(f)
+        finally:
+            if sections is not None:
+                sections.close()
+        
+        if summary_file:
+            with open(summary_file, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2)
         
-        report = f"""# Code Validation Enforcement Report
+        return summary
+    
+    def _format_report_header(self, scan_results: Dict) -> str:
+        return f"""# Code Validation Enforcement Report
 Generated: {self._get_timestamp()}
 
 ## Summary
@@ -298,9 +756,9 @@ Generated: {self._get_timestamp()}
 
 ## Detailed Results
 """
-        
-        for report_data in scan_results.get('reports', []):
-            report_section = f"""
+    
+    def _format_report_section(self, report_data: Dict) -> str:
+        report_section = f"""
 ### {report_data['filename']}
 - **Status**: {'✅ VALID' if report_data['valid'] else '❌ INVALID'}
 - **Code References**: {len(report_data['code_references'])}
@@ -308,17 +766,30 @@ Generated: {self._get_timestamp()}
 - **Fabricated References**: {report_data['fabricated_references']}
 
 """
-            if report_data['issues']:
-                report_section += "**Issues:**\n"
-                for issue in report_data['issues']:
-                    report_section += f"- {issue}\n"
-                    
-            if report_data['warnings']:
-                report_section += "**Warnings:**\n"
-                for warning in report_data['warnings']:
-                    report_section += f"- {warning}\n"
-                    
-            report += report_section
+        if report_data.get('snippet_locations'):
+            report_section += "**Verified Snippets:**\n"
+            for location in report_data['snippet_locations']:
+                report_section += f"- `{location['reference']}` → `{location['file']}` lines {location['start_line']}-{location['end_line']}\n"
+                
+        if report_data['issues']:
+            report_section += "**Issues:**\n"
+            for issue in report_data['issues']:
+                report_section += f"- {issue}\n"
+                
+        if report_data['warnings']:
+            report_section += "**Warnings:**\n"
+            for warning in report_data['warnings']:
+                report_section += f"- {warning}\n"
+                
+        return report_section
+    
+    def generate_enforcement_report(self, output_file: str = None) -> str:
+        """Generate a comprehensive enforcement report"""
+        scan_results = self.scan_all_reports()
+        
+        report = self._format_report_header(scan_results)
+        for report_data in scan_results.get('reports', []):
+            report += self._format_report_section(report_data)
         
         if output_file:
             with open(output_file, 'w', encoding='utf-8') as f:
@@ -331,16 +802,42 @@ Generated: {self._get_timestamp()}
         from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+_worker_enforcer: Optional[CodeValidationEnforcer] = None
+
+def _init_worker(project_root: str, index_cache: Optional[str], strict_snippets: bool):
+    """Create the per-process enforcer used by _validate_report_in_worker"""
+    global _worker_enforcer
+    _worker_enforcer = CodeValidationEnforcer(project_root, index_cache, strict_snippets)
+
+def _validate_report_in_worker(report_path: str) -> Dict:
+    return _worker_enforcer.validate_report(report_path)
+
+def resolve_job_count(jobs: int) -> int:
+    """Translate a --jobs value into a worker count (0 means one per CPU)"""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
 def main():
     parser = argparse.ArgumentParser(description="Enforce code validation authenticity")
     parser.add_argument("--validate-report", help="Validate a specific report file")
     parser.add_argument("--scan-all-reports", action="store_true", help="Scan all validation reports")
     parser.add_argument("--output", help="Output file for enforcement report")
+    parser.add_argument("--jsonl", metavar="PATH", help="Stream one JSON result line per report to PATH ('-' for stdout)")
+    parser.add_argument("--summary-json", metavar="PATH", help="Write the report counts as JSON to PATH")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for --scan-all-reports (0 = one per CPU, default: 1)")
     parser.add_argument("--project-root", default=".", help="Project root directory")
+    parser.add_argument("--index-cache", help=f"Source tree index file (default: <project-root>/{DEFAULT_INDEX_CACHE})")
+    parser.add_argument("--no-index-cache", action="store_true", help="Rebuild the source tree index without reading or saving it")
+    parser.add_argument("--strict-snippets", action="store_true",
+                        help="Require exact snippet matches; do not accept snippets that are only similar to the source")
     
     args = parser.parse_args()
     
-    enforcer = CodeValidationEnforcer(args.project_root)
+    index_cache = None
+    if not args.no_index_cache:
+        index_cache = args.index_cache or str(Path(args.project_root) / DEFAULT_INDEX_CACHE)
+    enforcer = CodeValidationEnforcer(args.project_root, index_cache, args.strict_snippets)
     
     if args.validate_report:
         result = enforcer.validate_report(args.validate_report)
@@ -348,13 +845,30 @@ def main():
         sys.exit(0 if result["valid"] else 1)
         
     elif args.scan_all_reports:
-        results = enforcer.scan_all_reports()
-        if args.output:
-            report = enforcer.generate_enforcement_report(args.output)
-            print(f"Enforcement report written to: {args.output}")
+        if args.output or args.jsonl or args.summary_json:
+            # Single streaming pass producing every requested output
+            jsonl_stream = None
+            if args.jsonl == '-':
+                jsonl_stream = sys.stdout
+            elif args.jsonl:
+                jsonl_stream = open(args.jsonl, 'w', encoding='utf-8')
+            try:
+                results = enforcer.stream_scan(args.jobs, args.output, jsonl_stream, args.summary_json)
+            finally:
+                if jsonl_stream is not None and jsonl_stream is not sys.stdout:
+                    jsonl_stream.close()
+            
+            if "error" in results:
+                print(f"Error: {results['error']}", file=sys.stderr)
+                sys.exit(1)
+            status_stream = sys.stderr if args.jsonl == '-' else sys.stdout
+            if args.output:
+                print(f"Enforcement report written to: {args.output}", file=status_stream)
+            print(f"Reports: {results['total_reports']} scanned, {results['invalid_reports']} invalid", file=status_stream)
         else:
+            results = enforcer.scan_all_reports(args.jobs)
             print(json.dumps(results, indent=2))
-        sys.exit(0 if results["invalid_reports"] == 0 else 1)
+        sys.exit(0 if results.get("invalid_reports", 0) == 0 and "error" not in results else 1)
         
     else:
         parser.print_help()
@@ -7,14 +7,17 @@ Part of the Mandatory Dual Validation Protocol
 
 import os
 import sys
-import re
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, TextIO, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+from pattern_scanner import PatternScanner
+from report_writers import ReportWriter, indented_json, render_report
+
 @dataclass
 class ValidationResult:
     """Represents the result of validating a single document"""
@@ -30,10 +33,133 @@ class ValidationResult:
     recommendations: List[str]
     validation_summary: str
 
+@dataclass
+class ValidationEnvironment:
+    """Run-scoped state computed once and shared by every document and worker process"""
+    source_accessibility: Dict[str, bool]
+    pattern_scanner: PatternScanner
+    
+    @property
+    def source_accessible(self) -> bool:
+        return any(self.source_accessibility.values())
+
 class EnhancedCodeValidator:
     """Enhanced code validation engine for comprehensive business rule validation"""
     
-    def __init__(self):
+    # Pattern families, compiled once into a PatternScanner
+    CODE_INDICATOR_PATTERNS = [
+        # Business logic patterns
+        r'calculation[s]?\s+logic',
+        r'business\s+rule[s]?',
+        r'algorithm[s]?',
+        r'formula[s]?',
+        r'validation\s+rule[s]?',
+        
+        # Technical patterns
+        r'API\s+endpoint[s]?',
+        r'function[s]?\s+implementation',
+        r'class[es]?\s+definition',
+        r'method[s]?\s+implementation',
+        r'database\s+schema',
+        r'SQL\s+quer[y|ies]',
+        
+        # System integration patterns
+        r'integration\s+point[s]?',
+        r'data\s+flow[s]?',
+        r'workflow[s]?\s+implementation',
+        r'process[es]?\s+automation',
+        
+        # Specific technology patterns
+        r'React\s+component[s]?',
+        r'TypeScript\s+interface[s]?',
+        r'Azure\s+Function[s]?',
+        r'Power\s+Platform',
+        r'PowerBill',
+        r'Legion\s+integration',
+        r'Great\s+Plains',
+        
+        # Revenue and contract patterns
+        r'revenue\s+share\s+calculation[s]?',
+        r'management\s+agreement\s+processing',
+        r'per\s+labor\s+hour\s+calculation[s]?',
+        r'fixed\s+fee\s+processing',
+        r'PTEB\s+calculation[s]?',
+        r'progressive\s+tier[s]?',
+        r'revenue\s+code[s]?\s+(SD1|SD2|VD1|VD2|OR1|OR2)',
+    ]
+    
+    BUSINESS_RULE_PATTERNS = {
+        'revenue_share': [
+            r'progressive\s+tier[s]?',
+            r'revenue\s+percentage[s]?',
+            r'vehicle\s+count\s+validation',
+            r'deposited\s+revenue',
+            r'bell\s+service\s+integration'
+        ],
+        'management_agreement': [
+            r'billable\s+account[s]?\s+(6000|7000)\s+series',
+            r'profit\s+sharing\s+calculation[s]?',
+            r'insurance\s+calculation[s]?\s+5\.77%',
+            r'PTEB\s+calculation[s]?',
+            r'support\s+service\s+fee[s]?'
+        ],
+        'per_labor_hour': [
+            r'job\s+code\s+rate[s]?',
+            r'overtime\s+calculation[s]?\s+1\.5x',
+            r'ECI\s+escalation',
+            r'CPI\s+escalation',
+            r'Legion\s+integration'
+        ],
+        'fixed_fee': [
+            r'service\s+rate[s]?',
+            r'annual\s+escalation',
+            r'GL\s+account\s+mapping',
+            r'COA\s+number[s]?'
+        ]
+    }
+    
+    TECHNICAL_SPEC_PATTERNS = {
+        'frontend': [
+            r'React\s+component[s]?',
+            r'TypeScript\s+interface[s]?',
+            r'Vite\s+build',
+            r'frontend\s+architecture'
+        ],
+        'backend': [
+            r'Azure\s+Function[s]?',
+            r'API\s+endpoint[s]?',
+            r'business\s+logic\s+layer',
+            r'data\s+access\s+layer'
+        ],
+        'integration': [
+            r'PowerBill\s+integration',
+            r'Legion\s+integration',
+            r'Great\s+Plains\s+integration',
+            r'Hotel\s+PMS\s+integration',
+            r'EDW\s+integration'
+        ],
+        'infrastructure': [
+            r'Azure\s+infrastructure',
+            r'Logic\s+Apps',
+            r'Power\s+Platform',
+            r'deployment\s+configuration'
+        ]
+    }
+    
+    INTEGRATION_PATTERNS = [
+        r'PowerBill.*integration',
+        r'Legion.*integration', 
+        r'Great\s+Plains.*integration',
+        r'Hotel\s+PMS.*integration',
+        r'EDW.*integration',
+        r'Azure.*integration',
+        r'Power\s+Platform.*integration',
+        r'API.*integration',
+        r'data\s+flow[s]?',
+        r'workflow[s]?\s+orchestration'
+    ]
+    
+    def __init__(self, environment: Optional[ValidationEnvironment] = None):
         self.source_code_directories = [
             "Towne-Park-Billing-Source-Code",
             "Towne-Park-Azure-Components", 
@@ -42,55 +168,44 @@ class EnhancedCodeValidator:
             "Towne-Park-Ready-for-Invoicing"
         ]
         self.validation_results = []
+        self.environment = environment if environment is not None else self.create_environment()
+    
+    def create_environment(self) -> ValidationEnvironment:
+        """Check source accessibility and compile the patterns for a validation run"""
+        return ValidationEnvironment(
+            source_accessibility=self.check_source_code_accessibility(),
+            pattern_scanner=self.build_pattern_scanner()
+        )
+    
+    @property
+    def pattern_scanner(self) -> PatternScanner:
+        return self.environment.pattern_scanner
+    
+    @classmethod
+    def build_pattern_scanner(cls) -> PatternScanner:
+        """Compile every pattern family into one scanner"""
+        return PatternScanner({
+            'code_indicators': [(None, pattern) for pattern in cls.CODE_INDICATOR_PATTERNS],
+            'business_rules': [(rule_type, pattern) for rule_type, patterns in cls.BUSINESS_RULE_PATTERNS.items()
+                               for pattern in patterns],
+            'technical_specs': [(spec_type, pattern) for spec_type, patterns in cls.TECHNICAL_SPEC_PATTERNS.items()
+                                for pattern in patterns],
+            'integration_points': [(None, pattern) for pattern in cls.INTEGRATION_PATTERNS]
+        })
+    
+    def scan_patterns(self, content: str) -> Dict[str, List]:
+        """Match all pattern families against a document in one scan"""
+        return self.pattern_scanner.scan(content)
         
-    def scan_for_code_references(self, content: str) -> Tuple[bool, List[str]]:
+    def scan_for_code_references(self, content: str, hits: Optional[Dict[str, List]] = None) -> Tuple[bool, List[str]]:
         """Scan document content for code references and technical specifications"""
-        code_indicators = [
-            # Business logic patterns
-            r'calculation[s]?\s+logic',
-            r'business\s+rule[s]?',
-            r'algorithm[s]?',
-            r'formula[s]?',
-            r'validation\s+rule[s]?',
-            
-            # Technical patterns
-            r'API\s+endpoint[s]?',
-            r'function[s]?\s+implementation',
-            r'class[es]?\s+definition',
-            r'method[s]?\s+implementation',
-            r'database\s+schema',
-            r'SQL\s+quer[y|ies]',
-            
-            # System integration patterns
-            r'integration\s+point[s]?',
-            r'data\s+flow[s]?',
-            r'workflow[s]?\s+implementation',
-            r'process[es]?\s+automation',
-            
-            # Specific technology patterns
-            r'React\s+component[s]?',
-            r'TypeScript\s+interface[s]?',
-            r'Azure\s+Function[s]?',
-            r'Power\s+Platform',
-            r'PowerBill',
-            r'Legion\s+integration',
-            r'Great\s+Plains',
-            
-            # Revenue and contract patterns
-            r'revenue\s+share\s+calculation[s]?',
-            r'management\s+agreement\s+processing',
-            r'per\s+labor\s+hour\s+calculation[s]?',
-            r'fixed\s+fee\s+processing',
-            r'PTEB\s+calculation[s]?',
-            r'progressive\s+tier[s]?',
-            r'revenue\s+code[s]?\s+(SD1|SD2|VD1|VD2|OR1|OR2)',
-        ]
+        if hits is None:
+            hits = self.pattern_scanner.scan(content, ['code_indicators'])
         
         found_references = []
         has_references = False
         
-        for pattern in code_indicators:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for rule, matches in hits['code_indicators']:
             for match in matches:
                 has_references = True
                 found_references.append(f"Found: '{match.group()}' at position {match.start()}")
@@ -107,50 +222,22 @@ class EnhancedCodeValidator:
             
         return accessibility
     
-    def validate_business_rules(self, content: str, document_path: str) -> Tuple[bool, List[str], List[str]]:
+    def validate_business_rules(self, content: str, document_path: str,
+                                hits: Optional[Dict[str, List]] = None) -> Tuple[bool, List[str], List[str]]:
         """Validate business rules against source code implementation"""
+        if hits is None:
+            hits = self.pattern_scanner.scan(content, ['business_rules'])
+        
         issues = []
         recommendations = []
         validated = False
         
-        # Check for specific business rule patterns
-        business_rule_patterns = {
-            'revenue_share': [
-                r'progressive\s+tier[s]?',
-                r'revenue\s+percentage[s]?',
-                r'vehicle\s+count\s+validation',
-                r'deposited\s+revenue',
-                r'bell\s+service\s+integration'
-            ],
-            'management_agreement': [
-                r'billable\s+account[s]?\s+(6000|7000)\s+series',
-                r'profit\s+sharing\s+calculation[s]?',
-                r'insurance\s+calculation[s]?\s+5\.77%',
-                r'PTEB\s+calculation[s]?',
-                r'support\s+service\s+fee[s]?'
-            ],
-            'per_labor_hour': [
-                r'job\s+code\s+rate[s]?',
-                r'overtime\s+calculation[s]?\s+1\.5x',
-                r'ECI\s+escalation',
-                r'CPI\s+escalation',
-                r'Legion\s+integration'
-            ],
-            'fixed_fee': [
-                r'service\s+rate[s]?',
-                r'annual\s+escalation',
-                r'GL\s+account\s+mapping',
-                r'COA\s+number[s]?'
-            ]
-        }
-        
         # Identify which business rules are present
         found_rules = []
-        for rule_type, patterns in business_rule_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    found_rules.append(f"{rule_type}: {pattern}")
-                    validated = True
+        for rule, matches in hits['business_rules']:
+            if matches:
+                found_rules.append(f"{rule.category}: {rule.pattern}")
+                validated = True
         
         if found_rules:
             recommendations.append(f"Found {len(found_rules)} business rule patterns requiring validation")
@@ -160,48 +247,22 @@ class EnhancedCodeValidator:
         
         return validated, issues, recommendations
     
-    def validate_technical_specifications(self, content: str, document_path: str) -> Tuple[bool, List[str], List[str]]:
+    def validate_technical_specifications(self, content: str, document_path: str,
+                                          hits: Optional[Dict[str, List]] = None) -> Tuple[bool, List[str], List[str]]:
         """Validate technical specifications against source code"""
+        if hits is None:
+            hits = self.pattern_scanner.scan(content, ['technical_specs'])
+        
         issues = []
         recommendations = []
         validated = False
         
-        # Check for technical specification patterns
-        tech_patterns = {
-            'frontend': [
-                r'React\s+component[s]?',
-                r'TypeScript\s+interface[s]?',
-                r'Vite\s+build',
-                r'frontend\s+architecture'
-            ],
-            'backend': [
-                r'Azure\s+Function[s]?',
-                r'API\s+endpoint[s]?',
-                r'business\s+logic\s+layer',
-                r'data\s+access\s+layer'
-            ],
-            'integration': [
-                r'PowerBill\s+integration',
-                r'Legion\s+integration',
-                r'Great\s+Plains\s+integration',
-                r'Hotel\s+PMS\s+integration',
-                r'EDW\s+integration'
-            ],
-            'infrastructure': [
-                r'Azure\s+infrastructure',
-                r'Logic\s+Apps',
-                r'Power\s+Platform',
-                r'deployment\s+configuration'
-            ]
-        }
-        
         # Identify technical specifications
         found_specs = []
-        for spec_type, patterns in tech_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    found_specs.append(f"{spec_type}: {pattern}")
-                    validated = True
+        for rule, matches in hits['technical_specs']:
+            if matches:
+                found_specs.append(f"{rule.category}: {rule.pattern}")
+                validated = True
         
         if found_specs:
             recommendations.append(f"Found {len(found_specs)} technical specification patterns")
@@ -211,29 +272,19 @@ class EnhancedCodeValidator:
         
         return validated, issues, recommendations
     
-    def validate_integration_points(self, content: str, document_path: str) -> Tuple[bool, List[str], List[str]]:
+    def validate_integration_points(self, content: str, document_path: str,
+                                    hits: Optional[Dict[str, List]] = None) -> Tuple[bool, List[str], List[str]]:
         """Validate integration points against source code"""
+        if hits is None:
+            hits = self.pattern_scanner.scan(content, ['integration_points'])
+        
         issues = []
         recommendations = []
         validated = False
         
         # Check for integration patterns
-        integration_patterns = [
-            r'PowerBill.*integration',
-            r'Legion.*integration', 
-            r'Great\s+Plains.*integration',
-            r'Hotel\s+PMS.*integration',
-            r'EDW.*integration',
-            r'Azure.*integration',
-            r'Power\s+Platform.*integration',
-            r'API.*integration',
-            r'data\s+flow[s]?',
-            r'workflow[s]?\s+orchestration'
-        ]
-        
         found_integrations = []
-        for pattern in integration_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for rule, matches in hits['integration_points']:
             for match in matches:
                 found_integrations.append(match.group())
                 validated = True
@@ -292,12 +343,18 @@ class EnhancedCodeValidator:
                 validation_summary="Failed to read document"
             )
         
+        return self.validate_content(document_path, content)
+    
+    def validate_content(self, document_path: str, content: str) -> ValidationResult:
+        """Validate already-read document content"""
+        # Match every pattern family in one scan of the document
+        hits = self.scan_patterns(content)
+        
         # Check for code references
-        has_code_refs, code_refs = self.scan_for_code_references(content)
+        has_code_refs, code_refs = self.scan_for_code_references(content, hits)
         
-        # Check source code accessibility
-        accessibility = self.check_source_code_accessibility()
-        source_accessible = any(accessibility.values())
+        # Source code accessibility is checked once per run
+        source_accessible = self.environment.source_accessible
         
         # Initialize validation result
         issues = []
@@ -313,17 +370,17 @@ class EnhancedCodeValidator:
             validation_performed = True
             
             # Validate business rules
-            business_validated, business_issues, business_recs = self.validate_business_rules(content, document_path)
+            business_validated, business_issues, business_recs = self.validate_business_rules(content, document_path, hits)
             issues.extend(business_issues)
             recommendations.extend(business_recs)
             
             # Validate technical specifications
-            tech_validated, tech_issues, tech_recs = self.validate_technical_specifications(content, document_path)
+            tech_validated, tech_issues, tech_recs = self.validate_technical_specifications(content, document_path, hits)
             issues.extend(tech_issues)
             recommendations.extend(tech_recs)
             
             # Validate integration points
-            integration_validated, int_issues, int_recs = self.validate_integration_points(content, document_path)
+            integration_validated, int_issues, int_recs = self.validate_integration_points(content, document_path, hits)
             issues.extend(int_issues)
             recommendations.extend(int_recs)
         
@@ -371,55 +428,139 @@ class EnhancedCodeValidator:
         
         return result
     
+    def find_documents(self, directory: str) -> List[str]:
+        """Markdown documents under directory, skipping validation reports"""
+        return [str(md_file) for md_file in Path(directory).rglob('*.md')
+                if 'validation-reports' not in str(md_file)]
+    
+    def iter_validate_documents(self, document_paths: List[str], jobs: int = 1):
+        """Validate documents, yielding results in input order
+        
+        With jobs > 1 the documents are split into chunks and validated in
+        worker processes that share this validator's environment.
+        """
+        workers = min(resolve_job_count(jobs), len(document_paths))
+        if workers <= 1:
+            for document_path in document_paths:
+                yield self.validate_document(document_path)
+            return
+        
+        chunksize = max(1, len(document_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(type(self), self.environment)) as executor:
+            yield from executor.map(_validate_document_in_worker, document_paths, chunksize=chunksize)
+    
     def generate_report(self, results: List[ValidationResult], output_path: Optional[str] = None) -> str:
         """Generate comprehensive validation report"""
-        report_lines = [
+        report_content = render_report(MarkdownReportWriter, results)
+        
+        if output_path:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(report_content)
+        
+        return report_content
+
+class MarkdownReportWriter(ReportWriter):
+    """Markdown validation report; document sections are spooled until the summary is known"""
+    
+    def __init__(self, out: TextIO):
+        super().__init__(out)
+        self.total_documents = 0
+        self.documents_with_code_references = 0
+        self.documents_validated = 0
+        self.confidence_total = 0.0
+        self.sections = self.spool()
+    
+    def add(self, result: ValidationResult):
+        self.total_documents += 1
+        self.documents_with_code_references += result.has_code_references
+        self.documents_validated += result.validation_performed
+        self.confidence_total += result.confidence_score
+        
+        self.sections.extend([
+            f"### {result.document_path}",
+            f"- **Code References**: {'Yes' if result.has_code_references else 'No'}",
+            f"- **Source Code Accessible**: {'Yes' if result.source_code_accessible else 'No'}",
+            f"- **Validation Performed**: {'Yes' if result.validation_performed else 'No'}",
+            f"- **Confidence Score**: {result.confidence_score:.2f}",
+            f"- **Summary**: {result.validation_summary}",
+            ""
+        ])
+        
+        if result.issues_found:
+            self.sections.append("**Issues Found:**")
+            self.sections.extend(f"- {issue}" for issue in result.issues_found)
+            self.sections.append("")
+        
+        if result.recommendations:
+            self.sections.append("**Recommendations:**")
+            self.sections.extend(f"- {rec}" for rec in result.recommendations)
+            self.sections.append("")
+        
+        self.sections.extend(["---", ""])
+    
+    def finish(self):
+        average_confidence = self.confidence_total / self.total_documents if self.total_documents else 0.0
+        self.out.write("\n".join([
             "# Enhanced Code Validation Report",
             f"Generated: {datetime.now().isoformat()}",
             "",
             "## Executive Summary",
-            f"- Total documents analyzed: {len(results)}",
-            f"- Documents with code references: {sum(1 for r in results if r.has_code_references)}",
-            f"- Documents validated: {sum(1 for r in results if r.validation_performed)}",
-            f"- Average confidence score: {sum(r.confidence_score for r in results) / len(results):.2f}",
+            f"- Total documents analyzed: {self.total_documents}",
+            f"- Documents with code references: {self.documents_with_code_references}",
+            f"- Documents validated: {self.documents_validated}",
+            f"- Average confidence score: {average_confidence:.2f}",
             "",
             "## Validation Results",
             ""
-        ]
-        
-        for result in results:
-            report_lines.extend([
-                f"### {result.document_path}",
-                f"- **Code References**: {'Yes' if result.has_code_references else 'No'}",
-                f"- **Source Code Accessible**: {'Yes' if result.source_code_accessible else 'No'}",
-                f"- **Validation Performed**: {'Yes' if result.validation_performed else 'No'}",
-                f"- **Confidence Score**: {result.confidence_score:.2f}",
-                f"- **Summary**: {result.validation_summary}",
-                ""
-            ])
-            
-            if result.issues_found:
-                report_lines.append("**Issues Found:**")
-                for issue in result.issues_found:
-                    report_lines.append(f"- {issue}")
-                report_lines.append("")
-            
-            if result.recommendations:
-                report_lines.append("**Recommendations:**")
-                for rec in result.recommendations:
-                    report_lines.append(f"- {rec}")
-                report_lines.append("")
-            
-            report_lines.append("---")
-            report_lines.append("")
-        
-        report_content = "\n".join(report_lines)
-        
-        if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(report_content)
-        
-        return report_content
+        ]))
+        self.sections.copy_to(self.out)
+
+class JsonReportWriter(ReportWriter):
+    """JSON validation report; each result is written as soon as it arrives"""
+    
+    def __init__(self, out: TextIO):
+        super().__init__(out)
+        self.total_documents = 0
+        self.out.write('{\n  "generated": ' + json.dumps(datetime.now().isoformat()) + ',\n  "results": ')
+    
+    def add(self, result: ValidationResult):
+        entry = {
+            'document_path': result.document_path,
+            'has_code_references': result.has_code_references,
+            'source_code_accessible': result.source_code_accessible,
+            'validation_performed': result.validation_performed,
+            'confidence_score': result.confidence_score,
+            'validation_summary': result.validation_summary,
+            'issues_found': result.issues_found,
+            'recommendations': result.recommendations
+        }
+        self.out.write(('[\n    ' if not self.total_documents else ',\n    ') + indented_json(entry, 2))
+        self.total_documents += 1
+    
+    def finish(self):
+        self.out.write('\n  ]\n}' if self.total_documents else '[]\n}')
+
+REPORT_WRITERS = {
+    'text': MarkdownReportWriter,
+    'json': JsonReportWriter
+}
+
+_worker_validator: Optional[EnhancedCodeValidator] = None
+
+def _init_worker(validator_class: type, environment: ValidationEnvironment):
+    """Create the per-process validator used by _validate_document_in_worker"""
+    global _worker_validator
+    _worker_validator = validator_class(environment)
+
+def _validate_document_in_worker(document_path: str) -> ValidationResult:
+    return _worker_validator.validate_document(document_path)
+
+def resolve_job_count(jobs: int) -> int:
+    """Translate a --jobs value into a worker count (0 means one per CPU)"""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
 
 def main():
     parser = argparse.ArgumentParser(description='Enhanced Code Validation Script')
@@ -427,56 +568,40 @@ def main():
     parser.add_argument('--directory', help='Directory to scan for documents')
     parser.add_argument('--output', help='Output file for validation report')
     parser.add_argument('--format', choices=['text', 'json'], default='text', help='Output format')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes for --directory (0 = one per CPU, default: 1)')
     
     args = parser.parse_args()
     
-    validator = EnhancedCodeValidator()
-    results = []
-    
-    if args.document:
-        # Validate single document
-        result = validator.validate_document(args.document)
-        results.append(result)
-    elif args.directory:
-        # Validate all markdown files in directory
-        directory = Path(args.directory)
-        for md_file in directory.rglob('*.md'):
-            # Skip validation-reports directory
-            if 'validation-reports' not in str(md_file):
-                result = validator.validate_document(str(md_file))
-                results.append(result)
-    else:
+    if not args.document and not args.directory:
         print("Please specify either --document or --directory")
         return 1
     
-    # Generate report
-    if args.format == 'json':
-        report_data = {
-            'generated': datetime.now().isoformat(),
-            'results': [
-                {
-                    'document_path': r.document_path,
-                    'has_code_references': r.has_code_references,
-                    'source_code_accessible': r.source_code_accessible,
-                    'validation_performed': r.validation_performed,
-                    'confidence_score': r.confidence_score,
-                    'validation_summary': r.validation_summary,
-                    'issues_found': r.issues_found,
-                    'recommendations': r.recommendations
-                }
-                for r in results
-            ]
-        }
-        
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2)
-        else:
-            print(json.dumps(report_data, indent=2))
-    else:
-        report = validator.generate_report(results, args.output)
+    validator = EnhancedCodeValidator()
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        # Results are written to the report as they arrive
+        with REPORT_WRITERS[args.format](out) as writer:
+            if args.document:
+                # Validate single document
+                writer.add(validator.validate_document(args.document))
+            else:
+                # Validate all markdown files in directory
+                document_paths = validator.find_documents(args.directory)
+                show_progress = sys.stderr.isatty()
+                for validated, result in enumerate(validator.iter_validate_documents(document_paths, args.jobs), 1):
+                    writer.add(result)
+                    if show_progress:
+                        print(f"\rValidated {validated}/{len(document_paths)} documents", end='', file=sys.stderr, flush=True)
+                if show_progress:
+                    print(file=sys.stderr)
+                else:
+                    print(f"Validated {len(document_paths)}/{len(document_paths)} documents", file=sys.stderr)
         if not args.output:
-            print(report)
+            print()
+    finally:
+        if args.output:
+            out.close()
     
     return 0
 
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+External Link Checker
+
+Checks http:// and https:// links concurrently. Requests are scheduled with
+asyncio under a global concurrency limit and a per-host limit, so many hosts
+are checked in parallel without flooding any one of them. Every URL is tried
+with HEAD first and with GET when the server rejects HEAD; redirects are
+followed. Results are kept in a JSON cache for a configurable time, so
+repeated runs only request URLs that are new or expired.
+
+The HTTP layer is a pluggable transport. HttpTransport keeps keep-alive
+connections per host; StaticTransport answers from a table and StubServer
+is a local HTTP server, for checking without network access.
+
+Usage:
+    python scripts/external_link_checker.py [urls...] [--docs-root docs]
+    python scripts/external_link_checker.py --docs-root docs --offline responses.json
+    python scripts/validate_links.py docs --check-external
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import ssl
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_CACHE_FILE = ".external-link-cache.json"
+DEFAULT_CACHE_TTL_HOURS = 24.0
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 10.0
+MAX_REDIRECTS = 5
+# Statuses servers send when they do not support HEAD; the URL is retried with GET
+HEAD_FALLBACK_STATUSES = frozenset({403, 405, 501})
+# Statuses that say nothing about the link itself; reported as errors and not cached
+TRANSIENT_STATUSES = frozenset({408, 429})
+USER_AGENT = "towne-park-docs-link-checker/1.0"
+
+@dataclass
+class TransportResponse:
+    status: int
+    location: Optional[str] = None
+
+@dataclass
+class LinkCheckResult:
+    url: str
+    state: str  # 'ok', 'broken' or 'error'
+    status: Optional[int] = None
+    message: str = ''
+    checked_at: float = 0.0
+    cached: bool = False
+
+    def describe(self) -> str:
+        if self.status is not None:
+            text = f"HTTP {self.status}"
+            return f"{text} ({self.message})" if self.message else text
+        return self.message or self.state
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'state': self.state, 'status': self.status, 'message': self.message, 'checked_at': self.checked_at}
+
+    @classmethod
+    def from_dict(cls, url: str, data: Dict[str, Any]) -> 'LinkCheckResult':
+        return cls(url, data['state'], data['status'], data['message'], data['checked_at'], cached=True)
+
+def request_url(url: str) -> str:
+    """The URL to request for a Markdown link target: no title, angle brackets or fragment"""
+    url = url.strip()
+    if url.startswith('<') and '>' in url:
+        url = url[1:url.index('>')]
+    return url.split()[0].partition('#')[0] if url else url
+
+class HttpTransport:
+    """http.client transport that keeps idle keep-alive connections per host
+
+    http.client is blocking, so requests run on a thread pool with one thread
+    per concurrent request. HEAD connections are returned to the pool; GET
+    connections are closed rather than reading the response body.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._ssl_context = ssl.create_default_context()
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        with self._lock:
+            self.connections_opened += 1
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _request_sync(self, method: str, url: str) -> TransportResponse:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            raise ValueError(f"Unsupported URL: {url}")
+        key = (parts.scheme, parts.netloc)
+        path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        headers = {'User-Agent': USER_AGENT, 'Accept': '*/*'}
+
+        with self._lock:
+            idle = self._idle.get(key)
+            connection = idle.pop() if idle else None
+        reused = connection is not None
+
+        while True:
+            if connection is None:
+                connection = self._connect(*key)
+            try:
+                connection.request(method, path, headers=headers)
+                response = connection.getresponse()
+            except (ConnectionError, http.client.RemoteDisconnected, http.client.BadStatusLine):
+                connection.close()
+                if not reused:
+                    raise
+                # The server closed a pooled connection while it was idle
+                connection, reused = None, False
+                continue
+            except BaseException:
+                connection.close()
+                raise
+            break
+
+        result = TransportResponse(response.status, response.getheader('Location'))
+        if method == 'HEAD' and not response.will_close:
+            response.read()
+            with self._lock:
+                self._idle.setdefault(key, []).append(connection)
+        else:
+            connection.close()
+        return result
+
+    async def request(self, method: str, url: str) -> TransportResponse:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._request_sync, method, url)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+            self._idle = {}
+
+class StaticTransport:
+    """Transport answering from a table, for checking without network access
+
+    responses maps 'METHOD url' or plain url to a status code or a
+    (status, location) pair. URLs missing from the table fail like an
+    unreachable host. Requests made are recorded in requests.
+    """
+
+    def __init__(self, responses: Dict[str, Union[int, Tuple[int, str], List]], delay: float = 0.0):
+        self.responses = responses
+        self.delay = delay
+        self.requests: List[Tuple[str, str]] = []
+
+    async def request(self, method: str, url: str) -> TransportResponse:
+        self.requests.append((method, url))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        response = self.responses.get(f"{method} {url}", self.responses.get(url))
+        if response is None:
+            raise ConnectionRefusedError(f"No response configured for {url}")
+        if isinstance(response, int):
+            return TransportResponse(response)
+        return TransportResponse(response[0], response[1])
+
+    def close(self):
+        pass
+
+class StubServer:
+    """Local HTTP/1.1 server answering from a table, to exercise HttpTransport offline
+
+    routes maps 'METHOD /path' or '/path' to a status code or a
+    (status, location) pair; other paths are 404. delay is added to every
+    response to stand in for network latency.
+    """
+
+    def __init__(self, routes: Dict[str, Union[int, Tuple[int, str]]], delay: float = 0.0):
+        stub = self
+        self.routes = routes
+        self.delay = delay
+        self.request_count = 0
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _respond(self):
+                stub.request_count += 1
+                if stub.delay:
+                    time.sleep(stub.delay)
+                route = stub.routes.get(f"{self.command} {self.path}", stub.routes.get(self.path, 404))
+                status, location = (route, None) if isinstance(route, int) else route
+                self.send_response(status)
+                if location:
+                    self.send_header('Location', location)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            do_HEAD = _respond
+            do_GET = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+class ResultCache:
+    """Persistent cache of external link results that expire after ttl seconds
+
+    Only definite results (ok or broken) are stored; errors such as timeouts
+    are checked again on the next run.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_path: str, ttl: float = DEFAULT_CACHE_TTL_HOURS * 3600):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get('version') == self.CACHE_VERSION:
+            self.entries = data.get('entries', {})
+
+    def _fresh(self, entry: Dict[str, Any], now: float) -> bool:
+        return now - entry['checked_at'] < self.ttl
+
+    def lookup(self, url: str, now: Optional[float] = None) -> Optional[LinkCheckResult]:
+        """Return the cached result for url unless it has expired"""
+        entry = self.entries.get(url)
+        if entry is not None and self._fresh(entry, time.time() if now is None else now):
+            self.hits += 1
+            return LinkCheckResult.from_dict(url, entry)
+        self.misses += 1
+        return None
+
+    def store(self, result: LinkCheckResult):
+        if result.state != 'error':
+            self.entries[result.url] = result.to_dict()
+
+    def save(self):
+        """Write the cache to disk, dropping expired entries"""
+        now = time.time()
+        data = {
+            'version': self.CACHE_VERSION,
+            'entries': {url: entry for url, entry in self.entries.items() if self._fresh(entry, now)}
+        }
+
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: could not save external link cache to {self.cache_path}: {e}", file=sys.stderr)
+
+class ExternalLinkChecker:
+    """Checks external URLs concurrently through a transport"""
+
+    def __init__(self, transport=None, cache: Optional[ResultCache] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, per_host: int = DEFAULT_PER_HOST,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.transport = transport if transport is not None else HttpTransport(concurrency, timeout)
+        self.cache = cache
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.request_count = 0
+        # Created inside the running event loop, see check_urls
+        self._global_limit: Optional[asyncio.Semaphore] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def _request(self, method: str, url: str) -> TransportResponse:
+        host = urlsplit(url).netloc.lower()
+        host_limit = self._host_limits.get(host)
+        if host_limit is None:
+            host_limit = self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        # Wait for the host first, so requests queued on a busy host do not hold global slots
+        async with host_limit:
+            async with self._global_limit:
+                self.request_count += 1
+                return await asyncio.wait_for(self.transport.request(method, url), self.timeout)
+
+    async def check_url(self, url: str) -> LinkCheckResult:
+        target = request_url(url)
+        method = 'HEAD'
+        redirects = 0
+        while True:
+            try:
+                response = await self._request(method, target)
+            except asyncio.TimeoutError:
+                return LinkCheckResult(url, 'error', message=f"timed out after {self.timeout:g}s", checked_at=time.time())
+            except (OSError, ValueError, http.client.HTTPException) as e:
+                return LinkCheckResult(url, 'error', message=str(e) or type(e).__name__, checked_at=time.time())
+
+            status = response.status
+            if method == 'HEAD' and status in HEAD_FALLBACK_STATUSES:
+                method = 'GET'
+                continue
+            if 300 <= status < 400 and response.location:
+                redirects += 1
+                if redirects > MAX_REDIRECTS:
+                    return LinkCheckResult(url, 'error', status, 'too many redirects', time.time())
+                target = urljoin(target, response.location)
+                method = 'HEAD'
+                continue
+            break
+
+        message = f"redirected to {target}" if redirects else ''
+        if 200 <= status < 400:
+            state = 'ok'
+        elif status in TRANSIENT_STATUSES or status >= 500:
+            state = 'error'
+        else:
+            state = 'broken'
+        return LinkCheckResult(url, state, status, message, time.time())
+
+    async def check_urls(self, urls: Iterable[str]) -> Dict[str, LinkCheckResult]:
+        """Results for every distinct URL, from the cache where still fresh"""
+        self._global_limit = asyncio.Semaphore(self.concurrency)
+        self._host_limits = {}
+
+        results: Dict[str, LinkCheckResult] = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            cached = self.cache.lookup(url) if self.cache is not None else None
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append(url)
+
+        for result in await asyncio.gather(*(self.check_url(url) for url in pending)):
+            results[result.url] = result
+            if self.cache is not None:
+                self.cache.store(result)
+        return results
+
+    def check(self, urls: Iterable[str]) -> Dict[str, LinkCheckResult]:
+        """Synchronous check_urls that also saves the cache"""
+        results = asyncio.run(self.check_urls(urls))
+        if self.cache is not None:
+            self.cache.save()
+        return results
+
+    def close(self):
+        self.transport.close()
+
+def check_external_links(urls: Iterable[str], cache_path: Optional[str] = DEFAULT_CACHE_FILE,
+                         ttl_hours: float = DEFAULT_CACHE_TTL_HOURS, transport=None,
+                         **options) -> Dict[str, LinkCheckResult]:
+    """Check urls with the default checker setup; cache_path None disables the cache"""
+    cache = ResultCache(cache_path, ttl_hours * 3600) if cache_path else None
+    checker = ExternalLinkChecker(transport, cache, **options)
+    try:
+        return checker.check(urls)
+    finally:
+        checker.close()
+
+def summarize(results: Dict[str, LinkCheckResult]) -> str:
+    states = [result.state for result in results.values()]
+    cached = sum(1 for result in results.values() if result.cached)
+    return (f"{states.count('ok')} ok, {states.count('broken')} broken, "
+            f"{states.count('error')} errors ({cached} of {len(results)} from cache)")
+
+def main():
+    parser = argparse.ArgumentParser(description='Check external links concurrently with a result cache')
+    parser.add_argument('urls', nargs='*', help='URLs to check (default: external links under --docs-root)')
+    parser.add_argument('--docs-root', default='docs', help='Documentation directory to collect links from (default: docs)')
+    parser.add_argument('--cache-file',
+                        help=f"Result cache file (default: {DEFAULT_CACHE_FILE}; none with --offline)")
+    parser.add_argument('--no-cache', action='store_true', help='Check every URL without reading or saving the cache')
+    parser.add_argument('--ttl-hours', type=float, default=DEFAULT_CACHE_TTL_HOURS,
+                        help=f"Hours a cached result stays valid (default: {DEFAULT_CACHE_TTL_HOURS:g})")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Requests in flight at once (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST,
+                        help=f"Requests in flight per host (default: {DEFAULT_PER_HOST})")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Seconds per request (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument('--offline', metavar='RESPONSES',
+                        help="Answer from a JSON file mapping URLs (or 'METHOD url') to status codes instead of the network; "
+                             "the result cache is only used with an explicit --cache-file")
+    args = parser.parse_args()
+
+    urls = args.urls
+    if not urls:
+        from validate_links import LinkValidator
+        links = LinkValidator(args.docs_root, snapshot=True).validate_all_links(counters_only=True)
+        urls = sorted(links.external_urls)
+
+    transport = None
+    if args.offline:
+        try:
+            with open(args.offline, 'r', encoding='utf-8') as f:
+                transport = StaticTransport(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not read responses from '{args.offline}': {e}", file=sys.stderr)
+            return 1
+
+    # Offline answers are not real results; keep them out of the default cache
+    cache_path = args.cache_file or (None if args.offline else DEFAULT_CACHE_FILE)
+    if args.no_cache:
+        cache_path = None
+
+    start = time.perf_counter()
+    results = check_external_links(urls, cache_path, args.ttl_hours, transport,
+                                   concurrency=args.concurrency, per_host=args.per_host, timeout=args.timeout)
+    elapsed = time.perf_counter() - start
+
+    for url in sorted(results):
+        result = results[url]
+        print(f"{result.state.upper():7} {result.describe():24} {url}")
+    print(f"{len(results)} URLs in {elapsed:.1f}s: {summarize(results)}", file=sys.stderr)
+    return 1 if any(result.state == 'broken' for result in results.values()) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
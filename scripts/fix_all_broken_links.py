@@ -8,13 +8,15 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 
 class ComprehensiveLinkFixer:
     def __init__(self, docs_root: str = "docs"):
         self.docs_root = Path(docs_root)
         self.fixes_applied = []
         self.files_created = []
+        self.ambiguous_matches = []
+        self._filename_index = None
         
         # Common broken link patterns and their fixes
         self.link_fixes = {
@@ -172,6 +174,92 @@ This section defines business rules for user access control and permissions mana
 """)
             self.files_created.append('docs/Future_State_Data_Product/business-rules/user-access/index.md')
     
+    def build_filename_index(self, markdown_files: List[Path] = None) -> Dict[str, List[Path]]:
+        """Index every markdown file under docs_root by its file name"""
+        if markdown_files is None:
+            markdown_files = self.docs_root.rglob("*.md")
+        
+        index = {}
+        for path in markdown_files:
+            index.setdefault(path.name, []).append(path)
+        
+        self._filename_index = index
+        return index
+    
+    def find_candidates(self, url: str) -> List[Path]:
+        """Return existing files with the same name as the link target"""
+        if self._filename_index is None:
+            self.build_filename_index()
+        return self._filename_index.get(Path(url).name, [])
+    
+    def rank_candidates(self, candidates: List[Path], source_dir: Path, url: str) -> List[Tuple[Tuple, Path]]:
+        """Order candidates from most to least likely link target
+        
+        Candidates sharing more trailing path components with the broken URL
+        rank first, then those sharing more ancestors with the directory the
+        URL points into (the subtree the link meant), then those with the
+        shortest relative path from the linking file.
+        """
+        url_parts = [part for part in Path(url).parts if part not in ('.', '..')]
+        target_dir_parts = self.link_target_dir(source_dir, url).parts
+        
+        ranked = []
+        for candidate in candidates:
+            candidate_parts = candidate.resolve().parts
+            
+            suffix_match = 0
+            for url_part, candidate_part in zip(reversed(url_parts), reversed(candidate_parts)):
+                if url_part != candidate_part:
+                    break
+                suffix_match += 1
+            
+            shared_ancestors = 0
+            for target_part, candidate_part in zip(target_dir_parts, candidate_parts[:-1]):
+                if target_part != candidate_part:
+                    break
+                shared_ancestors += 1
+            
+            relative_depth = len(Path(os.path.relpath(candidate, source_dir)).parts)
+            ranked.append(((-suffix_match, -shared_ancestors, relative_depth), candidate))
+        
+        ranked.sort(key=lambda item: (item[0], str(item[1])))
+        return ranked
+    
+    @staticmethod
+    def link_target_dir(source_dir: Path, url: str) -> Path:
+        """Directory a relative link points into, resolved lexically since it may not exist"""
+        return Path(os.path.normpath(os.path.join(source_dir.resolve(), os.path.dirname(url))))
+    
+    def resolve_target(self, url: str, file_path: Path) -> Tuple[Optional[Path], List[Path]]:
+        """Pick the existing file a broken link most likely meant
+        
+        Returns the chosen target, or None together with the equally likely
+        candidates when the choice is ambiguous. When several candidates
+        match only the file name, the winner must lie under the directory
+        the link points into and share strictly more ancestors with it than
+        the next candidate; distance alone does not pick between unrelated
+        files such as two index.md.
+        """
+        source = file_path.resolve()
+        candidates = [candidate for candidate in self.find_candidates(url) if candidate.resolve() != source]
+        ranked = self.rank_candidates(candidates, file_path.parent, url)
+        
+        if not ranked:
+            return None, []
+        if len(ranked) == 1:
+            return ranked[0][1], []
+        
+        best_key, runner_up_key = ranked[0][0], ranked[1][0]
+        if best_key == runner_up_key:
+            return None, [candidate for key, candidate in ranked if key == best_key]
+        if best_key[0] == -1:
+            # Only the file name matches: accept a file moved deeper into the
+            # directory the link meant, never a namesake elsewhere
+            target_depth = len(self.link_target_dir(file_path.parent, url).parts)
+            if best_key[1] == runner_up_key[1] or -best_key[1] < target_depth:
+                return None, [candidate for key, candidate in ranked if key[0] == -1]
+        return ranked[0][1], []
+    
     def fix_path_references(self, content: str, file_path: Path) -> str:
         """Fix incorrect path references in content"""
         
@@ -239,13 +327,19 @@ This section defines business rules for user access control and permissions mana
                 
                 # If target doesn't exist, try to find it or mark as planned
                 if not target_path.exists():
-                    # Try to find the file in the docs directory
-                    filename = Path(url).name
-                    potential_paths = list(self.docs_root.rglob(filename))
+                    # Look the file up in the docs filename index
+                    target, ambiguous = self.resolve_target(url, file_path)
                     
-                    if potential_paths:
+                    if ambiguous:
+                        # Several equally likely targets: report instead of guessing
+                        self.ambiguous_matches.append({
+                            'file': file_path,
+                            'link': f'[{text}]({url})',
+                            'candidates': [str(candidate) for candidate in ambiguous]
+                        })
+                    elif target is not None:
                         # Found the file, calculate correct relative path
-                        correct_path = os.path.relpath(potential_paths[0], source_dir)
+                        correct_path = os.path.relpath(target, source_dir)
                         correct_path = correct_path.replace('\\', '/')
                         
                         old_link = f'[{text}]({url})'
@@ -322,10 +416,12 @@ This section defines business rules for user access control and permissions mana
             'files_processed': 0,
             'files_modified': 0,
             'fixes_applied': 0,
-            'files_created': len(self.files_created)
+            'files_created': len(self.files_created),
+            'ambiguous_matches': 0
         }
         
         markdown_files = list(self.docs_root.rglob("*.md"))
+        self.build_filename_index(markdown_files)
         
         for file_path in markdown_files:
             results['files_processed'] += 1
@@ -334,6 +430,7 @@ This section defines business rules for user access control and permissions mana
                 results['files_modified'] += 1
         
         results['fixes_applied'] = len(self.fixes_applied)
+        results['ambiguous_matches'] = len(self.ambiguous_matches)
         return results
     
     def generate_comprehensive_report(self, results: Dict) -> str:
@@ -346,6 +443,7 @@ This section defines business rules for user access control and permissions mana
         report.append(f"- **Files Modified**: {results['files_modified']}")
         report.append(f"- **Files Created**: {results['files_created']}")
         report.append(f"- **Fixes Applied**: {results['fixes_applied']}")
+        report.append(f"- **Ambiguous Matches**: {results.get('ambiguous_matches', len(self.ambiguous_matches))}")
         report.append("")
         
         if self.files_created:
@@ -381,6 +479,21 @@ This section defines business rules for user access control and permissions mana
                     report.append(f"- ... and {len(fixes) - 15} more fixes of this type")
                     report.append("")
         
+        if self.ambiguous_matches:
+            report.append("## Ambiguous Matches")
+            report.append("")
+            report.append("These links were left unchanged because several files match equally well:")
+            report.append("")
+            
+            for match in self.ambiguous_matches:
+                report.append(f"- **File**: `{match['file']}`")
+                report.append(f"  - **Link**: `{match['link']}`")
+                for candidate in match['candidates'][:5]:
+                    report.append(f"  - **Candidate**: `{candidate}`")
+                if len(match['candidates']) > 5:
+                    report.append(f"  - ... and {len(match['candidates']) - 5} more candidates")
+                report.append("")
+        
         return '\n'.join(report)
 
 def main():
@@ -407,6 +520,7 @@ def main():
     print(f"Files modified: {results['files_modified']}")
     print(f"Files created: {results['files_created']}")
     print(f"Fixes applied: {results['fixes_applied']}")
+    print(f"Ambiguous matches left unchanged: {results['ambiguous_matches']}")
     print(f"Report saved to: comprehensive_fix_report.md")
     
     return 0
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Shared YAML Front-matter Extraction
+
+Reads the front-matter block of a Markdown file line by line and stops at the
+closing --- fence, so only the header is ever read and kept in memory. Used by
+all front-matter validation scripts. Standard library only, so the simple
+(no dependencies) validator can use it as well.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+# Front-matter blocks longer than this are treated as unterminated; the
+# largest header in the corpus today is a little over 300 lines
+DEFAULT_MAX_HEADER_LINES = 1000
+
+# Problems reported by split_frontmatter / read_frontmatter_lines
+MISSING_OPENING = 'missing_opening'
+MISSING_CLOSING = 'missing_closing'
+HEADER_TOO_LONG = 'header_too_long'
+
+def split_frontmatter(lines: Iterable[str],
+                      max_lines: int = DEFAULT_MAX_HEADER_LINES) -> Tuple[Optional[List[str]], Optional[str]]:
+    """Collect the front-matter lines from an iterable of document lines.
+
+    Consumes the iterable only up to the closing fence. Returns the header
+    lines without line terminators and None, or None and one of
+    MISSING_OPENING, MISSING_CLOSING or HEADER_TOO_LONG.
+    """
+    line_iter = iter(lines)
+    first_line = next(line_iter, None)
+
+    if first_line is None or first_line.strip() != '---':
+        return None, MISSING_OPENING
+
+    yaml_lines = []
+    for line in line_iter:
+        if line.strip() == '---':
+            return yaml_lines, None
+        if len(yaml_lines) >= max_lines:
+            return None, HEADER_TOO_LONG
+        yaml_lines.append(line.rstrip('\r\n'))
+
+    return None, MISSING_CLOSING
+
+def read_frontmatter_lines(file_path: str,
+                           max_lines: int = DEFAULT_MAX_HEADER_LINES) -> Tuple[Optional[List[str]], Optional[str]]:
+    """Read only the front-matter block of a Markdown file.
+
+    Same return value as split_frontmatter. Errors opening or decoding the
+    header are left to the caller.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return split_frontmatter(f, max_lines)
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Documentation Link Graph
+
+Compact graph of the internal links between Markdown documents. Document
+paths are interned once and referred to by integer ids; edges are stored in
+compressed sparse row form (an offsets array and a targets array) for both
+directions, so forward links and backlinks of a document are array slices.
+validate_links.py --graph saves the graph as JSON, and later tools load it
+instead of rescanning the corpus.
+
+Usage:
+    python scripts/link_graph.py link-graph.json --orphans
+    python scripts/link_graph.py link-graph.json --backlinks knowledge-corpus/business-rules/index.md
+    python scripts/link_graph.py link-graph.json --unreachable --mkdocs mkdocs.yml
+    python scripts/link_graph.py link-graph.json --path index.md knowledge-corpus/user-processes/index.md
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import sys
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+GRAPH_FORMAT_VERSION = 1
+
+def _build_csr(node_count: int, edges: Iterable[Tuple[int, int]]) -> Tuple[array, array]:
+    """Offsets and sorted, de-duplicated targets for edges grouped by source"""
+    rows: List[set] = [set() for _ in range(node_count)]
+    for source, target in edges:
+        rows[source].add(target)
+
+    offsets = array('i', [0])
+    targets = array('i')
+    for row in rows:
+        targets.extend(sorted(row))
+        offsets.append(len(targets))
+    return offsets, targets
+
+class LinkGraph:
+    """Directed graph of links between documents, with forward and reverse indexes"""
+
+    def __init__(self, root: str, documents: List[str], forward: Tuple[array, array], reverse: Tuple[array, array]):
+        self.root = root
+        self.documents = documents
+        self.ids: Dict[str, int] = {path: doc_id for doc_id, path in enumerate(documents)}
+        self._forward_offsets, self._forward_targets = forward
+        self._reverse_offsets, self._reverse_targets = reverse
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._forward_targets)
+
+    @classmethod
+    def from_edges(cls, root: str, documents: List[str], edges: List[Tuple[int, int]]) -> 'LinkGraph':
+        forward = _build_csr(len(documents), edges)
+        reverse = _build_csr(len(documents), ((target, source) for source, target in edges))
+        return cls(root, documents, forward, reverse)
+
+    def relative_path(self, path: str) -> str:
+        """A filesystem path as a document path of this graph"""
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, '/')
+
+    def _id(self, path: str) -> int:
+        doc_id = self.ids.get(posixpath.normpath(path.replace(os.sep, '/')))
+        if doc_id is None:
+            raise KeyError(f"Not a document in the link graph: {path}")
+        return doc_id
+
+    def _row(self, offsets: array, targets: array, doc_id: int) -> array:
+        return targets[offsets[doc_id]:offsets[doc_id + 1]]
+
+    def links_from(self, path: str) -> List[str]:
+        """Documents path links to"""
+        return [self.documents[doc_id] for doc_id in self._row(self._forward_offsets, self._forward_targets, self._id(path))]
+
+    def backlinks(self, path: str) -> List[str]:
+        """Documents linking to path"""
+        return [self.documents[doc_id] for doc_id in self._row(self._reverse_offsets, self._reverse_targets, self._id(path))]
+
+    def orphans(self) -> List[str]:
+        """Documents no other document links to"""
+        orphans = []
+        for doc_id, path in enumerate(self.documents):
+            sources = self._row(self._reverse_offsets, self._reverse_targets, doc_id)
+            if all(source == doc_id for source in sources):
+                orphans.append(path)
+        return orphans
+
+    def reachable(self, entry_paths: Iterable[str]) -> List[bool]:
+        """Per document id, whether it can be reached from any entry path by following links"""
+        seen = [False] * len(self.documents)
+        queue = deque()
+        for path in entry_paths:
+            doc_id = self.ids.get(path)
+            if doc_id is not None and not seen[doc_id]:
+                seen[doc_id] = True
+                queue.append(doc_id)
+
+        offsets, targets = self._forward_offsets, self._forward_targets
+        while queue:
+            doc_id = queue.popleft()
+            for target in targets[offsets[doc_id]:offsets[doc_id + 1]]:
+                if not seen[target]:
+                    seen[target] = True
+                    queue.append(target)
+        return seen
+
+    def unreachable(self, entry_paths: Iterable[str]) -> List[str]:
+        """Documents that cannot be reached from any entry path, e.g. the mkdocs nav"""
+        seen = self.reachable(entry_paths)
+        return [path for doc_id, path in enumerate(self.documents) if not seen[doc_id]]
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """Fewest-clicks path of documents from source to target, or None"""
+        source_id, target_id = self._id(source), self._id(target)
+        parents = array('i', [-1]) * len(self.documents)
+        parents[source_id] = source_id
+        queue = deque([source_id])
+        offsets, targets = self._forward_offsets, self._forward_targets
+        while queue and parents[target_id] < 0:
+            doc_id = queue.popleft()
+            for next_id in targets[offsets[doc_id]:offsets[doc_id + 1]]:
+                if parents[next_id] < 0:
+                    parents[next_id] = doc_id
+                    queue.append(next_id)
+
+        if parents[target_id] < 0:
+            return None
+        path = [target_id]
+        while path[-1] != source_id:
+            path.append(parents[path[-1]])
+        return [self.documents[doc_id] for doc_id in reversed(path)]
+
+    def save(self, graph_path: str):
+        # The root is stored relative to the graph file, so a graph copied
+        # along with its tree (another checkout, a CI artifact) still works
+        graph_dir = os.path.dirname(os.path.abspath(graph_path))
+        try:
+            root = os.path.relpath(self.root, graph_dir).replace(os.sep, '/')
+        except ValueError:
+            # Different drives on Windows
+            root = self.root
+        data = {
+            'version': GRAPH_FORMAT_VERSION,
+            'root': root,
+            'documents': self.documents,
+            'forward': [self._forward_offsets.tolist(), self._forward_targets.tolist()],
+            'reverse': [self._reverse_offsets.tolist(), self._reverse_targets.tolist()]
+        }
+        with open(graph_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, graph_path: str) -> 'LinkGraph':
+        with open(graph_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != GRAPH_FORMAT_VERSION:
+            raise ValueError(f"Unsupported link graph version: {data.get('version')}")
+        forward = tuple(array('i', values) for values in data['forward'])
+        reverse = tuple(array('i', values) for values in data['reverse'])
+        root = os.path.join(os.path.dirname(os.path.abspath(graph_path)), data['root'])
+        return cls(os.path.normpath(root), data['documents'], forward, reverse)
+
+class LinkGraphBuilder:
+    """Collects documents and links during a scan and builds a LinkGraph
+
+    Paths are stored relative to root with forward slashes. Links are
+    resolved lexically; only links to documents added to the builder become
+    edges, so broken and external links are left out.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        # Every interned path: documents and link targets, which may not be documents
+        self._paths: Dict[str, int] = {}
+        self._documents: Set[str] = set()
+        self._edges: List[Tuple[int, int]] = []
+
+    def _intern(self, relative_path: str) -> int:
+        path_id = self._paths.get(relative_path)
+        if path_id is None:
+            path_id = len(self._paths)
+            self._paths[relative_path] = path_id
+        return path_id
+
+    def relative_path(self, path) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, '/')
+
+    def add_document(self, path):
+        relative_path = self.relative_path(path)
+        self._documents.add(relative_path)
+        self._intern(relative_path)
+
+    def add_link(self, source_path, url: str):
+        target = url.partition('#')[0]
+        if not target.endswith('.md') or target.startswith(('http://', 'https://', 'mailto:', '/')):
+            return
+        source = self.relative_path(source_path)
+        target_path = posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+        self._edges.append((self._intern(source), self._intern(target_path)))
+
+    def build(self) -> LinkGraph:
+        # Links can name paths that are not documents; drop them and renumber
+        paths = sorted(self._documents)
+        new_ids = {path: doc_id for doc_id, path in enumerate(paths)}
+        old_to_new = {path_id: new_ids.get(path) for path, path_id in self._paths.items()}
+        edges = [
+            (old_to_new[source], old_to_new[target])
+            for source, target in self._edges
+            if old_to_new[source] is not None and old_to_new[target] is not None
+        ]
+        return LinkGraph.from_edges(self.root, paths, edges)
+
+def load_nav_paths(mkdocs_path: str) -> List[str]:
+    """Documents listed in the nav of mkdocs.yml, as paths relative to its docs_dir"""
+    # Imported lazily so graph queries that do not need the nav work without PyYAML
+    import yaml
+    from yaml_loader import SafeLoader
+
+    class MkDocsLoader(SafeLoader):
+        """Safe loader that ignores MkDocs' python/name and !ENV style tags"""
+
+    MkDocsLoader.add_multi_constructor('tag:yaml.org,2002:python/', lambda loader, suffix, node: None)
+    MkDocsLoader.add_multi_constructor('!', lambda loader, suffix, node: None)
+
+    with open(mkdocs_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=MkDocsLoader) or {}
+
+    paths = []
+    def collect(entry):
+        if isinstance(entry, str):
+            if entry.endswith('.md') and '://' not in entry:
+                paths.append(posixpath.normpath(entry.replace(os.sep, '/')))
+        elif isinstance(entry, list):
+            for item in entry:
+                collect(item)
+        elif isinstance(entry, dict):
+            for value in entry.values():
+                collect(value)
+    collect(config.get('nav', []))
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description='Query a link graph saved by validate_links.py --graph')
+    parser.add_argument('graph', help='Link graph JSON file')
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument('--orphans', action='store_true', help='List documents no other document links to')
+    query.add_argument('--backlinks', metavar='DOC', help='List documents linking to DOC')
+    query.add_argument('--links', metavar='DOC', help='List documents DOC links to')
+    query.add_argument('--unreachable', action='store_true',
+                       help='List documents not reachable from the mkdocs.yml nav (graph of its docs_dir)')
+    query.add_argument('--path', nargs=2, metavar=('FROM', 'TO'), help='Shortest link path between two documents')
+    parser.add_argument('--mkdocs', default='mkdocs.yml', help='MkDocs config for --unreachable (default: mkdocs.yml)')
+    args = parser.parse_args()
+
+    try:
+        graph = LinkGraph.load(args.graph)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: Could not load link graph '{args.graph}': {e}", file=sys.stderr)
+        return 1
+
+    try:
+        if args.orphans:
+            results = graph.orphans()
+        elif args.backlinks:
+            results = graph.backlinks(args.backlinks)
+        elif args.links:
+            results = graph.links_from(args.links)
+        elif args.unreachable:
+            results = graph.unreachable(load_nav_paths(args.mkdocs))
+        else:
+            results = graph.shortest_path(*args.path)
+            if results is None:
+                print(f"No link path from {args.path[0]} to {args.path[1]}", file=sys.stderr)
+                return 1
+    except KeyError as e:
+        print(f"Error: {e.args[0]}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"Error: Could not read '{args.mkdocs}': {e}", file=sys.stderr)
+        return 1
+
+    for path in results:
+        print(path)
+    print(f"{len(results)} documents ({len(graph)} in graph, {graph.edge_count} links)", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
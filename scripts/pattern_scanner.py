@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Literal-Prefix Pattern Scanner
+
+Runs many regular expressions over a document without a full regex pass per
+pattern. Every pattern is compiled once and reduced to the literal text it
+must start with. Per document, each distinct literal is located once with
+str.find over the case-folded text, and patterns are only tried with
+re.match at the positions where their literal occurs. Results are exactly
+those of calling finditer for each pattern in turn, bucketed by family and
+category.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+REGEX_METACHARACTERS = set('\\[](){}.*+?|^$')
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters (and the
+# only character whose lower() is longer than one character); texts
+# containing them are scanned with plain finditer
+IGNORECASE_SPECIAL_CHARACTERS = 'İıſK'
+
+def has_top_level_alternation(pattern: str) -> bool:
+    """Whether pattern has an unescaped | outside any group or character class"""
+    class_start = None
+    depth = 0
+    position = 0
+    while position < len(pattern):
+        char = pattern[position]
+        if char == '\\':
+            position += 2
+            continue
+        if class_start is not None:
+            # A ] right after [ or [^ is a literal member of the class
+            if char == ']' and position > class_start:
+                class_start = None
+        elif char == '[':
+            class_start = position + 1
+            if pattern[class_start:class_start + 1] == '^':
+                class_start += 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        position += 1
+    return False
+
+def literal_prefix(pattern: str, ignore_case: bool = True) -> Optional[str]:
+    """The literal text every match of pattern starts with, or None if too short
+
+    Patterns with top-level alternation have no single required prefix and
+    get None; alternation inside a group ends the prefix like any group.
+    """
+    if has_top_level_alternation(pattern):
+        return None
+    prefix = []
+    for char in pattern:
+        if char in REGEX_METACHARACTERS:
+            if char in '?*{' and prefix:
+                # The quantifier makes the previous character optional
+                prefix.pop()
+            break
+        prefix.append(char)
+
+    literal = ''.join(prefix)
+    if ignore_case:
+        if not literal.isascii():
+            return None
+        literal = literal.lower()
+    return literal if len(literal) >= 2 else None
+
+class PatternRule:
+    """One compiled pattern of a family, with its required literal prefix"""
+
+    __slots__ = ('family', 'category', 'pattern', 'compiled', 'literal')
+
+    def __init__(self, family: str, category: Optional[str], pattern: str, flags: int):
+        self.family = family
+        self.category = category
+        self.pattern = pattern
+        self.compiled = re.compile(pattern, flags)
+        self.literal = literal_prefix(pattern, bool(flags & re.IGNORECASE))
+
+class PatternScanner:
+    """Scan documents for several families of regular expressions at once
+
+    families maps a family name to its (category, pattern) pairs, in the
+    order results should be reported.
+    """
+
+    def __init__(self, families: Dict[str, List[Tuple[Optional[str], str]]], flags: int = re.IGNORECASE):
+        self.ignore_case = bool(flags & re.IGNORECASE)
+        self.rules: Dict[str, List[PatternRule]] = {
+            family: [PatternRule(family, category, pattern, flags) for category, pattern in patterns]
+            for family, patterns in families.items()
+        }
+
+    def _literal_positions(self, text: str, literals: Iterable[str]) -> Dict[str, List[int]]:
+        positions = {}
+        for literal in literals:
+            found = []
+            position = text.find(literal)
+            while position >= 0:
+                found.append(position)
+                position = text.find(literal, position + 1)
+            positions[literal] = found
+        return positions
+
+    def _find_matches(self, rule: PatternRule, content: str, positions: Optional[Dict[str, List[int]]]) -> List:
+        if rule.literal is None or positions is None:
+            return list(rule.compiled.finditer(content))
+
+        # Same semantics as finditer: leftmost match at or after the end of
+        # the previous one; every match starts at an occurrence of the literal
+        matches = []
+        end = 0
+        for position in positions[rule.literal]:
+            if position < end:
+                continue
+            match = rule.compiled.match(content, position)
+            if match:
+                matches.append(match)
+                end = max(match.end(), position + 1)
+        return matches
+
+    def scan(self, content: str, families: Optional[Iterable[str]] = None) -> Dict[str, List[Tuple[PatternRule, List]]]:
+        """Match every pattern of the selected families (default: all)
+
+        Returns, per family, (rule, matches) pairs in table order, where
+        matches are the re.Match objects finditer would have produced.
+        """
+        selected = list(self.rules) if families is None else list(families)
+        rules = [rule for family in selected for rule in self.rules[family]]
+
+        positions = None
+        if not self.ignore_case:
+            text = content
+        elif content.isascii() or not any(char in content for char in IGNORECASE_SPECIAL_CHARACTERS):
+            # lower() maps every character to exactly one character here, so
+            # offsets in the folded text are offsets in the content
+            text = content.lower()
+        else:
+            text = None
+
+        if text is not None:
+            positions = self._literal_positions(text, {rule.literal for rule in rules if rule.literal is not None})
+
+        return {
+            family: [(rule, self._find_matches(rule, content, positions)) for rule in self.rules[family]]
+            for family in selected
+        }
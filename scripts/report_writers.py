@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Streaming Report Writers
+
+Shared building blocks for writing validation reports incrementally.
+Results are added to a writer one at a time as they are produced; the writer
+updates its summary counters and writes its output to a file handle. Parts
+of a report that follow a summary are spooled to temporary files until the
+summary is known, so memory use does not grow with the number of results.
+"""
+
+import io
+import json
+import shutil
+import tempfile
+from typing import Any, Iterable, TextIO
+
+class ReportSpool:
+    """Report text held in a temporary file until the report around it is written
+
+    append() stores every line with a leading newline, so copying the spool
+    directly after a line of text reproduces '\\n'.join over all lines.
+    """
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self.empty = True
+
+    def write(self, text: str):
+        if text:
+            self._file.write(text)
+            self.empty = False
+
+    def append(self, line: str):
+        self.write('\n' + line)
+
+    def extend(self, lines: Iterable[str]):
+        for line in lines:
+            self.append(line)
+
+    def copy_to(self, out: TextIO):
+        self._file.seek(0)
+        shutil.copyfileobj(self._file, out)
+
+    def close(self):
+        self._file.close()
+
+class ReportWriter:
+    """Base class for writers that add results one at a time
+
+    Subclasses implement add() and finish(); close() writes whatever the
+    report still needs once all results are in. Used as a context manager,
+    the report is finished on normal exit and abandoned on an exception.
+    """
+
+    def __init__(self, out: TextIO):
+        self.out = out
+        self._spools = []
+        self._closed = False
+
+    def spool(self) -> ReportSpool:
+        spool = ReportSpool()
+        self._spools.append(spool)
+        return spool
+
+    def write_lines(self, lines: Iterable[str]):
+        """Write lines each preceded by a newline, continuing a '\\n'-joined report"""
+        self.out.write(''.join('\n' + line for line in lines))
+
+    def add(self, result: Any):
+        raise NotImplementedError
+
+    def add_all(self, results: Iterable[Any]):
+        for result in results:
+            self.add(result)
+
+    def finish(self):
+        raise NotImplementedError
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.finish()
+        finally:
+            self._release()
+
+    def _release(self):
+        self._closed = True
+        for spool in self._spools:
+            spool.close()
+        self._spools = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._release()
+
+def render_report(writer_factory, results: Iterable[Any]) -> str:
+    """Run results through a writer into a string, for callers that want the whole report"""
+    buffer = io.StringIO()
+    with writer_factory(buffer) as writer:
+        writer.add_all(results)
+    return buffer.getvalue()
+
+def indented_json(value: Any, level: int) -> str:
+    """json.dumps(value, indent=2) as it appears nested level deep in an indent=2 document"""
+    return json.dumps(value, indent=2).replace('\n', '\n' + '  ' * level)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Multi-Snippet Matcher
+
+Aho-Corasick automaton over a set of code snippets. One pass over a source
+file finds every snippet that occurs in it and, for the ones that do not,
+the longest snippet prefix that does, so callers can report hits, misses and
+closest partial matches without searching the file once per snippet.
+Snippets and text are expected to be whitespace-normalized by the caller.
+
+ShingleIndex complements exact matching with approximate lookup: every
+indexed file is reduced to its set of k-token shingles, so the file and
+region most similar to a slightly stale snippet are found without diffing.
+"""
+
+import re
+from collections import Counter, deque
+from typing import Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+SHINGLE_SIZE = 5
+
+class SnippetMatch:
+    """Result of matching one snippet: the longest prefix found and where it starts"""
+
+    __slots__ = ('snippet', 'matched_chars', 'offset')
+
+    def __init__(self, snippet: str, matched_chars: int = 0, offset: Optional[int] = None):
+        self.snippet = snippet
+        self.matched_chars = matched_chars
+        self.offset = offset
+
+    @property
+    def found(self) -> bool:
+        return self.matched_chars == len(self.snippet)
+
+    @property
+    def ratio(self) -> float:
+        """Fraction of the snippet covered by the longest matching prefix"""
+        return self.matched_chars / len(self.snippet) if self.snippet else 1.0
+
+class SnippetAutomaton:
+    """Aho-Corasick automaton matching many snippets in a single scan"""
+
+    def __init__(self, snippets: List[str]):
+        self.snippets = list(snippets)
+        # Node 0 is the root; each node stores its outgoing edges, failure link and depth
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._depth: List[int] = [0]
+        self._paths: List[List[int]] = []
+
+        for snippet in self.snippets:
+            self._paths.append(self._insert(snippet))
+        self._order = self._link_failures()
+
+    def _insert(self, snippet: str) -> List[int]:
+        """Add a snippet to the trie; returns the nodes along its path"""
+        node = 0
+        path = []
+        for char in snippet:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._depth.append(self._depth[node] + 1)
+                self._goto[node][char] = next_node
+            node = next_node
+            path.append(node)
+        return path
+
+    def _link_failures(self) -> List[int]:
+        """Compute failure links breadth first; returns the nodes in BFS order"""
+        order = []
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                queue.append(child)
+        return order
+
+    def scan(self, text: str) -> List[SnippetMatch]:
+        """Match every snippet against text in one pass, in snippet order"""
+        goto = self._goto
+        fail = self._fail
+        first_end = [-1] * len(goto)
+
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if first_end[state] < 0:
+                first_end[state] = position
+
+        # A node's string also ends wherever a node failing to it ends;
+        # propagate the earliest end position down the failure links
+        for node in reversed(self._order):
+            end = first_end[node]
+            if end >= 0:
+                target = fail[node]
+                if target and (first_end[target] < 0 or end < first_end[target]):
+                    first_end[target] = end
+
+        matches = []
+        for snippet, path in zip(self.snippets, self._paths):
+            # Like str.find, an empty snippet matches at the start
+            match = SnippetMatch(snippet, 0, None if snippet else 0)
+            # Every prefix occurring in the text is marked, so the deepest
+            # marked node on the path is the longest occurring prefix
+            for node in reversed(path):
+                end = first_end[node]
+                if end >= 0:
+                    match.matched_chars = self._depth[node]
+                    match.offset = end - self._depth[node] + 1
+                    break
+            matches.append(match)
+        return matches
+
+def make_shingles(tokens: List[str], size: int = SHINGLE_SIZE) -> FrozenSet[Tuple[str, ...]]:
+    """The set of runs of size consecutive tokens"""
+    return frozenset(zip(*(tokens[offset:] for offset in range(size))))
+
+class FuzzyMatch:
+    """Most similar region of an indexed file: character span and shingle containment"""
+
+    __slots__ = ('key', 'similarity', 'start', 'end')
+
+    def __init__(self, key: Hashable, similarity: float, start: int, end: int):
+        self.key = key
+        self.similarity = similarity
+        self.start = start
+        self.end = end
+
+class ShingleIndex:
+    """k-token shingle sets of many files for approximate snippet lookup
+
+    Similarity is containment: the fraction of the snippet's distinct
+    shingles that also occur in the file (or region), so one renamed
+    identifier only costs the shingles that include it.
+    """
+
+    def __init__(self, size: int = SHINGLE_SIZE):
+        self.size = size
+        self._keys: List[Hashable] = []
+        self._shingles: List[FrozenSet[Tuple[str, ...]]] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Hashable, text: str):
+        self._keys.append(key)
+        self._shingles.append(make_shingles(TOKEN_PATTERN.findall(text), self.size))
+
+    def snippet_shingles(self, snippet: str) -> FrozenSet[Tuple[str, ...]]:
+        return make_shingles(TOKEN_PATTERN.findall(snippet), self.size)
+
+    def best_files(self, snippet: str, limit: int = 3) -> List[Tuple[float, Hashable]]:
+        """The indexed files containing the largest share of the snippet's shingles"""
+        wanted = self.snippet_shingles(snippet)
+        if not wanted:
+            return []
+
+        scored = []
+        for key, shingles in zip(self._keys, self._shingles):
+            shared = len(wanted & shingles)
+            if shared:
+                scored.append((shared / len(wanted), key))
+        scored.sort(key=lambda item: -item[0])
+        return scored[:limit]
+
+    def locate(self, snippet: str, text: str) -> Optional[Tuple[float, int, int]]:
+        """Find the snippet-sized window of text sharing the most snippet shingles
+
+        Returns the similarity and the character span from the first to the
+        last matching shingle of that window.
+        """
+        wanted = self.snippet_shingles(snippet)
+        if not wanted:
+            return None
+
+        size = self.size
+        spans = [match.span() for match in TOKEN_PATTERN.finditer(text)]
+        tokens = [text[start:end] for start, end in spans]
+        hits = [(position, shingle)
+                for position, shingle in enumerate(zip(*(tokens[offset:] for offset in range(size))))
+                if shingle in wanted]
+        if not hits:
+            return None
+
+        # Slide a window as long as the snippet over the hit positions,
+        # counting distinct shared shingles
+        window = max(len(TOKEN_PATTERN.findall(snippet)) - size + 1, 1)
+        in_window = Counter()
+        best = (0, 0, 0)
+        first = 0
+        for last, (position, shingle) in enumerate(hits):
+            in_window[shingle] += 1
+            while hits[first][0] <= position - window:
+                dropped = hits[first][1]
+                in_window[dropped] -= 1
+                if not in_window[dropped]:
+                    del in_window[dropped]
+                first += 1
+            if len(in_window) > best[0]:
+                best = (len(in_window), first, last)
+
+        shared, first, last = best
+        start = spans[hits[first][0]][0]
+        end = spans[hits[last][0] + size - 1][1]
+        return shared / len(wanted), start, end
+
+    def best_match(self, snippet: str, read_text: Callable[[Hashable], str], limit: int = 3) -> Optional[FuzzyMatch]:
+        """Most similar region among the limit best files; read_text loads a file by key"""
+        best = None
+        for file_score, key in self.best_files(snippet, limit):
+            if best is not None and file_score <= best.similarity:
+                break
+            try:
+                located = self.locate(snippet, read_text(key))
+            except (OSError, UnicodeDecodeError):
+                continue
+            if located and (best is None or located[0] > best.similarity):
+                best = FuzzyMatch(key, *located)
+        return best
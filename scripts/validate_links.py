@@ -4,15 +4,337 @@ Documentation Link Validation Script
 Systematically validates all markdown links in the documentation
 """
 
+import argparse
+import html
 import os
 import re
 import sys
+import unicodedata
+from bisect import bisect_right
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import FrozenSet, Iterable, Iterator, List, Dict, Optional, Set, TextIO, Tuple
+from urllib.parse import unquote
+
+from link_graph import LinkGraphBuilder
+from report_writers import ReportWriter, render_report
+
+# Markdown links [text](url)
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+NEWLINE_PATTERN = re.compile(r'\n')
+
+# Heading and anchor syntax as Python-Markdown (MkDocs) parses it
+YAML_FRONTMATTER_PATTERN = re.compile(r'^-{3}[ \t]*\n.*?\n(?:\.{3}|-{3})[ \t]*(?:\n|$)', re.DOTALL)
+ATX_HEADING_PATTERN = re.compile(r'^(#{1,6})(.*?)#*[ \t]*$')
+SETEXT_UNDERLINE_PATTERN = re.compile(r'^[=-]+[ ]*$')
+FENCE_OPEN_PATTERN = re.compile(r'^[ \t]*(`{3,}|~{3,})')
+HEADING_ATTR_LIST_PATTERN = re.compile(r'[ ]+\{:?([^}\n]*)\}[ ]*$')
+ATTR_LIST_ID_PATTERN = re.compile(r'\{:?[^}\n]*?#([^\s}]+)[^}\n]*\}')
+HTML_ID_PATTERN = re.compile(r'<[a-zA-Z][^>]*?\s(?:id|name)\s*=\s*["\']([^"\']+)["\']')
+CODE_SPAN_PATTERN = re.compile(r'(?<!\\)(`+)(.+?)(?<!`)\1(?!`)')
+ESCAPED_CHAR_PATTERN = re.compile(r'\\([\\`*_{}\[\]()>#+\-.!])')
+INLINE_LINK_PATTERN = re.compile(r'(!?)\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])')
+UNDERSCORE_EMPHASIS_PATTERN = re.compile(r'(?<!\w)(_{1,3})(?!_)(.+?)(?<!_)\1(?!\w)')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+# pymdownx.emoji shortcodes render as images or icons without text
+EMOJI_SHORTCODE_PATTERN = re.compile(r':[+\-\w]*[a-zA-Z][+\-\w]*:')
+DUPLICATE_ID_PATTERN = re.compile(r'^(.*)_([0-9]+)$')
+
+def slugify(value: str, separator: str = '-') -> str:
+    """Python-Markdown's toc slugify, which MkDocs uses for heading ids"""
+    value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
+    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
+    return re.sub(r'[{}\s]+'.format(separator), separator, value)
+
+def unique_id(anchor: str, used_ids: Set[str]) -> str:
+    """Disambiguate a heading id the way the toc extension does (_1, _2, ...)"""
+    while anchor in used_ids or not anchor:
+        match = DUPLICATE_ID_PATTERN.match(anchor)
+        if match:
+            anchor = f"{match.group(1)}_{int(match.group(2)) + 1}"
+        else:
+            anchor = f"{anchor}_1"
+    used_ids.add(anchor)
+    return anchor
+
+def heading_plain_text(text: str) -> str:
+    """Approximate the text content Python-Markdown renders for heading markup"""
+    parts = []
+    position = 0
+    for match in CODE_SPAN_PATTERN.finditer(text):
+        parts.append(_inline_plain_text(text[position:match.start()]))
+        parts.append(match.group(2).strip())
+        position = match.end()
+    parts.append(_inline_plain_text(text[position:]))
+    return html.unescape(''.join(parts))
+
+def _inline_plain_text(text: str) -> str:
+    # Escaped characters are kept out of the emphasis rules, then restored
+    escaped = []
+    def stash(match):
+        escaped.append(match.group(1))
+        return f"\x02{len(escaped) - 1}\x03"
+    text = ESCAPED_CHAR_PATTERN.sub(stash, text)
+    text = INLINE_LINK_PATTERN.sub(lambda match: '' if match.group(1) else match.group(2), text)
+    text = HTML_TAG_PATTERN.sub('', text)
+    text = EMOJI_SHORTCODE_PATTERN.sub('', text)
+    previous = None
+    while previous != text:
+        previous = text
+        text = UNDERSCORE_EMPHASIS_PATTERN.sub(r'\2', text)
+    return re.sub('\x02(\\d+)\x03', lambda match: escaped[int(match.group(1))], text)
+
+def scan_headings(content: str) -> Tuple[List[Tuple[int, str, int]], Set[str], List[Tuple[int, int, str]]]:
+    """Headings of a Markdown document, its explicit ids and code fences
+    
+    Returns the ATX and setext headings outside code fences as (level,
+    text, line number), the ids set by attr lists and raw HTML id and
+    name attributes, and the fenced code blocks as (opening line, closing
+    line, info string). An unclosed fence runs to the last line.
+    """
+    line_number = 0
+    frontmatter = YAML_FRONTMATTER_PATTERN.match(content)
+    if frontmatter:
+        line_number = content.count('\n', 0, frontmatter.end())
+        content = content[frontmatter.end():]
+    
+    headings = []
+    explicit_ids = set()
+    code_fences = []
+    open_fence = None
+    previous_line = ''
+    block_start = True
+    for line in content.split('\n'):
+        line_number += 1
+        fence = FENCE_OPEN_PATTERN.match(line)
+        if open_fence is not None:
+            marker, start_line, info = open_fence
+            if fence and fence.group(1)[0] == marker[0] and len(fence.group(1)) >= len(marker) \
+                    and not line[fence.end():].strip():
+                code_fences.append((start_line, line_number, info))
+                open_fence = None
+                previous_line, block_start = '', True
+            continue
+        if fence:
+            open_fence = (fence.group(1), line_number, line[fence.end():].strip())
+            continue
+        
+        explicit_ids.update(ATTR_LIST_ID_PATTERN.findall(line))
+        explicit_ids.update(HTML_ID_PATTERN.findall(line))
+        
+        heading = ATX_HEADING_PATTERN.match(line)
+        if heading:
+            headings.append((len(heading.group(1)), heading.group(2).strip(), line_number))
+            previous_line, block_start = '', True
+            continue
+        if (SETEXT_UNDERLINE_PATTERN.match(line) and previous_line.strip() and block_start):
+            headings.append((1 if line[0] == '=' else 2, previous_line.strip(), line_number - 1))
+            previous_line, block_start = '', True
+            continue
+        
+        # A setext heading's text must be the first line of its block
+        block_start = not previous_line.strip()
+        previous_line = line
+    
+    if open_fence is not None:
+        code_fences.append((open_fence[1], line_number, open_fence[2]))
+    
+    return headings, explicit_ids, code_fences
+
+def heading_anchors(headings: List[Tuple[int, str, int]], explicit_ids: Set[str]) -> FrozenSet[str]:
+    """Ids a document with these headings gets when MkDocs renders it
+    
+    Headings get their explicit attr_list id or a slug of their text, made
+    unique like the toc extension does.
+    """
+    anchors = set(explicit_ids)
+    for level, text, line_number in headings:
+        attr_list = HEADING_ATTR_LIST_PATTERN.search(text)
+        if attr_list:
+            text = text[:attr_list.start()]
+            if any(token.startswith('#') for token in attr_list.group(1).split()):
+                continue
+        unique_id(slugify(heading_plain_text(text)), anchors)
+    return frozenset(anchors)
+
+def extract_anchors(content: str) -> FrozenSet[str]:
+    """Ids a Markdown document gets when MkDocs renders it"""
+    headings, explicit_ids, code_fences = scan_headings(content)
+    return heading_anchors(headings, explicit_ids)
+
+class AnchorIndex:
+    """Heading anchors per document, computed at most once per file
+    
+    Documents are indexed from content already read during a scan via
+    add_document (or add_headings, when the headings were scanned already),
+    or read on first lookup otherwise.
+    """
+    
+    def __init__(self):
+        self._anchors: Dict[str, Optional[FrozenSet[str]]] = {}
+    
+    @staticmethod
+    def _key(path) -> str:
+        return os.path.normcase(os.path.abspath(path))
+    
+    def add_document(self, path, content: str):
+        self._anchors[self._key(path)] = extract_anchors(content)
+    
+    def add_headings(self, path, headings: List[Tuple[int, str, int]], explicit_ids: Set[str]):
+        """Index a document from the result of scan_headings"""
+        self._anchors[self._key(path)] = heading_anchors(headings, explicit_ids)
+    
+    def get(self, path) -> Optional[FrozenSet[str]]:
+        """Anchors already indexed for path, without reading it"""
+        return self._anchors.get(self._key(path))
+    
+    def anchors(self, path) -> Optional[FrozenSet[str]]:
+        """Anchors of path, reading and indexing it if needed; None if unreadable"""
+        key = self._key(path)
+        if key not in self._anchors:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._anchors[key] = extract_anchors(f.read())
+            except (OSError, UnicodeDecodeError):
+                self._anchors[key] = None
+        return self._anchors[key]
+    
+    def has_anchor(self, path, fragment: str) -> bool:
+        anchors = self.anchors(path)
+        return anchors is not None and unquote(fragment) in anchors
+
+# Valid links listed in the report; the rest are only counted
+VALID_LINKS_SHOWN = 10
+
+class LinkRecord:
+    """One Markdown link
+    
+    Links extracted from a file share that file's Path object, and URLs are
+    interned, so repeated targets cost one string between them.
+    """
+    
+    __slots__ = ('text', 'url', 'source_file', 'line_number', 'column')
+    
+    def __init__(self, text: str, url: str, source_file: Path, line_number: int, column: int):
+        self.text = text
+        self.url = url
+        self.source_file = source_file
+        self.line_number = line_number
+        self.column = column
+
+class LinkResults:
+    """Validated links grouped by status
+    
+    Statuses listed in counted_only are counted without keeping their
+    links, except for the valid links shown in the report. External URLs
+    are always counted per URL.
+    """
+    
+    STATUSES = ('broken', 'valid', 'external', 'planned', 'other', 'anchor', 'mailto')
+    
+    def __init__(self, counted_only: Iterable[str] = ()):
+        self.counted_only = frozenset(counted_only)
+        self.counts = Counter()
+        self.links: Dict[str, List[LinkRecord]] = {status: [] for status in self.STATUSES}
+        self.external_urls = Counter()
+    
+    def add(self, status: str, link: LinkRecord):
+        self.counts[status] += 1
+        if status == 'external':
+            self.external_urls[link.url] += 1
+        if status not in self.counted_only or (status == 'valid' and len(self.links['valid']) < VALID_LINKS_SHOWN):
+            self.links[status].append(link)
+    
+    def __getitem__(self, status: str) -> List[LinkRecord]:
+        return self.links[status]
+    
+    @property
+    def total_links(self) -> int:
+        return sum(self.counts.values())
+
+def line_start_offsets(content: str) -> List[int]:
+    """Return the character offset at which each line of content starts"""
+    return [0] + [match.end() for match in NEWLINE_PATTERN.finditer(content)]
+
+def offset_to_line_column(line_starts: List[int], offset: int) -> Tuple[int, int]:
+    """Map a character offset to a 1-based (line, column) pair"""
+    line_index = bisect_right(line_starts, offset) - 1
+    return line_index + 1, offset - line_starts[line_index] + 1
+
+class PathResolver:
+    """Link target existence checks against a snapshot of the tree taken once
+    
+    Every file and directory under root is recorded up front, so targets
+    inside the tree are set lookups instead of resolve() and stat calls, and
+    each (source directory, url) pair is answered only once. Targets outside
+    the tree, absolute URLs, and trees containing symlinks (where lexical
+    normalization may disagree with resolve()) fall back to the filesystem.
+    """
+    
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.paths: Set[str] = {os.curdir}
+        self.has_symlinks = False
+        self._memo: Dict[Tuple[str, str], bool] = {}
+        self._relative_dirs: Dict[str, str] = {}
+        self.lookups = 0
+        self.memo_hits = 0
+        self.snapshot_lookups = 0
+        self.filesystem_checks = 0
+        self._take_snapshot()
+    
+    def _take_snapshot(self):
+        for dirpath, dirs, files in os.walk(self.root):
+            relative_dir = os.path.relpath(dirpath, self.root)
+            for name in dirs + files:
+                path = os.path.join(dirpath, name)
+                if os.path.islink(path):
+                    self.has_symlinks = True
+                self.paths.add(os.path.normcase(os.path.normpath(os.path.join(relative_dir, name))))
+    
+    def _relative_dir(self, source_dir: str) -> str:
+        relative_dir = self._relative_dirs.get(source_dir)
+        if relative_dir is None:
+            relative_dir = os.path.relpath(os.path.abspath(source_dir), self.root)
+            self._relative_dirs[source_dir] = relative_dir
+        return relative_dir
+    
+    def exists(self, source_dir: Path, url: str) -> bool:
+        """Whether url, relative to source_dir, names an existing file or directory"""
+        self.lookups += 1
+        key = (str(source_dir), url)
+        found = self._memo.get(key)
+        if found is not None:
+            self.memo_hits += 1
+            return found
+        
+        target = os.path.normpath(os.path.join(self._relative_dir(key[0]), url))
+        if (self.has_symlinks or os.path.isabs(url)
+                or target == os.pardir or target.startswith(os.pardir + os.sep)):
+            self.filesystem_checks += 1
+            try:
+                found = (source_dir / url).resolve().exists()
+            except Exception:
+                found = False
+        else:
+            self.snapshot_lookups += 1
+            found = os.path.normcase(target) in self.paths
+        
+        self._memo[key] = found
+        return found
+    
+    def summary(self) -> str:
+        hit_rate = self.memo_hits / self.lookups * 100 if self.lookups else 0.0
+        return (f"{self.lookups} lookups, {self.memo_hits} memo hits ({hit_rate:.1f}%), "
+                f"{self.snapshot_lookups} snapshot lookups, {self.filesystem_checks} filesystem checks "
+                f"({self.lookups - self.filesystem_checks} saved)")
 
 class LinkValidator:
-    def __init__(self, docs_root: str = "docs"):
+    def __init__(self, docs_root: str = "docs", snapshot: bool = False):
         self.docs_root = Path(docs_root)
+        # Tree snapshot for link targets; off for long-running callers whose tree changes
+        self.resolver: Optional[PathResolver] = PathResolver(docs_root) if snapshot else None
+        self.anchors = AnchorIndex()
         self.broken_links = []
         self.valid_links = []
         self.external_links = []
@@ -25,52 +347,43 @@ class LinkValidator:
             markdown_files.append(path)
         return markdown_files
     
-    def extract_links(self, file_path: Path) -> List[Dict]:
+    def extract_links(self, file_path: Path) -> List[LinkRecord]:
         """Extract all markdown links from a file"""
-        links = []
-        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-                
-            # Find all markdown links [text](url)
-            link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-            matches = re.findall(link_pattern, content)
-            
-            for text, url in matches:
-                links.append({
-                    'text': text,
-                    'url': url,
-                    'source_file': file_path,
-                    'line_number': self._find_line_number(content, text, url)
-                })
-                
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
-            
-        return links
+            return []
+        
+        # Index the document's heading anchors while its content is at hand
+        self.anchors.add_document(file_path, content)
+        return self.extract_links_from_content(file_path, content)
     
-    def _find_line_number(self, content: str, text: str, url: str) -> int:
-        """Find the line number of a link in the content"""
-        lines = content.split('\n')
-        link_pattern = f'[{re.escape(text)}]({re.escape(url)})'
+    def extract_links_from_content(self, file_path: Path, content: str) -> List[LinkRecord]:
+        """Extract all markdown links from already-read file content"""
+        links = []
+        line_starts = line_start_offsets(content)
         
-        for i, line in enumerate(lines, 1):
-            if link_pattern in line:
-                return i
-        return 0
+        for match in LINK_PATTERN.finditer(content):
+            line_number, column = offset_to_line_column(line_starts, match.start())
+            links.append(LinkRecord(match.group(1), sys.intern(match.group(2)), file_path, line_number, column))
+        
+        return links
     
-    def validate_link(self, link: Dict) -> str:
+    def validate_link(self, link: LinkRecord) -> str:
         """Validate a single link and return its status"""
-        url = link['url']
-        source_file = link['source_file']
+        url = link.url
+        source_file = link.source_file
         
         # Skip external links (http/https)
         if url.startswith(('http://', 'https://')):
             return 'external'
         
-        # Skip anchors within the same document
+        # Anchors within the same document must name one of its headings
         if url.startswith('#'):
+            if len(url) > 1 and not self.anchors.has_anchor(source_file, url[1:]):
+                return 'broken'
             return 'anchor'
         
         # Skip mailto links
@@ -78,170 +391,258 @@ class LinkValidator:
             return 'mailto'
         
         # Check for planned link markers
-        if '🔄 PLANNED' in link['text'] or 'PLANNED' in url:
+        if '🔄 PLANNED' in link.text or 'PLANNED' in url:
             return 'planned'
         
-        # Resolve relative path
-        if url.endswith('.md'):
+        # Resolve relative path, checking the fragment of file.md#section links
+        path, _, fragment = url.partition('#')
+        if path.endswith('.md'):
             # Calculate absolute path from source file
             source_dir = source_file.parent
-            target_path = source_dir / url
+            if self.resolver is not None:
+                exists = self.resolver.exists(source_dir, path)
+            else:
+                # Normalize the path
+                try:
+                    exists = (source_dir / path).resolve().exists()
+                except Exception as e:
+                    exists = False
             
-            # Normalize the path
-            try:
-                target_path = target_path.resolve()
-                
-                # Check if file exists
-                if target_path.exists():
-                    return 'valid'
-                else:
-                    return 'broken'
-                    
-            except Exception as e:
+            if not exists:
+                return 'broken'
+            if fragment and not self.anchors.has_anchor(source_dir / path, fragment):
                 return 'broken'
+            return 'valid'
         
         # Other link types (assume valid for now)
         return 'other'
     
-    def validate_all_links(self) -> Dict:
-        """Validate all links in all markdown files"""
-        results = {
-            'broken': [],
-            'valid': [],
-            'external': [],
-            'planned': [],
-            'other': [],
-            'anchor': [],
-            'mailto': []
-        }
-        
-        markdown_files = self.find_markdown_files()
+    def iter_validated_links(self, markdown_files: Optional[List[Path]] = None) -> Iterator[Tuple[str, LinkRecord]]:
+        """Yield (status, link) for every link, file by file"""
+        if markdown_files is None:
+            markdown_files = self.find_markdown_files()
         
         print(f"Found {len(markdown_files)} markdown files")
         
         for file_path in markdown_files:
-            links = self.extract_links(file_path)
-            
-            for link in links:
-                status = self.validate_link(link)
-                results[status].append(link)
+            for link in self.extract_links(file_path):
+                yield self.validate_link(link), link
+    
+    def validate_all_links(self, counters_only: bool = False) -> LinkResults:
+        """Validate all links in all markdown files
+        
+        With counters_only, valid and external links are counted rather
+        than kept, which is all the report needs from them.
+        """
+        results = LinkResults(counted_only=('valid', 'external') if counters_only else ())
+        
+        for status, link in self.iter_validated_links():
+            results.add(status, link)
         
         return results
     
-    def generate_report(self, results: Dict) -> str:
+    def generate_report(self, results: LinkResults) -> str:
         """Generate a detailed report of link validation results"""
-        report = []
-        report.append("# Documentation Link Validation Report")
-        report.append("")
-        
-        # Summary
-        total_links = sum(len(links) for links in results.values())
-        report.append(f"## Summary")
-        report.append(f"- **Total Links**: {total_links}")
-        report.append(f"- **Broken Links**: {len(results['broken'])}")
-        report.append(f"- **Valid Links**: {len(results['valid'])}")
-        report.append(f"- **External Links**: {len(results['external'])}")
-        report.append(f"- **Planned Links**: {len(results['planned'])}")
-        report.append(f"- **Other Links**: {len(results['other'])}")
-        report.append("")
+        return render_report(lambda out: LinkReportWriter(out, self.resolver, results), [])
+    
+    def generate_cleanup_script(self, results: LinkResults) -> str:
+        """Generate a script to help clean up broken links"""
+        return render_report(CleanupScriptWriter, (('broken', link) for link in results['broken']))
+
+class LinkReportWriter(ReportWriter):
+    """Markdown link report
+    
+    Links added one at a time are only counted, except broken links, which
+    are spooled until the summary is known. Given finished results, the
+    writer reports those instead. external_checks, when set before the
+    report is finished, adds the external_link_checker result to each
+    external URL.
+    """
+    
+    def __init__(self, out: TextIO, resolver: Optional[PathResolver] = None,
+                 results: Optional[LinkResults] = None):
+        super().__init__(out)
+        self.resolver = resolver
+        self.results = results if results is not None else LinkResults(counted_only=LinkResults.STATUSES)
+        self.broken_section = self.spool()
+        self.external_checks: Optional[Dict] = None
+    
+    @property
+    def counts(self) -> Counter:
+        return self.results.counts
+    
+    @property
+    def total_links(self) -> int:
+        return self.results.total_links
+    
+    def add(self, validated: Tuple[str, LinkRecord]):
+        status, link = validated
+        self.results.add(status, link)
+        if status == 'broken':
+            self.broken_section.extend(self._broken_link_lines(link))
+    
+    def _broken_link_lines(self, link: LinkRecord) -> List[str]:
+        return [
+            f"- **File**: `{link.source_file}`",
+            f"  - **Line**: {link.line_number}",
+            f"  - **Text**: {link.text}",
+            f"  - **URL**: `{link.url}`",
+            ""
+        ]
+    
+    def finish(self):
+        counts = self.results.counts
+        self.out.write('\n'.join([
+            "# Documentation Link Validation Report",
+            "",
+            "## Summary",
+            f"- **Total Links**: {self.total_links}",
+            f"- **Broken Links**: {counts['broken']}",
+            f"- **Valid Links**: {counts['valid']}",
+            f"- **External Links**: {counts['external']}",
+            f"- **Planned Links**: {counts['planned']}",
+            f"- **Other Links**: {counts['other']}"
+        ]))
+        if self.external_checks is not None:
+            broken_external = sum(1 for result in self.external_checks.values() if result.state == 'broken')
+            self.write_lines([f"- **Broken External Links**: {broken_external}"])
+        if self.resolver is not None:
+            self.write_lines([f"- **Path Resolution**: {self.resolver.summary()}"])
+        self.write_lines([""])
         
         # Broken links detail
-        if results['broken']:
-            report.append("## Broken Links (High Priority)")
-            report.append("")
-            for link in results['broken']:
-                report.append(f"- **File**: `{link['source_file']}`")
-                report.append(f"  - **Line**: {link['line_number']}")
-                report.append(f"  - **Text**: {link['text']}")
-                report.append(f"  - **URL**: `{link['url']}`")
-                report.append("")
+        if counts['broken']:
+            self.write_lines(["## Broken Links (High Priority)", ""])
+            if 'broken' in self.results.counted_only:
+                self.broken_section.copy_to(self.out)
+            else:
+                for link in self.results['broken']:
+                    self.write_lines(self._broken_link_lines(link))
         
         # Valid links
-        if results['valid']:
-            report.append("## Valid Links")
-            report.append("")
-            for link in results['valid'][:10]:  # Show first 10
-                report.append(f"- `{link['source_file']}` → `{link['url']}`")
-            if len(results['valid']) > 10:
-                report.append(f"- ... and {len(results['valid']) - 10} more")
-            report.append("")
+        if counts['valid']:
+            self.write_lines(["## Valid Links", ""])
+            self.write_lines(f"- `{link.source_file}` → `{link.url}`" for link in self.results['valid'][:VALID_LINKS_SHOWN])
+            if counts['valid'] > VALID_LINKS_SHOWN:
+                self.write_lines([f"- ... and {counts['valid'] - VALID_LINKS_SHOWN} more"])
+            self.write_lines([""])
         
         # External links
-        if results['external']:
-            report.append("## External Links")
-            report.append("")
-            external_urls = set(link['url'] for link in results['external'])
-            for url in sorted(external_urls):
-                count = sum(1 for link in results['external'] if link['url'] == url)
-                report.append(f"- `{url}` (used {count} times)")
-            report.append("")
-        
-        return '\n'.join(report)
-    
-    def generate_cleanup_script(self, results: Dict) -> str:
-        """Generate a script to help clean up broken links"""
-        script = []
-        script.append("#!/bin/bash")
-        script.append("# Generated link cleanup script")
-        script.append("")
-        
-        if results['broken']:
-            script.append("echo 'Broken links found in the following files:'")
-            
-            # Group by file
-            files_with_broken_links = {}
-            for link in results['broken']:
-                file_path = str(link['source_file'])
-                if file_path not in files_with_broken_links:
-                    files_with_broken_links[file_path] = []
-                files_with_broken_links[file_path].append(link)
-            
-            for file_path, links in files_with_broken_links.items():
-                script.append(f"echo '  {file_path}:'")
-                for link in links:
-                    script.append(f"echo '    Line {link['line_number']}: [{link['text']}]({link['url']})'")
-                script.append("")
+        if self.results.external_urls:
+            self.write_lines(["## External Links", ""])
+            self.write_lines(self._external_link_line(url, count) for url, count in sorted(self.results.external_urls.items()))
+            self.write_lines([""])
+    
+    def _external_link_line(self, url: str, count: int) -> str:
+        line = f"- `{url}` (used {count} times)"
+        result = self.external_checks.get(url) if self.external_checks is not None else None
+        if result is not None:
+            line += f" - {result.state}: {result.describe()}"
+        return line
+
+class CleanupScriptWriter(ReportWriter):
+    """Shell script listing broken links per file, written as links arrive
+    
+    Links of one source file are expected to arrive together, as
+    iter_validated_links produces them.
+    """
+    
+    def __init__(self, out: TextIO):
+        super().__init__(out)
+        self.current_file = None
+        self.out.write('\n'.join([
+            "#!/bin/bash",
+            "# Generated link cleanup script",
+            ""
+        ]))
+    
+    def add(self, validated: Tuple[str, LinkRecord]):
+        status, link = validated
+        if status != 'broken':
+            return
         
-        return '\n'.join(script)
+        file_path = str(link.source_file)
+        if self.current_file is None:
+            self.write_lines(["echo 'Broken links found in the following files:'"])
+        if file_path != self.current_file:
+            if self.current_file is not None:
+                self.write_lines([""])
+            self.current_file = file_path
+            self.write_lines([f"echo '  {file_path}:'"])
+        self.write_lines([f"echo '    Line {link.line_number}: [{link.text}]({link.url})'"])
+    
+    def finish(self):
+        if self.current_file is not None:
+            self.write_lines([""])
 
 def main():
     """Main execution function"""
-    if len(sys.argv) > 1:
-        docs_root = sys.argv[1]
-    else:
-        docs_root = "docs"
+    parser = argparse.ArgumentParser(description='Validate Markdown links in the documentation')
+    parser.add_argument('docs_root', nargs='?', default='docs',
+                        help='Documentation directory to scan (default: docs)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and recheck links as Markdown files are saved')
+    parser.add_argument('--graph', metavar='PATH',
+                        help='Also save the document link graph to PATH for link_graph.py queries')
+    parser.add_argument('--check-external', action='store_true',
+                        help='Also request every external URL (see external_link_checker.py)')
+    parser.add_argument('--external-cache', metavar='PATH', default='.external-link-cache.json',
+                        help='Result cache for --check-external (default: .external-link-cache.json)')
+    args = parser.parse_args()
+    docs_root = args.docs_root
     
-    validator = LinkValidator(docs_root)
+    if args.watch:
+        from corpus_watch import run_watch
+        return run_watch(docs_root, {'links'})
     
-    print("Starting link validation...")
-    results = validator.validate_all_links()
+    validator = LinkValidator(docs_root, snapshot=True)
     
-    # Generate report
-    report = validator.generate_report(results)
+    print("Starting link validation...")
     
-    # Save report
-    with open("link_validation_report.md", "w", encoding="utf-8") as f:
-        f.write(report)
+    markdown_files = validator.find_markdown_files()
+    graph_builder = None
+    if args.graph:
+        graph_builder = LinkGraphBuilder(docs_root)
+        for file_path in markdown_files:
+            graph_builder.add_document(file_path)
     
-    # Generate cleanup script
-    cleanup_script = validator.generate_cleanup_script(results)
+    # Write the report and cleanup script while links are validated
+    with open("link_validation_report.md", "w", encoding="utf-8") as report_file, \
+            open("cleanup_broken_links.sh", "w", encoding="utf-8") as script_file:
+        with LinkReportWriter(report_file, validator.resolver) as report, CleanupScriptWriter(script_file) as cleanup_script:
+            for validated in validator.iter_validated_links(markdown_files):
+                report.add(validated)
+                cleanup_script.add(validated)
+                if graph_builder is not None and validated[0] == 'valid':
+                    graph_builder.add_link(validated[1].source_file, validated[1].url)
+            
+            if args.check_external:
+                # Imported lazily so link validation does not load asyncio and http.client
+                from external_link_checker import check_external_links, summarize
+                print(f"Checking {len(report.results.external_urls)} external URLs...")
+                report.external_checks = check_external_links(report.results.external_urls, args.external_cache)
     
-    with open("cleanup_broken_links.sh", "w", encoding="utf-8") as f:
-        f.write(cleanup_script)
+    if graph_builder is not None:
+        graph = graph_builder.build()
+        graph.save(args.graph)
+        print(f"Link graph saved to: {args.graph} ({len(graph)} documents, {graph.edge_count} links)")
     
     print(f"Validation complete!")
     print(f"Report saved to: link_validation_report.md")
     print(f"Cleanup script saved to: cleanup_broken_links.sh")
     
     # Print summary
-    total_links = sum(len(links) for links in results.values())
-    broken_count = len(results['broken'])
+    broken_count = report.counts['broken']
     
     print(f"\nSummary:")
-    print(f"  Total links: {total_links}")
+    print(f"  Total links: {report.total_links}")
     print(f"  Broken links: {broken_count}")
-    print(f"  Valid links: {len(results['valid'])}")
-    print(f"  External links: {len(results['external'])}")
+    print(f"  Valid links: {report.counts['valid']}")
+    print(f"  External links: {report.counts['external']}")
+    if report.external_checks is not None:
+        print(f"  External link check: {summarize(report.external_checks)}")
+        broken_count += sum(1 for result in report.external_checks.values() if result.state == 'broken')
+    print(f"  Path resolution: {validator.resolver.summary()}")
     
     if broken_count > 0:
         print(f"\n⚠️  {broken_count} broken links found!")
@@ -16,22 +16,39 @@ Options:
     --output FORMAT     Output format: text, json, csv (default: text)
     --strict            Enable strict mode (fail on warnings)
     --quiet             Suppress non-error output
+    --jobs N            Validate files in N worker processes (0 = one per CPU)
+    --cache-file PATH   Reuse results for unchanged files from an on-disk cache
+    --changed-since REF Only validate Markdown files changed since a git ref
+    --baseline PATH     JSON report used for corpus-wide totals with --changed-since
+    --watch             Keep running and revalidate files as they are saved
     --help              Show this help message
 """
 
 import os
 import sys
 import re
-import yaml
 import argparse
 import json
 import csv
+import hashlib
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, TextIO, Tuple, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 
+import yaml_loader
+from report_writers import ReportWriter, indented_json, render_report
+from frontmatter_extractor import (
+    DEFAULT_MAX_HEADER_LINES, HEADER_TOO_LONG, MISSING_CLOSING, MISSING_OPENING,
+    read_frontmatter_lines, split_frontmatter
+)
+
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+VERSION_PATTERN = re.compile(r'^\d+\.\d+(\.\d+)?$')
+
 class ValidationLevel(Enum):
     ERROR = "ERROR"
     WARNING = "WARNING"
@@ -68,6 +85,114 @@ class ValidationResult:
         self.issues.append(ValidationIssue(self.file_path, level, field, message, line_number))
         if level == ValidationLevel.ERROR:
             self.is_compliant = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'file_path': self.file_path,
+            'is_compliant': self.is_compliant,
+            'document_type': self.document_type.value,
+            'issues': [
+                [issue.level.value, issue.field, issue.message, issue.line_number]
+                for issue in self.issues
+            ]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ValidationResult':
+        """Rebuild a result produced by to_dict."""
+        result = cls(data['file_path'], data['is_compliant'], DocumentType(data['document_type']))
+        result.issues = [
+            ValidationIssue(result.file_path, ValidationLevel(level), field_name, message, line_number)
+            for level, field_name, message, line_number in data['issues']
+        ]
+        return result
+    
+    @classmethod
+    def from_report_entry(cls, file_data: Dict[str, Any]) -> 'ValidationResult':
+        """Rebuild a result from one 'files' entry of a JSON report."""
+        result = cls(file_data['path'], file_data['compliant'], DocumentType(file_data['document_type']))
+        result.issues = [
+            ValidationIssue(result.file_path, ValidationLevel(issue['level']), issue['field'],
+                            issue['message'], issue.get('line_number'))
+            for issue in file_data['issues']
+        ]
+        return result
+
+class ValidationCache:
+    """Persistent on-disk cache of ValidationResults keyed on file content.
+    
+    Entries are stored per file path together with the SHA-256 of the file
+    content. The whole cache is discarded when the validator schema
+    fingerprint changes, so edits to the field tables invalidate it.
+    """
+    
+    CACHE_VERSION = 1
+    
+    def __init__(self, cache_path: str, schema_fingerprint: str):
+        self.cache_path = cache_path
+        self.schema_fingerprint = schema_fingerprint
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._pending_digests: Dict[str, str] = {}
+        self._load()
+    
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if (isinstance(data, dict) and data.get('version') == self.CACHE_VERSION
+                and data.get('schema') == self.schema_fingerprint):
+            self.entries = data.get('entries', {})
+    
+    @staticmethod
+    def _content_digest(file_path: str) -> Optional[str]:
+        try:
+            with open(file_path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+    
+    def lookup(self, file_path: str) -> Optional[ValidationResult]:
+        """Return the cached result for an unchanged file, or None."""
+        digest = self._content_digest(file_path)
+        entry = self.entries.get(file_path)
+        
+        if digest is not None and entry is not None and entry['sha256'] == digest:
+            self.hits += 1
+            return ValidationResult.from_dict(entry['result'])
+        
+        self.misses += 1
+        if digest is not None:
+            self._pending_digests[file_path] = digest
+        return None
+    
+    def store(self, result: ValidationResult):
+        """Record a fresh result for a file previously missed by lookup."""
+        digest = self._pending_digests.pop(result.file_path, None)
+        if digest is not None:
+            self.entries[result.file_path] = {'sha256': digest, 'result': result.to_dict()}
+    
+    def save(self):
+        """Write the cache to disk, dropping entries for deleted files."""
+        entries = {path: entry for path, entry in self.entries.items() if os.path.exists(path)}
+        data = {
+            'version': self.CACHE_VERSION,
+            'schema': self.schema_fingerprint,
+            'entries': entries
+        }
+        
+        cache_dir = os.path.dirname(self.cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        temp_path = f"{self.cache_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(temp_path, self.cache_path)
 
 class YAMLFrontmatterValidator:
     """Validates YAML front-matter in Markdown files according to Towne Park standards."""
@@ -221,8 +346,119 @@ class YAMLFrontmatterValidator:
         'validated', 'pending', 'uncertain', 'architect_validated', 'confirmed'
     }
     
-    def __init__(self):
+    # Section fields with format or enumerated-value rules
+    SPECIAL_DATE_FIELDS = ('discovered_date', 'last_validated', 'evaluated_date', 'verification_date')
+    
+    CONFIDENCE_SCORE_FIELDS = ('confidence_score', 'discovery_confidence', 'classification_confidence')
+    
+    ENUMERATED_FIELDS = {
+        'access_level': 'VALID_ACCESS_LEVELS',
+        'governance_level': 'VALID_GOVERNANCE_LEVELS',
+        'security_level': 'VALID_SECURITY_LEVELS',
+        'business_value': 'VALID_BUSINESS_VALUES',
+        'technical_complexity': 'VALID_COMPLEXITY_LEVELS',
+        'implementation_priority': 'VALID_PRIORITY_LEVELS',
+        'validation_status': 'VALID_VALIDATION_STATUSES'
+    }
+    
+    # Longest front-matter block scanned before giving up on a closing ---
+    MAX_HEADER_LINES = DEFAULT_MAX_HEADER_LINES
+    
+    def __init__(self, cache: Optional[ValidationCache] = None):
         self.results: List[ValidationResult] = []
+        self.cache = cache
+        self._compile_schema()
+    
+    def _compile_schema(self):
+        """Compile the field tables into per-field checker closures.
+        
+        Message prefixes, sorted enumeration listings and bound format
+        validators are prepared once here, so validating a field costs one
+        dictionary lookup plus the check itself.
+        """
+        is_valid_date = self.validate_date_format
+        is_valid_version = self.validate_version_format
+        is_valid_confidence = self.validate_confidence_score
+        
+        def format_checker(is_valid, message_prefix, quote="'"):
+            def check(value, field_path, result):
+                if not is_valid(value):
+                    result.add_issue(ValidationLevel.ERROR, field_path, f"{message_prefix}{quote}{value}{quote}")
+            return check
+        
+        def enum_checker(field_name, valid_values):
+            message_prefix = f"Field '{field_name}' has non-standard value '"
+            message_suffix = f"'. Valid values: {sorted(valid_values)}"
+            def check(value, field_path, result):
+                if value not in valid_values:
+                    result.add_issue(ValidationLevel.WARNING, field_path, f"{message_prefix}{value}{message_suffix}")
+            return check
+        
+        # Checkers for fields inside advanced sections
+        field_checkers = {}
+        for field_name in self.SPECIAL_DATE_FIELDS:
+            field_checkers[field_name] = format_checker(
+                is_valid_date, f"Date field '{field_name}' must be in YYYY-MM-DD format, got ")
+        for field_name in self.CONFIDENCE_SCORE_FIELDS:
+            field_checkers[field_name] = format_checker(
+                is_valid_confidence, f"Confidence score '{field_name}' must be between 0.0 and 1.0, got ", quote='')
+        for field_name, values_attribute in self.ENUMERATED_FIELDS.items():
+            field_checkers[field_name] = enum_checker(field_name, frozenset(getattr(self, values_attribute)))
+        self._field_checkers = field_checkers
+        
+        # Core fields: (field, expected type, type error prefix, checker)
+        core_checkers = {
+            'created_date': format_checker(is_valid_date, "Field 'created_date' must be in YYYY-MM-DD format, got "),
+            'last_updated_date': format_checker(is_valid_date, "Field 'last_updated_date' must be in YYYY-MM-DD format, got "),
+            'version': format_checker(is_valid_version, "Field 'version' must be in X.Y or X.Y.Z format, got "),
+            'status': enum_checker('status', frozenset(self.VALID_STATUS_VALUES))
+        }
+        self._core_rules = [
+            (field_name, expected_type, f"Field '{field_name}' should be of type {expected_type.__name__}, got ",
+             core_checkers.get(field_name))
+            for field_name, expected_type in self.CORE_REQUIRED_FIELDS.items()
+        ]
+        
+        # Section fields: section name -> [(field, expected type, field path,
+        # missing message, type error prefix, checker)]
+        self._section_rules = {}
+        for section_name, section_config in self.ADVANCED_SECTIONS.items():
+            if isinstance(section_config, dict) and 'required_fields' in section_config:
+                self._section_rules[section_name] = [
+                    (field_name, expected_type, f"{section_name}.{field_name}",
+                     f"Required field '{field_name}' is missing from section '{section_name}'",
+                     f"Field '{field_name}' in section '{section_name}' should be of type {expected_type}, got ",
+                     field_checkers.get(field_name))
+                    for field_name, expected_type in section_config['required_fields'].items()
+                ]
+    
+    @classmethod
+    def schema_fingerprint(cls) -> str:
+        """Fingerprint of the schema tables and validator code, used to invalidate caches."""
+        schema = {
+            name: getattr(cls, name)
+            for name in dir(cls)
+            if name in ('CORE_REQUIRED_FIELDS', 'CORE_OPTIONAL_FIELDS', 'ADVANCED_SECTIONS')
+            or name.startswith('VALID_')
+        }
+        
+        def encode(value: Any) -> Any:
+            if isinstance(value, type):
+                return value.__name__
+            if isinstance(value, (set, frozenset)):
+                return sorted(value)
+            if isinstance(value, tuple):
+                return [encode(item) for item in value]
+            raise TypeError(f"Cannot fingerprint {value!r}")
+        
+        digest = hashlib.sha256(json.dumps(schema, default=encode, sort_keys=True).encode('utf-8'))
+        digest.update(cls.__qualname__.encode('utf-8'))
+        # Parse error messages differ between the libyaml and pure-Python loaders
+        digest.update(yaml_loader.YAML_BACKEND.encode('utf-8'))
+        # Any change to the validation logic itself also invalidates cached results
+        with open(__file__, 'rb') as f:
+            digest.update(f.read())
+        return digest.hexdigest()
         
     def detect_document_type(self, frontmatter: Dict[str, Any], file_path: str) -> DocumentType:
         """Detect document type based on file path and content."""
@@ -254,8 +490,7 @@ class YAMLFrontmatterValidator:
         if not isinstance(date_str, str):
             return False
         
-        date_pattern = r'^\d{4}-\d{2}-\d{2}$'
-        if not re.match(date_pattern, date_str):
+        if not DATE_PATTERN.match(date_str):
             return False
         
         try:
@@ -269,8 +504,7 @@ class YAMLFrontmatterValidator:
         if not isinstance(version_str, str):
             return False
         
-        version_pattern = r'^\d+\.\d+(\.\d+)?$'
-        return bool(re.match(version_pattern, version_str))
+        return bool(VERSION_PATTERN.match(version_str))
     
     def validate_confidence_score(self, score: Any) -> bool:
         """Validate confidence score (0.0 to 1.0)."""
@@ -290,61 +524,44 @@ class YAMLFrontmatterValidator:
     
     def extract_frontmatter(self, content: str) -> Tuple[Optional[Dict[str, Any]], List[str]]:
         """Extract YAML frontmatter from markdown content."""
-        lines = content.split('\n')
-        
-        if not lines or lines[0].strip() != '---':
+        yaml_lines, problem = split_frontmatter(content.split('\n'), self.MAX_HEADER_LINES)
+        return self.parse_frontmatter_lines(yaml_lines, problem)
+    
+    def parse_frontmatter_lines(self, yaml_lines: Optional[List[str]],
+                                problem: Optional[str]) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """Parse front-matter lines produced by the shared extractor."""
+        if problem == MISSING_OPENING:
             return None, ["No YAML frontmatter found (missing opening ---)"]
-        
-        yaml_lines = []
-        end_found = False
-        
-        for i, line in enumerate(lines[1:], 2):
-            if line.strip() == '---':
-                end_found = True
-                break
-            yaml_lines.append(line)
-        
-        if not end_found:
+        if problem == MISSING_CLOSING:
             return None, ["No YAML frontmatter found (missing closing ---)"]
+        if problem == HEADER_TOO_LONG:
+            return None, [f"No YAML frontmatter found (no closing --- within the first {self.MAX_HEADER_LINES} lines)"]
         
         yaml_content = '\n'.join(yaml_lines)
         
         try:
-            frontmatter = yaml.safe_load(yaml_content)
+            frontmatter = yaml_loader.safe_load(yaml_content)
             if not isinstance(frontmatter, dict):
                 return None, ["YAML frontmatter is not a dictionary"]
             return frontmatter, []
-        except yaml.YAMLError as e:
+        except yaml_loader.YAMLError as e:
             return None, [f"YAML parsing error: {str(e)}"]
     
     def validate_core_fields(self, frontmatter: Dict[str, Any], result: ValidationResult):
         """Validate core required fields."""
-        for field, expected_type in self.CORE_REQUIRED_FIELDS.items():
-            if field not in frontmatter:
-                result.add_issue(ValidationLevel.ERROR, field, f"Required field '{field}' is missing")
+        for field_name, expected_type, type_message, check in self._core_rules:
+            if field_name not in frontmatter:
+                result.add_issue(ValidationLevel.ERROR, field_name, f"Required field '{field_name}' is missing")
                 continue
             
-            value = frontmatter[field]
-            if not self.validate_field_type(value, expected_type):
-                result.add_issue(ValidationLevel.ERROR, field, 
-                               f"Field '{field}' should be of type {expected_type.__name__}, got {type(value).__name__}")
+            value = frontmatter[field_name]
+            if not isinstance(value, expected_type):
+                result.add_issue(ValidationLevel.ERROR, field_name, f"{type_message}{type(value).__name__}")
                 continue
             
             # Specific validations
-            if field in ['created_date', 'last_updated_date']:
-                if not self.validate_date_format(value):
-                    result.add_issue(ValidationLevel.ERROR, field, 
-                                   f"Field '{field}' must be in YYYY-MM-DD format, got '{value}'")
-            
-            elif field == 'version':
-                if not self.validate_version_format(value):
-                    result.add_issue(ValidationLevel.ERROR, field, 
-                                   f"Field '{field}' must be in X.Y or X.Y.Z format, got '{value}'")
-            
-            elif field == 'status':
-                if not self.validate_enumerated_field(value, self.VALID_STATUS_VALUES):
-                    result.add_issue(ValidationLevel.WARNING, field, 
-                                   f"Field '{field}' has non-standard value '{value}'. Valid values: {sorted(self.VALID_STATUS_VALUES)}")
+            if check is not None:
+                check(value, field_name, result)
     
     def validate_advanced_sections(self, frontmatter: Dict[str, Any], result: ValidationResult):
         """Validate advanced metadata sections."""
@@ -379,70 +596,37 @@ class YAMLFrontmatterValidator:
                            f"Section '{section_name}' should be a dictionary, got {type(section_data).__name__}")
             return
         
+        rules = self._section_rules.get(section_name)
+        if rules is None:
+            # Section not in ADVANCED_SECTIONS; compile its rules on the fly
+            rules = [
+                (field_name, expected_type, f"{section_name}.{field_name}",
+                 f"Required field '{field_name}' is missing from section '{section_name}'",
+                 f"Field '{field_name}' in section '{section_name}' should be of type {expected_type}, got ",
+                 self._field_checkers.get(field_name))
+                for field_name, expected_type in section_config.get('required_fields', {}).items()
+            ]
+        
         # Check required fields
-        for field, expected_type in section_config.get('required_fields', {}).items():
-            if field not in section_data:
-                result.add_issue(ValidationLevel.ERROR, f"{section_name}.{field}", 
-                               f"Required field '{field}' is missing from section '{section_name}'")
+        for field_name, expected_type, field_path, missing_message, type_message, check in rules:
+            if field_name not in section_data:
+                result.add_issue(ValidationLevel.ERROR, field_path, missing_message)
                 continue
             
-            value = section_data[field]
-            if not self.validate_field_type(value, expected_type):
-                result.add_issue(ValidationLevel.ERROR, f"{section_name}.{field}", 
-                               f"Field '{field}' in section '{section_name}' should be of type {expected_type}, got {type(value).__name__}")
+            value = section_data[field_name]
+            if not isinstance(value, expected_type):
+                result.add_issue(ValidationLevel.ERROR, field_path, f"{type_message}{type(value).__name__}")
                 continue
             
             # Specific validations for certain fields
-            self.validate_special_fields(value, field, section_name, result)
+            if check is not None:
+                check(value, field_path, result)
     
     def validate_special_fields(self, value: Any, field: str, section_name: str, result: ValidationResult):
         """Validate special fields with specific requirements."""
-        field_path = f"{section_name}.{field}" if section_name else field
-        
-        if field in ['discovered_date', 'last_validated', 'evaluated_date', 'verification_date']:
-            if not self.validate_date_format(value):
-                result.add_issue(ValidationLevel.ERROR, field_path, 
-                               f"Date field '{field}' must be in YYYY-MM-DD format, got '{value}'")
-        
-        elif field in ['confidence_score', 'discovery_confidence', 'classification_confidence']:
-            if not self.validate_confidence_score(value):
-                result.add_issue(ValidationLevel.ERROR, field_path, 
-                               f"Confidence score '{field}' must be between 0.0 and 1.0, got {value}")
-        
-        elif field == 'access_level':
-            if not self.validate_enumerated_field(value, self.VALID_ACCESS_LEVELS):
-                result.add_issue(ValidationLevel.WARNING, field_path, 
-                               f"Field '{field}' has non-standard value '{value}'. Valid values: {sorted(self.VALID_ACCESS_LEVELS)}")
-        
-        elif field == 'governance_level':
-            if not self.validate_enumerated_field(value, self.VALID_GOVERNANCE_LEVELS):
-                result.add_issue(ValidationLevel.WARNING, field_path, 
-                               f"Field '{field}' has non-standard value '{value}'. Valid values: {sorted(self.VALID_GOVERNANCE_LEVELS)}")
-        
-        elif field == 'security_level':
-            if not self.validate_enumerated_field(value, self.VALID_SECURITY_LEVELS):
-                result.add_issue(ValidationLevel.WARNING, field_path, 
-                               f"Field '{field}' has non-standard value '{value}'. Valid values: {sorted(self.VALID_SECURITY_LEVELS)}")
-        
-        elif field == 'business_value':
-            if not self.validate_enumerated_field(value, self.VALID_BUSINESS_VALUES):
-                result.add_issue(ValidationLevel.WARNING, field_path, 
-                               f"Field '{field}' has non-standard value '{value}'. Valid values: {sorted(self.VALID_BUSINESS_VALUES)}")
-        
-        elif field == 'technical_complexity':
-            if not self.validate_enumerated_field(value, self.VALID_COMPLEXITY_LEVELS):
-                result.add_issue(ValidationLevel.WARNING, field_path, 
-                               f"Field '{field}' has non-standard value '{value}'. Valid values: {sorted(self.VALID_COMPLEXITY_LEVELS)}")
-        
-        elif field == 'implementation_priority':
-            if not self.validate_enumerated_field(value, self.VALID_PRIORITY_LEVELS):
-                result.add_issue(ValidationLevel.WARNING, field_path, 
-                               f"Field '{field}' has non-standard value '{value}'. Valid values: {sorted(self.VALID_PRIORITY_LEVELS)}")
-        
-        elif field == 'validation_status':
-            if not self.validate_enumerated_field(value, self.VALID_VALIDATION_STATUSES):
-                result.add_issue(ValidationLevel.WARNING, field_path, 
-                               f"Field '{field}' has non-standard value '{value}'. Valid values: {sorted(self.VALID_VALIDATION_STATUSES)}")
+        check = self._field_checkers.get(field)
+        if check is not None:
+            check(value, f"{section_name}.{field}" if section_name else field, result)
     
     def validate_typed_section(self, section_data: Any, section_config: Dict, section_name: str, result: ValidationResult):
         """Validate sections with specific type requirements."""
@@ -497,15 +681,20 @@ class YAMLFrontmatterValidator:
     
     def validate_file(self, file_path: str) -> ValidationResult:
         """Validate a single Markdown file."""
+        # Only the front-matter block is read; the document body is never loaded
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            yaml_lines, problem = read_frontmatter_lines(file_path, self.MAX_HEADER_LINES)
         except Exception as e:
             result = ValidationResult(file_path, False, DocumentType.GENERAL)
             result.add_issue(ValidationLevel.ERROR, 'file', f"Error reading file: {str(e)}")
             return result
         
-        frontmatter, errors = self.extract_frontmatter(content)
+        return self.validate_header(file_path, yaml_lines, problem)
+    
+    def validate_header(self, file_path: str, yaml_lines: Optional[List[str]],
+                        problem: Optional[str]) -> ValidationResult:
+        """Validate front-matter lines already extracted from a file."""
+        frontmatter, errors = self.parse_frontmatter_lines(yaml_lines, problem)
         
         if frontmatter is None:
             result = ValidationResult(file_path, False, DocumentType.GENERAL)
@@ -530,187 +719,383 @@ class YAMLFrontmatterValidator:
         
         return result
     
-    def validate_directory(self, directory_path: str) -> List[ValidationResult]:
-        """Validate all Markdown files in a directory."""
-        results = []
+    def find_markdown_files(self, directory_path: str) -> List[str]:
+        """Find all Markdown files in a directory, in os.walk order."""
+        file_paths = []
         
         for root, dirs, files in os.walk(directory_path):
             for file in files:
                 if file.endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    result = self.validate_file(file_path)
-                    results.append(result)
+                    file_paths.append(os.path.join(root, file))
+        
+        return file_paths
+    
+    def iter_validate_files(self, file_paths: List[str], jobs: int = 1) -> Iterator[ValidationResult]:
+        """Validate files, yielding results in the same order as file_paths.
+        
+        With jobs > 1 the files are spread across a process pool; results are
+        still yielded in input order so reports match a serial run exactly.
+        When a cache is attached, unchanged files are served from it and only
+        the remaining files are validated.
+        """
+        if self.cache is None:
+            yield from self._validate_uncached(file_paths, jobs)
+            return
+        
+        cached = {}
+        pending = []
+        for file_path in file_paths:
+            result = self.cache.lookup(file_path)
+            if result is None:
+                pending.append(file_path)
+            else:
+                cached[file_path] = result
+        
+        fresh_results = self._validate_uncached(pending, jobs)
+        for file_path in file_paths:
+            if file_path in cached:
+                yield cached[file_path]
+            else:
+                result = next(fresh_results)
+                self.cache.store(result)
+                yield result
+    
+    def _validate_uncached(self, file_paths: List[str], jobs: int) -> Iterator[ValidationResult]:
+        """Validate files serially or in a process pool, preserving order."""
+        if jobs <= 1 or len(file_paths) < 2:
+            for file_path in file_paths:
+                yield self.validate_file(file_path)
+            return
+        
+        workers = min(jobs, len(file_paths))
+        # A few chunks per worker keeps the pool balanced without paying
+        # pickling overhead for every single file
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(type(self),)) as executor:
+            yield from executor.map(_validate_file_in_worker, file_paths, chunksize=chunksize)
+    
+    def validate_directory(self, directory_path: str, jobs: int = 1) -> List[ValidationResult]:
+        """Validate all Markdown files in a directory."""
+        return self.validate_files(self.find_markdown_files(directory_path), jobs)
+    
+    def validate_files(self, file_paths: List[str], jobs: int = 1) -> List[ValidationResult]:
+        """Validate an explicit list of Markdown files."""
+        results = list(self.iter_validate_files(file_paths, jobs))
         
         self.results = results
         return results
     
     def _get_display_path(self, file_path: str) -> str:
         """Get a shortened display path for better readability."""
-        # Convert to forward slashes for consistency
-        normalized_path = file_path.replace('\\', '/')
-        
-        # If path is too long, show relative path from docs/
-        if len(normalized_path) > 80:
-            if 'docs/' in normalized_path:
-                # Show path relative to docs/
-                parts = normalized_path.split('docs/')
-                if len(parts) > 1:
-                    return f"docs/{parts[-1]}"
-            
-            # If still too long, truncate with ellipsis
-            if len(normalized_path) > 80:
-                return f"...{normalized_path[-77:]}"
-        
-        return normalized_path
+        return display_path(file_path)
+    
+    def report_writer(self, output_format: str, out: TextIO) -> 'FrontmatterReportWriter':
+        """Create a streaming writer for a report in the specified format."""
+        return REPORT_WRITERS.get(output_format, TextReportWriter)(out)
     
     def generate_report(self, output_format: str = 'text') -> str:
         """Generate validation report in specified format."""
-        if output_format == 'json':
-            return self.generate_json_report()
-        elif output_format == 'csv':
-            return self.generate_csv_report()
-        else:
-            return self.generate_text_report()
+        return render_report(lambda out: self.report_writer(output_format, out), self.results)
     
     def generate_text_report(self) -> str:
         """Generate human-readable text report."""
-        report = []
-        report.append("=" * 100)
-        report.append("YAML FRONT-MATTER VALIDATION REPORT")
-        report.append("=" * 100)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
-        
-        # Summary statistics
-        total_files = len(self.results)
-        compliant_files = sum(1 for r in self.results if r.is_compliant)
-        non_compliant_files = total_files - compliant_files
-        
-        total_errors = sum(len([i for i in r.issues if i.level == ValidationLevel.ERROR]) for r in self.results)
-        total_warnings = sum(len([i for i in r.issues if i.level == ValidationLevel.WARNING]) for r in self.results)
-        total_info = sum(len([i for i in r.issues if i.level == ValidationLevel.INFO]) for r in self.results)
-        
-        report.append("SUMMARY")
-        report.append("-" * 50)
-        report.append(f"Total files processed: {total_files}")
-        report.append(f"Compliant files: {compliant_files}")
-        report.append(f"Non-compliant files: {non_compliant_files}")
-        report.append(f"Compliance rate: {(compliant_files/total_files*100):.1f}%" if total_files > 0 else "Compliance rate: N/A")
-        report.append("")
-        report.append(f"Total errors: {total_errors}")
-        report.append(f"Total warnings: {total_warnings}")
-        report.append(f"Total info messages: {total_info}")
-        report.append("")
-        
-        # Compliant files
-        if compliant_files > 0:
-            report.append("COMPLIANT FILES")
-            report.append("-" * 50)
-            for result in self.results:
-                if result.is_compliant:
-                    # Use shorter file path for display
-                    display_path = self._get_display_path(result.file_path)
-                    report.append(f"✅ {display_path}")
-                    report.append(f"   Type: {result.document_type.value}")
-                    if result.issues:
-                        for issue in result.issues:
-                            if issue.level != ValidationLevel.ERROR:
-                                report.append(f"   {issue.level.value}: {issue.field} - {issue.message}")
-                    report.append("")
-        
-        # Non-compliant files
-        if non_compliant_files > 0:
-            report.append("NON-COMPLIANT FILES")
-            report.append("-" * 50)
-            for result in self.results:
-                if not result.is_compliant:
-                    # Use shorter file path for display
-                    display_path = self._get_display_path(result.file_path)
-                    report.append(f"❌ {display_path}")
-                    report.append(f"   Type: {result.document_type.value}")
-                    for issue in result.issues:
-                        icon = "🔴" if issue.level == ValidationLevel.ERROR else "🟡" if issue.level == ValidationLevel.WARNING else "ℹ️"
-                        report.append(f"   {icon} {issue.level.value}: {issue.field}")
-                        report.append(f"      {issue.message}")
-                    report.append("")
-        
-        # Document type breakdown
-        doc_type_counts = {}
-        for result in self.results:
-            doc_type = result.document_type.value
-            if doc_type not in doc_type_counts:
-                doc_type_counts[doc_type] = {'total': 0, 'compliant': 0}
-            doc_type_counts[doc_type]['total'] += 1
-            if result.is_compliant:
-                doc_type_counts[doc_type]['compliant'] += 1
-        
-        report.append("DOCUMENT TYPE BREAKDOWN")
-        report.append("-" * 40)
-        for doc_type, counts in sorted(doc_type_counts.items()):
-            compliance_rate = (counts['compliant'] / counts['total'] * 100) if counts['total'] > 0 else 0
-            report.append(f"{doc_type}: {counts['compliant']}/{counts['total']} ({compliance_rate:.1f}%)")
-        
-        return "\n".join(report)
+        return render_report(TextReportWriter, self.results)
     
     def generate_json_report(self) -> str:
         """Generate JSON report."""
-        report_data = {
-            'generated': datetime.now().isoformat(),
-            'summary': {
-                'total_files': len(self.results),
-                'compliant_files': sum(1 for r in self.results if r.is_compliant),
-                'non_compliant_files': sum(1 for r in self.results if not r.is_compliant),
-                'total_errors': sum(len([i for i in r.issues if i.level == ValidationLevel.ERROR]) for r in self.results),
-                'total_warnings': sum(len([i for i in r.issues if i.level == ValidationLevel.WARNING]) for r in self.results),
-                'total_info': sum(len([i for i in r.issues if i.level == ValidationLevel.INFO]) for r in self.results)
-            },
-            'files': []
-        }
-        
-        for result in self.results:
-            file_data = {
-                'path': result.file_path,
-                'compliant': result.is_compliant,
-                'document_type': result.document_type.value,
-                'issues': [
-                    {
-                        'level': issue.level.value,
-                        'field': issue.field,
-                        'message': issue.message,
-                        'line_number': issue.line_number
-                    }
-                    for issue in result.issues
-                ]
-            }
-            report_data['files'].append(file_data)
-        
-        return json.dumps(report_data, indent=2)
+        return render_report(JsonReportWriter, self.results)
     
     def generate_csv_report(self) -> str:
         """Generate CSV report."""
-        import io
-        output = io.StringIO()
-        writer = csv.writer(output)
+        return render_report(CsvReportWriter, self.results)
+
+def display_path(file_path: str) -> str:
+    """Shorten a file path for display in the text report."""
+    # Convert to forward slashes for consistency
+    normalized_path = file_path.replace('\\', '/')
+    
+    # If path is too long, show relative path from docs/
+    if len(normalized_path) > 80:
+        if 'docs/' in normalized_path:
+            # Show path relative to docs/
+            parts = normalized_path.split('docs/')
+            if len(parts) > 1:
+                return f"docs/{parts[-1]}"
         
-        # Header
-        writer.writerow(['File Path', 'Compliant', 'Document Type', 'Issue Level', 'Field', 'Message', 'Line Number'])
+        # If still too long, truncate with ellipsis
+        if len(normalized_path) > 80:
+            return f"...{normalized_path[-77:]}"
+    
+    return normalized_path
+
+class FrontmatterReportWriter(ReportWriter):
+    """Base class for front-matter report writers; keeps the summary counters."""
+    
+    def __init__(self, out: TextIO):
+        super().__init__(out)
+        self.total_files = 0
+        self.compliant_files = 0
+        self.level_counts = {level: 0 for level in ValidationLevel}
+        self.doc_type_counts: Dict[str, Dict[str, int]] = {}
+    
+    @property
+    def non_compliant_files(self) -> int:
+        return self.total_files - self.compliant_files
+    
+    def add(self, result: ValidationResult):
+        self.total_files += 1
+        if result.is_compliant:
+            self.compliant_files += 1
+        for issue in result.issues:
+            self.level_counts[issue.level] += 1
         
-        for result in self.results:
-            if not result.issues:
-                writer.writerow([result.file_path, result.is_compliant, result.document_type.value, '', '', '', ''])
-            else:
-                for issue in result.issues:
-                    writer.writerow([
-                        result.file_path,
-                        result.is_compliant,
-                        result.document_type.value,
-                        issue.level.value,
-                        issue.field,
-                        issue.message,
-                        issue.line_number or ''
-                    ])
-        
-        return output.getvalue()
+        counts = self.doc_type_counts.setdefault(result.document_type.value, {'total': 0, 'compliant': 0})
+        counts['total'] += 1
+        if result.is_compliant:
+            counts['compliant'] += 1
+        
+        self.write_result(result)
+    
+    def write_result(self, result: ValidationResult):
+        raise NotImplementedError
+    
+    def finish(self):
+        pass
+
+class TextReportWriter(FrontmatterReportWriter):
+    """Human-readable text report; file sections are spooled until the summary is known."""
+    
+    def __init__(self, out: TextIO):
+        super().__init__(out)
+        self.compliant_section = self.spool()
+        self.non_compliant_section = self.spool()
+    
+    def write_result(self, result: ValidationResult):
+        if result.is_compliant:
+            self.compliant_section.extend([
+                f"✅ {display_path(result.file_path)}",
+                f"   Type: {result.document_type.value}"
+            ])
+            for issue in result.issues:
+                if issue.level != ValidationLevel.ERROR:
+                    self.compliant_section.append(f"   {issue.level.value}: {issue.field} - {issue.message}")
+            self.compliant_section.append("")
+        else:
+            self.non_compliant_section.extend([
+                f"❌ {display_path(result.file_path)}",
+                f"   Type: {result.document_type.value}"
+            ])
+            for issue in result.issues:
+                icon = "🔴" if issue.level == ValidationLevel.ERROR else "🟡" if issue.level == ValidationLevel.WARNING else "ℹ️"
+                self.non_compliant_section.extend([
+                    f"   {icon} {issue.level.value}: {issue.field}",
+                    f"      {issue.message}"
+                ])
+            self.non_compliant_section.append("")
+    
+    def finish(self):
+        total_files = self.total_files
+        compliant_files = self.compliant_files
+        self.out.write("\n".join([
+            "=" * 100,
+            "YAML FRONT-MATTER VALIDATION REPORT",
+            "=" * 100,
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+            "SUMMARY",
+            "-" * 50,
+            f"Total files processed: {total_files}",
+            f"Compliant files: {compliant_files}",
+            f"Non-compliant files: {self.non_compliant_files}",
+            f"Compliance rate: {(compliant_files/total_files*100):.1f}%" if total_files > 0 else "Compliance rate: N/A",
+            "",
+            f"Total errors: {self.level_counts[ValidationLevel.ERROR]}",
+            f"Total warnings: {self.level_counts[ValidationLevel.WARNING]}",
+            f"Total info messages: {self.level_counts[ValidationLevel.INFO]}",
+            f"YAML parser backend: {yaml_loader.YAML_BACKEND}",
+            ""
+        ]))
+        
+        if compliant_files > 0:
+            self.write_lines(["COMPLIANT FILES", "-" * 50])
+            self.compliant_section.copy_to(self.out)
+        
+        if self.non_compliant_files > 0:
+            self.write_lines(["NON-COMPLIANT FILES", "-" * 50])
+            self.non_compliant_section.copy_to(self.out)
+        
+        self.write_lines(["DOCUMENT TYPE BREAKDOWN", "-" * 40])
+        for doc_type, counts in sorted(self.doc_type_counts.items()):
+            compliance_rate = (counts['compliant'] / counts['total'] * 100) if counts['total'] > 0 else 0
+            self.write_lines([f"{doc_type}: {counts['compliant']}/{counts['total']} ({compliance_rate:.1f}%)"])
+
+class JsonReportWriter(FrontmatterReportWriter):
+    """JSON report; file entries are spooled because the summary comes first."""
+    
+    def __init__(self, out: TextIO):
+        super().__init__(out)
+        self.files_section = self.spool()
+    
+    def write_result(self, result: ValidationResult):
+        file_data = {
+            'path': result.file_path,
+            'compliant': result.is_compliant,
+            'document_type': result.document_type.value,
+            'issues': [
+                {
+                    'level': issue.level.value,
+                    'field': issue.field,
+                    'message': issue.message,
+                    'line_number': issue.line_number
+                }
+                for issue in result.issues
+            ]
+        }
+        separator = "\n    " if self.files_section.empty else ",\n    "
+        self.files_section.write(separator + indented_json(file_data, 2))
+    
+    def finish(self):
+        summary = {
+            'total_files': self.total_files,
+            'compliant_files': self.compliant_files,
+            'non_compliant_files': self.non_compliant_files,
+            'total_errors': self.level_counts[ValidationLevel.ERROR],
+            'total_warnings': self.level_counts[ValidationLevel.WARNING],
+            'total_info': self.level_counts[ValidationLevel.INFO],
+            'yaml_backend': yaml_loader.YAML_BACKEND
+        }
+        self.out.write('{\n  "generated": ' + json.dumps(datetime.now().isoformat())
+                       + ',\n  "summary": ' + indented_json(summary, 1) + ',\n  "files": ')
+        if self.files_section.empty:
+            self.out.write('[]')
+        else:
+            self.out.write('[')
+            self.files_section.copy_to(self.out)
+            self.out.write('\n  ]')
+        self.out.write('\n}')
+
+class CsvReportWriter(FrontmatterReportWriter):
+    """CSV report; rows are written as soon as each result arrives."""
+    
+    def __init__(self, out: TextIO):
+        super().__init__(out)
+        self.csv_writer = csv.writer(out)
+        self.csv_writer.writerow(['File Path', 'Compliant', 'Document Type', 'Issue Level', 'Field', 'Message', 'Line Number'])
+    
+    def write_result(self, result: ValidationResult):
+        if not result.issues:
+            self.csv_writer.writerow([result.file_path, result.is_compliant, result.document_type.value, '', '', '', ''])
+        else:
+            for issue in result.issues:
+                self.csv_writer.writerow([
+                    result.file_path,
+                    result.is_compliant,
+                    result.document_type.value,
+                    issue.level.value,
+                    issue.field,
+                    issue.message,
+                    issue.line_number or ''
+                ])
+
+REPORT_WRITERS = {
+    'text': TextReportWriter,
+    'json': JsonReportWriter,
+    'csv': CsvReportWriter
+}
+
+# Validator instance owned by each worker process in --jobs mode
+_worker_validator: Optional[YAMLFrontmatterValidator] = None
+
+def _init_worker(validator_class: type):
+    """Create the per-process validator used by _validate_file_in_worker."""
+    global _worker_validator
+    _worker_validator = validator_class()
+
+def _validate_file_in_worker(file_path: str) -> ValidationResult:
+    """Validate a single file inside a worker process."""
+    return _worker_validator.validate_file(file_path)
+
+def _is_within(file_path: str, directory_path: str) -> bool:
+    file_path = os.path.abspath(file_path)
+    directory_path = os.path.abspath(directory_path)
+    return os.path.commonpath([file_path, directory_path]) == directory_path
+
+def _scan_path(file_path: str, directory_path: str) -> str:
+    """Spell a path under directory_path the way a directory scan would."""
+    return os.path.join(directory_path, os.path.relpath(file_path, directory_path))
+
+def _run_git(args: List[str]) -> str:
+    proc = subprocess.run(['git'] + args, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip() or f"git {' '.join(args)} failed")
+    return proc.stdout
+
+def git_changed_markdown_files(ref: str, directory_path: str) -> Tuple[List[str], Set[str]]:
+    """List Markdown files under directory_path changed since a git ref.
+    
+    Compares the working tree against the merge base of ref and HEAD, so
+    only changes made on the current branch are reported. Returns the added,
+    modified and renamed files that still exist, and the normalized paths of
+    deleted files and rename sources.
+    """
+    toplevel = _run_git(['rev-parse', '--show-toplevel']).strip()
+    try:
+        base = _run_git(['merge-base', ref, 'HEAD']).strip()
+    except RuntimeError:
+        base = ref
+    
+    output = _run_git(['diff', '--name-status', '-M', '--diff-filter=ACDMR', base, '--'])
+    
+    changed = []
+    removed = set()
+    for line in output.splitlines():
+        parts = line.split('\t')
+        if len(parts) < 2:
+            continue
+        status = parts[0][0]
+        old_path = os.path.relpath(os.path.join(toplevel, parts[1]))
+        new_path = os.path.relpath(os.path.join(toplevel, parts[-1]))
+        
+        if status in ('D', 'R') and old_path.endswith('.md'):
+            removed.add(os.path.normpath(old_path))
+        if status != 'D' and new_path.endswith('.md') and os.path.isfile(new_path):
+            if _is_within(new_path, directory_path):
+                changed.append(_scan_path(new_path, directory_path))
+    
+    return sorted(changed), removed
+
+def merge_with_baseline(baseline_path: str, directory_path: str, fresh_results: List[ValidationResult],
+                        removed: Set[str]) -> List[ValidationResult]:
+    """Combine fresh results for changed files with a stored JSON report.
+    
+    Baseline entries outside directory_path, for deleted or renamed files, or
+    for files that no longer exist are dropped. Changed files replace their
+    baseline entries in place, and new files are appended.
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    
+    fresh_by_path = {os.path.normpath(r.file_path): r for r in fresh_results}
+    merged = []
+    for file_data in baseline.get('files', []):
+        key = os.path.normpath(file_data['path'])
+        if key in removed or not _is_within(key, directory_path) or not os.path.exists(key):
+            continue
+        if key in fresh_by_path:
+            merged.append(fresh_by_path.pop(key))
+        else:
+            merged.append(ValidationResult.from_report_entry(file_data))
+    
+    merged.extend(r for r in fresh_results if os.path.normpath(r.file_path) in fresh_by_path)
+    return merged
+
+def resolve_job_count(jobs: int) -> int:
+    """Translate a --jobs value into a worker count (0 means one per CPU)."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
 
 def main():
     """Main entry point for the validation script."""
@@ -722,6 +1107,10 @@ Examples:
   python validate_yaml_frontmatter.py
   python validate_yaml_frontmatter.py --path docs/ --output json
   python validate_yaml_frontmatter.py --strict --quiet
+  python validate_yaml_frontmatter.py --path docs/ --jobs 0
+  python validate_yaml_frontmatter.py --cache-file .frontmatter-cache.json
+  python validate_yaml_frontmatter.py --changed-since origin/main --baseline validation-report.json
+  python validate_yaml_frontmatter.py --path docs/knowledge-corpus/ --watch
         """
     )
     
@@ -733,6 +1122,16 @@ Examples:
                        help='Enable strict mode (fail on warnings)')
     parser.add_argument('--quiet', action='store_true',
                        help='Suppress non-error output')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                       help='Validate files in N worker processes, 0 = one per CPU (default: 1)')
+    parser.add_argument('--cache-file', metavar='PATH',
+                       help='Reuse results for unchanged files from this cache file (created if missing)')
+    parser.add_argument('--changed-since', metavar='REF',
+                       help='Only validate Markdown files added, modified or renamed since this git ref')
+    parser.add_argument('--baseline', metavar='PATH',
+                       help='JSON report of a full run; with --changed-since, report totals for the whole path')
+    parser.add_argument('--watch', action='store_true',
+                       help='Keep running and revalidate Markdown files as they are saved')
     
     args = parser.parse_args()
     
@@ -741,26 +1140,74 @@ Examples:
         print(f"Error: Path '{args.path}' does not exist", file=sys.stderr)
         sys.exit(1)
     
+    if args.watch:
+        from corpus_watch import run_watch
+        sys.exit(run_watch(args.path, {'frontmatter'}))
+    
+    if args.baseline and not args.changed_since:
+        print("Error: --baseline requires --changed-since", file=sys.stderr)
+        sys.exit(1)
+    
     # Initialize validator
-    validator = YAMLFrontmatterValidator()
+    cache = None
+    if args.cache_file:
+        cache = ValidationCache(args.cache_file, YAMLFrontmatterValidator.schema_fingerprint())
+    validator = YAMLFrontmatterValidator(cache=cache)
     
     # Validate files
     if not args.quiet:
         print(f"Scanning for Markdown files in: {args.path}")
     
-    results = validator.validate_directory(args.path)
-    
-    if not args.quiet:
-        print(f"Processed {len(results)} files")
+    if args.changed_since:
+        try:
+            file_paths, removed_files = git_changed_markdown_files(args.changed_since, args.path)
+        except (OSError, RuntimeError) as e:
+            print(f"Error: Could not list changes since '{args.changed_since}': {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        file_paths = validator.find_markdown_files(args.path)
     
-    # Generate report
-    report = validator.generate_report(args.output)
-    print(report)
+    # The report is written while files are validated; with a baseline it
+    # can only start once every fresh result is known
+    processed = 0
+    level_counts = {level: 0 for level in ValidationLevel}
+    with validator.report_writer(args.output, sys.stdout) as writer:
+        results = validator.iter_validate_files(file_paths, jobs=resolve_job_count(args.jobs))
+        if args.baseline:
+            results = list(results)
+        
+        for result in results:
+            processed += 1
+            for issue in result.issues:
+                level_counts[issue.level] += 1
+            if not args.baseline:
+                writer.add(result)
+        
+        if cache is not None:
+            cache.save()
+        
+        if not args.quiet:
+            print(f"Processed {processed} files")
+            if args.changed_since:
+                print(f"Only files changed since {args.changed_since} were validated")
+            if cache is not None:
+                print(f"Cache: {cache.hits} unchanged, {cache.misses} revalidated")
+        
+        # Report corpus-wide totals; the exit code still only reflects changed files
+        if args.baseline:
+            try:
+                validator.results = merge_with_baseline(args.baseline, args.path, results, removed_files)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Error: Could not load baseline '{args.baseline}': {e}", file=sys.stderr)
+                sys.exit(1)
+            if not args.quiet:
+                print(f"Baseline: {len(validator.results) - len(results)} unchanged files from {args.baseline}")
+            writer.add_all(validator.results)
+    print()
     
     # Exit with appropriate code
-    non_compliant_count = sum(1 for r in results if not r.is_compliant)
-    error_count = sum(len([i for i in r.issues if i.level == ValidationLevel.ERROR]) for r in results)
-    warning_count = sum(len([i for i in r.issues if i.level == ValidationLevel.WARNING]) for r in results)
+    error_count = level_counts[ValidationLevel.ERROR]
+    warning_count = level_counts[ValidationLevel.WARNING]
     
     if error_count > 0:
         sys.exit(1)  # Errors found
@@ -12,23 +12,19 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from frontmatter_extractor import (
+    MISSING_OPENING, read_frontmatter_lines, split_frontmatter
+)
+
 def extract_frontmatter_simple(content):
     """Extract YAML frontmatter using simple parsing."""
-    lines = content.split('\n')
-    
-    if not lines or lines[0].strip() != '---':
+    return parse_frontmatter_simple(*split_frontmatter(content.split('\n')))
+
+def parse_frontmatter_simple(yaml_lines, problem):
+    """Parse front-matter lines produced by the shared extractor."""
+    if problem == MISSING_OPENING:
         return None, ["No YAML frontmatter found"]
-    
-    yaml_lines = []
-    end_found = False
-    
-    for i, line in enumerate(lines[1:], 2):
-        if line.strip() == '---':
-            end_found = True
-            break
-        yaml_lines.append(line)
-    
-    if not end_found:
+    if problem is not None:
         return None, ["No closing --- found"]
     
     # Simple YAML parsing for basic fields
@@ -82,8 +78,7 @@ def validate_version_format(version_str):
 def validate_file_simple(file_path):
     """Simple validation of a single file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        yaml_lines, problem = read_frontmatter_lines(file_path)
     except Exception as e:
         return {
             'file': file_path,
@@ -91,7 +86,11 @@ def validate_file_simple(file_path):
             'issues': [f"Error reading file: {str(e)}"]
         }
     
-    frontmatter, errors = extract_frontmatter_simple(content)
+    return validate_header_simple(file_path, yaml_lines, problem)
+
+def validate_header_simple(file_path, yaml_lines, problem):
+    """Simple validation of front-matter lines already extracted from a file."""
+    frontmatter, errors = parse_frontmatter_simple(yaml_lines, problem)
     
     if frontmatter is None:
         return {
@@ -156,47 +155,53 @@ def main():
                 result = validate_file_simple(file_path)
                 results.append(result)
     
-    # Generate report
-    print("=" * 80)
-    print("YAML FRONT-MATTER VALIDATION REPORT (SIMPLE)")
-    print("=" * 80)
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+    print(generate_report(results))
+
+def generate_report(results):
+    """Generate the plain-text report for simple validation results."""
+    report = []
+    report.append("=" * 80)
+    report.append("YAML FRONT-MATTER VALIDATION REPORT (SIMPLE)")
+    report.append("=" * 80)
+    report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append("")
     
     total_files = len(results)
     compliant_files = sum(1 for r in results if r['status'] == 'compliant')
     non_compliant_files = total_files - compliant_files
     
-    print("SUMMARY")
-    print("-" * 40)
-    print(f"Total files processed: {total_files}")
-    print(f"Compliant files: {compliant_files}")
-    print(f"Non-compliant files: {non_compliant_files}")
-    print(f"Compliance rate: {(compliant_files/total_files*100):.1f}%" if total_files > 0 else "Compliance rate: N/A")
-    print()
+    report.append("SUMMARY")
+    report.append("-" * 40)
+    report.append(f"Total files processed: {total_files}")
+    report.append(f"Compliant files: {compliant_files}")
+    report.append(f"Non-compliant files: {non_compliant_files}")
+    report.append(f"Compliance rate: {(compliant_files/total_files*100):.1f}%" if total_files > 0 else "Compliance rate: N/A")
+    report.append("")
     
     # Show compliant files
     if compliant_files > 0:
-        print("COMPLIANT FILES")
-        print("-" * 40)
+        report.append("COMPLIANT FILES")
+        report.append("-" * 40)
         for result in results:
             if result['status'] == 'compliant':
-                print(f"✅ {result['file']}")
+                report.append(f"✅ {result['file']}")
                 if result['issues']:
                     for issue in result['issues']:
-                        print(f"   ⚠️  {issue}")
-        print()
+                        report.append(f"   ⚠️  {issue}")
+        report.append("")
     
     # Show non-compliant files
     if non_compliant_files > 0:
-        print("NON-COMPLIANT FILES")
-        print("-" * 40)
+        report.append("NON-COMPLIANT FILES")
+        report.append("-" * 40)
         for result in results:
             if result['status'] != 'compliant':
-                print(f"❌ {result['file']}")
+                report.append(f"❌ {result['file']}")
                 for issue in result['issues']:
-                    print(f"   🔴 {issue}")
-                print()
+                    report.append(f"   🔴 {issue}")
+                report.append("")
+    
+    return "\n".join(report)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
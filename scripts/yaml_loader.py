@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Shared YAML Loader
+
+Loads YAML with PyYAML's libyaml-backed CSafeLoader when the C extension is
+available and falls back to the pure-Python SafeLoader otherwise. Both
+loaders accept the same documents and build the same data; only parse speed
+and the wording of error messages differ.
+
+Set TOWNE_PARK_YAML_BACKEND=python to force the pure-Python loader.
+"""
+
+import os
+
+import yaml
+
+YAMLError = yaml.YAMLError
+
+LIBYAML_BACKEND = 'libyaml'
+PURE_PYTHON_BACKEND = 'pure-python'
+
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    # PyYAML was built without libyaml
+    CSafeLoader = None
+
+if CSafeLoader is not None and os.environ.get('TOWNE_PARK_YAML_BACKEND', '').lower() != 'python':
+    SafeLoader = CSafeLoader
+    YAML_BACKEND = LIBYAML_BACKEND
+else:
+    SafeLoader = yaml.SafeLoader
+    YAML_BACKEND = PURE_PYTHON_BACKEND
+
+def safe_load(stream):
+    """Drop-in replacement for yaml.safe_load using the fastest available loader."""
+    return yaml.load(stream, Loader=SafeLoader)